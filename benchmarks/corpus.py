@@ -0,0 +1,390 @@
+import json
+import os
+import random
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Page corpus the benchmarks run against: a developer page, its "See All"
+# listing pages and one detail page per game, stored as HTML files next to a
+# manifest.json that maps each page's path (and query) to its file.
+#
+# A corpus is either recorded from the live App Store (record_corpus, needs
+# network once) or synthesized offline (synthesize_corpus). Synthetic pages
+# follow the markup of real App Store pages and have their size: the header,
+# navigation, inline data blob, screenshots, reviews, shelves of related apps
+# and footer a real page carries around the handful of fields we parse.
+
+DEFAULT_CORPUS_DIR = os.path.join(".cache", "benchmarks", "corpus")
+DEFAULT_GAMES = 300
+MANIFEST_FILE = "manifest.json"
+APP_STORE = "https://apps.apple.com"
+
+DEVELOPER_NAME = "Replay Games"
+DEVELOPER_URL = f"{APP_STORE}/us/developer/replay-games/id700000001"
+# Apps listed on the developer page itself; the rest sit behind "See All"
+DEVELOPER_PAGE_APPS = 12
+LISTING_PAGE_SIZE = 60
+FIRST_APP_ID = 1400000000
+
+_WORDS = (
+    "tap swipe jump run race merge build stack dodge collect unlock level boss world arena tower "
+    "puzzle hero squad challenge friends leaderboard reward chest skin power speed combo streak "
+    "island city space ocean castle jungle neon block ball snake knife bridge rope paint color "
+    "simple fun relaxing addictive satisfying endless casual offline daily events season pass"
+).split()
+_TITLES = (
+    "Helix", "Paper", "Stack", "Color", "Crowd", "Rope", "Knife", "Block", "Snake", "Tower",
+    "Merge", "Jelly", "Rocket", "Bridge", "Marble", "Pixel", "Candy", "Sky", "Neon", "Turbo",
+)
+_SUFFIXES = ("Jump", "Run", "Rush", "Hit", "Dash", "City", "Master", "Craft", "Blast", "Race", "Io 2", "Land")
+_GENRES = ("Games", "Action", "Arcade", "Puzzle", "Casual", "Racing", "Simulation", "Strategy", "Sports")
+_DESCRIPTORS = (
+    "Infrequent/Mild Cartoon or Fantasy Violence",
+    "Frequent/Intense Cartoon or Fantasy Violence",
+    "Infrequent/Mild Simulated Gambling",
+    "Infrequent/Mild Mature/Suggestive Themes",
+    "Infrequent/Mild Sexual Content and Nudity",
+    "Unrestricted Web Access",
+)
+_PRICES = ("$0.99", "$1.99", "$2.99", "$4.99", "$6.99")
+
+
+def page_key(url: str) -> str:
+    """Manifest key of a page: its path, plus the query string if any."""
+    parts = urlsplit(url)
+    return parts.path + (f"?{parts.query}" if parts.query else "")
+
+
+class Corpus:
+    """A corpus directory, as described by its manifest."""
+
+    def __init__(self, directory: str = DEFAULT_CORPUS_DIR):
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST_FILE), "r", encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+        self.source: str = manifest["source"]
+        self.developer_url: str = manifest["developer_url"]
+        self.game_urls: List[str] = manifest["game_urls"]
+        self.pages: Dict[str, str] = manifest["pages"]
+
+    def path(self, key: str) -> Optional[str]:
+        file_name = self.pages.get(key)
+        return os.path.join(self.directory, file_name) if file_name else None
+
+    def read(self, url: str) -> Optional[bytes]:
+        path = self.path(page_key(url))
+        if path is None:
+            return None
+        with open(path, "rb") as page:
+            return page.read()
+
+    def game_pages(self, limit: Optional[int] = None) -> Iterator[Tuple[str, bytes]]:
+        for url in self.game_urls[:limit]:
+            yield url, self.read(url)
+
+    def total_bytes(self) -> int:
+        return sum(os.path.getsize(os.path.join(self.directory, name)) for name in self.pages.values())
+
+
+class _CorpusWriter:
+    def __init__(self, directory: str, source: str, developer_url: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.manifest = {"source": source, "developer_url": developer_url, "game_urls": [], "pages": {}}
+
+    def add(self, url: str, body: bytes, name: str) -> None:
+        file_name = f"{name}.html"
+        with open(os.path.join(self.directory, file_name), "wb") as page:
+            page.write(body)
+        self.manifest["pages"][page_key(url)] = file_name
+
+    def close(self) -> Corpus:
+        with open(os.path.join(self.directory, MANIFEST_FILE), "w", encoding="utf-8") as manifest_file:
+            json.dump(self.manifest, manifest_file, indent=2)
+        return Corpus(self.directory)
+
+
+# --- Synthetic pages ---
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _paragraphs(rng: random.Random, count: int) -> List[str]:
+    return [" ".join(_sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(3, 6))) for _ in range(count)]
+
+
+def _artwork(rng: random.Random, width: int, height: int) -> str:
+    token = "".join(rng.choice("abcdef0123456789") for _ in range(32))
+    base = f"https://is{rng.randint(1, 5)}-ssl.mzstatic.com/image/thumb/Purple116/v4/{token[:2]}/{token[2:4]}/{token}/AppIcon.png"
+    sources = ", ".join(f"{base}/{width * scale}x{height * scale}bb.{fmt} {scale}x" for fmt in ("webp", "jpg") for scale in (1, 2, 3))
+    return (
+        f'<picture class="we-artwork we-artwork--fullscreen-enabled" style="--lazy-color: #{token[:6]};">'
+        f'<source srcset="{sources}" type="image/webp">'
+        f'<img src="{base}/{width}x{height}bb.jpg" alt="" class="we-artwork__image" height="{height}" width="{width}" loading="lazy">'
+        f'</picture>'
+    )
+
+
+def _head(title: str) -> str:
+    meta = "".join(
+        f'<meta name="{name}" content="{content}">'
+        for name, content in (
+            ("description", f"Download {title} and enjoy it on your iPhone, iPad and iPod touch."),
+            ("apple:title", title),
+            ("apple:content_id", "web-experience-app"),
+            ("web-experience-app/config/environment", "%7B%22modulePrefix%22%3A%22web-experience-app%22" + "%2C%22x%22%3A1" * 300 + "%7D"),
+        )
+    )
+    styles = "".join(f'<link rel="stylesheet" href="/assets/web-experience-app-{i:02d}.css">' for i in range(6))
+    return f"<head><meta charset=\"utf-8\"><title>{title} on the App Store</title>{meta}{styles}</head>"
+
+
+def _navigation() -> str:
+    items = "".join(
+        f'<li class="globalnav-item globalnav-item-{name.lower()}"><a class="globalnav-link globalnav-link-{name.lower()}" '
+        f'href="https://www.apple.com/{name.lower()}/" data-analytics-title="{name}"><span class="globalnav-link-text-container">'
+        f'<span class="globalnav-link-text">{name}</span></span></a></li>'
+        for name in ("Store", "Mac", "iPad", "iPhone", "Watch", "Vision", "AirPods", "TV", "Entertainment", "Accessories", "Support")
+    )
+    return f'<nav id="globalnav" class="globalnav" role="navigation" aria-label="Global">{items * 3}</nav>'
+
+
+def _footer() -> str:
+    columns = "".join(
+        f'<div class="ac-gf-directory-column"><h3 class="ac-gf-directory-column-section-title">{section}</h3><ul class="ac-gf-directory-column-section-list">'
+        + "".join(f'<li class="ac-gf-directory-column-section-item"><a class="ac-gf-directory-column-section-link" href="/{section.lower()}/{i}/">{section} link {i}</a></li>' for i in range(12))
+        + "</ul></div>"
+        for section in ("Shop", "Wallet", "Account", "Entertainment", "Store", "Business", "Education", "Values", "About")
+    )
+    return f'<footer id="ac-globalfooter" class="no-js" role="contentinfo"><div class="ac-gf-directory">{columns}</div></footer>'
+
+
+def _lockup(rng: random.Random, url: str, title: str) -> str:
+    return (
+        f'<a href="{url}" class="we-lockup targeted-link l-column small-2 medium-3 large-2 we-lockup--shelf-align-top">'
+        f'{_artwork(rng, 230, 230)}<div class="we-lockup__copy"><div class="we-lockup__text"><div class="we-lockup__title">'
+        f'<div class="we-truncate we-truncate--multi-line targeted-link__target"><p>{title}</p></div></div>'
+        f'<div class="we-truncate we-truncate--single-line we-lockup__subtitle">{rng.choice(_GENRES)}</div></div></div></a>'
+    )
+
+
+def _shelf(rng: random.Random, heading: str, lockups: List[str], see_all: Optional[str] = None) -> str:
+    link = f'<a href="{see_all}" class="link section__nav__see-all-link">See All</a>' if see_all else ""
+    return (
+        f'<section class="l-content-width section section--bordered"><div class="section__nav">'
+        f'<h2 class="section__headline">{heading}</h2>{link}</div>'
+        f'<div class="l-row l-row--peek">{"".join(lockups)}</div></section>'
+    )
+
+
+def _app_url(index: int) -> str:
+    return f"{APP_STORE}/us/app/{_title(index).lower().replace(' ', '-').replace('.', '')}/id{FIRST_APP_ID + index}"
+
+
+def _title(index: int) -> str:
+    rng = random.Random(index)
+    return f"{rng.choice(_TITLES)} {rng.choice(_SUFFIXES)}" + (f" {index}" if index >= 40 else "")
+
+
+def _shoebox(rng: random.Random, app_id: int, title: str, description: List[str]) -> str:
+    # Real pages embed the app's API record in a JSON script, which is most of their weight
+    data = {
+        f"apps/{app_id}": {
+            "id": str(app_id),
+            "type": "apps",
+            "attributes": {
+                "name": title,
+                "description": {"standard": "\n".join(description)},
+                "screenshots": [
+                    {"url": f"https://is1-ssl.mzstatic.com/image/thumb/{rng.getrandbits(64):x}/{{w}}x{{h}}bb.{{f}}", "width": 1242, "height": 2688}
+                    for _ in range(120)
+                ],
+                "reviews": [
+                    {"title": _sentence(rng, 4), "review": " ".join(_paragraphs(rng, 1)), "rating": rng.randint(1, 5), "userName": f"player{rng.randint(1, 99999)}"}
+                    for _ in range(160)
+                ],
+                "versionHistory": [
+                    {"versionDisplay": f"{major}.{minor}", "releaseNotes": _sentence(rng, 24)}
+                    for major in range(1, 11) for minor in range(10)
+                ],
+            },
+        }
+    }
+    return f'<script type="fastboot/shoebox" id="shoebox-media-api-cache-apps">{json.dumps(data)}</script>'
+
+
+def _information(items: List[Tuple[str, str]]) -> str:
+    rows = "".join(
+        f'<div class="information-list__item l-column small-12 medium-6 large-4 small-valign-top">'
+        f'<dt class="information-list__item__term medium-valign-top l-column medium-3 large-2">{term}</dt>'
+        f'<dd class="information-list__item__definition l-column medium-9 large-6">{definition}</dd></div>'
+        for term, definition in items
+    )
+    return (
+        '<section class="l-content-width section section--bordered section--information">'
+        '<h2 class="section__headline">Information</h2>'
+        f'<dl class="information-list information-list--app medium-columns l-row">{rows}</dl></section>'
+    )
+
+
+def game_page(index: int, game_count: int) -> str:
+    """Full-size detail page of the index-th synthetic game."""
+    rng = random.Random(FIRST_APP_ID + index)
+    app_id = FIRST_APP_ID + index
+    title = _title(index)
+    genre = rng.choice(_GENRES)
+    price = "Free" if rng.random() < 0.8 else rng.choice(_PRICES)
+    age = rng.choice(("4+", "9+", "12+", "17+"))
+    descriptors = rng.sample(_DESCRIPTORS, k=rng.randint(0, 2)) if age != "4+" else []
+    size = f"{rng.uniform(1.2, 3.9):.1f} GB" if rng.random() < 0.1 else f"{rng.uniform(40, 900):.1f} MB"
+    rating = f"{rng.uniform(3.0, 4.9):.1f}"
+    rating_count = rng.choice((f"{rng.randint(1, 999)}", f"{rng.uniform(1, 999):.0f}K", f"{rng.uniform(1, 9.9):.1f}M"))
+    description = _paragraphs(rng, 6)
+
+    supports = []
+    if rng.random() < 0.6:
+        features = [name for name in ("leaderboards", "achievements") if rng.random() < 0.7]
+        copy = f"Challenge friends and check {' and '.join(features)}." if features else "Play with friends."
+        supports.append(("Game Center", copy))
+    supports.append(("Family Sharing", "Up to six family members can use this app with Family Sharing enabled."))
+    supports_html = "".join(
+        f'<li class="supports-list__item">{_artwork(rng, 50, 50)}<div class="supports-list__item__copy">'
+        f'<h3 class="supports-list__item__copy__heading">{heading}</h3>'
+        f'<p class="supports-list__item__copy__description">{copy}</p></div></li>'
+        for heading, copy in supports
+    )
+
+    age_definition = age + "".join(f'<ul class="information-list__item__definition__item"><li>{d}</li></ul>' for d in descriptors)
+    information = _information([
+        ("Seller", f"{DEVELOPER_NAME} SAS"),
+        ("Size", size),
+        ("Category", f'<a href="{APP_STORE}/us/genre/ios-games/id6014" class="link">{genre}</a>'),
+        ("Compatibility", "<dl><dt>iPhone</dt><dd>Requires iOS 13.0 or later.</dd><dt>iPad</dt><dd>Requires iPadOS 13.0 or later.</dd></dl>"),
+        ("Languages", "English, French, German, Italian, Japanese, Korean, Portuguese, Russian, Simplified Chinese, Spanish, Turkish"),
+        ("Age Rating", age_definition),
+        ("Copyright", f"© 2024 {DEVELOPER_NAME}"),
+        ("Price", price),
+    ] + ([("In-App Purchases", "<ol>" + "".join(f"<li>Pack {i} {rng.choice(_PRICES)}</li>" for i in range(10)) + "</ol>")] if rng.random() < 0.7 else []))
+
+    reviews = "".join(
+        f'<div class="we-customer-review lockup ember-view"><figure class="we-star-rating we-customer-review__rating we-star-rating--large" aria-label="{rng.randint(1, 5)} out of 5"></figure>'
+        f'<h3 class="we-truncate we-truncate--single-line we-customer-review__title">{_sentence(rng, 4)}</h3>'
+        f'<blockquote class="we-truncate we-truncate--multi-line we-customer-review__body"><p>{" ".join(_paragraphs(rng, 1))}</p></blockquote></div>'
+        for _ in range(12)
+    )
+    more_by = [_lockup(rng, _app_url(other), _title(other)) for other in rng.sample(range(game_count), k=min(12, game_count))]
+    also_like = [
+        _lockup(rng, f"{APP_STORE}/us/app/other-game-{other}/id{1500000000 + other}", f"Other Game {other}")
+        for other in rng.sample(range(5000), k=12)
+    ]
+    body = (
+        _navigation()
+        + '<main class="selfservice-main"><div class="animation-wrapper is-visible">'
+        + '<section class="l-content-width section section--hero product-hero"><div class="product-hero__media">'
+        + _artwork(rng, 230, 230) + '</div><header class="product-header app-header product-header--padded-start">'
+        + f'<h1 class="product-header__title app-header__title">{title}<span class="badge badge--product-title">{age}</span></h1>'
+        + f'<h2 class="product-header__subtitle app-header__subtitle">{_sentence(rng, 5)}</h2>'
+        + f'<h2 class="product-header__identity app-header__identity"><a class="link" href="{DEVELOPER_URL}">{DEVELOPER_NAME}</a></h2>'
+        + f'<ul class="product-header__list"><li class="product-header__list__item"><ul class="inline-list inline-list--mobile-compact">'
+        + f'<li class="inline-list__item">{price}</li><li class="inline-list__item">Offers In-App Purchases</li></ul></li></ul></header></section>'
+        + '<section class="l-content-width section section--bordered"><div class="we-screenshot-viewer">'
+        + "".join(_artwork(rng, 300, 650) for _ in range(10)) + '</div></section>'
+        + '<section class="l-content-width section section--bordered"><div class="section__description">'
+        + "".join(f"<p>{paragraph}</p>" for paragraph in description) + '</div></section>'
+        + '<section class="l-content-width section section--bordered"><div class="we-customer-ratings lockup">'
+        + f'<div class="we-customer-ratings__stats"><span class="we-customer-ratings__averages__display">{rating}</span>'
+        + f'<span class="we-customer-ratings__averages__details">out of 5</span></div>'
+        + f'<p class="we-customer-ratings__count">{rating_count} Ratings</p></div>{reviews}</section>'
+        + f'<section class="l-content-width section section--bordered"><h2 class="section__headline">Supports</h2><ul class="supports-list">{supports_html}</ul></section>'
+        + information
+        + _shelf(rng, "More By This Developer", more_by, see_all=f"{DEVELOPER_URL}?see-all=i-phonei-pad-apps")
+        + _shelf(rng, "You Might Also Like", also_like)
+        + '</div></main>'
+        + _footer()
+        + _shoebox(rng, app_id, title, description)
+    )
+    return f"<!DOCTYPE html><html lang=\"en-US\" dir=\"ltr\">{_head(title)}<body class=\"no-js no-touch\">{body}</body></html>"
+
+
+def developer_page(game_count: int) -> str:
+    rng = random.Random(0)
+    shown = min(DEVELOPER_PAGE_APPS, game_count)
+    lockups = [_lockup(rng, _app_url(index), _title(index)) for index in range(shown)]
+    shelves = _shelf(rng, "iPhone &amp; iPad Apps", lockups, see_all=f"{DEVELOPER_URL}?see-all=i-phonei-pad-apps")
+    header = (
+        '<header class="l-content-width section section--hero"><h1 class="page-header__title">'
+        f'{DEVELOPER_NAME}</h1></header>'
+    )
+    main = f'<main class="selfservice-main">{header}{shelves}</main>'
+    return f"<!DOCTYPE html><html lang=\"en-US\">{_head(DEVELOPER_NAME)}<body>{_navigation()}{main}{_footer()}</body></html>"
+
+
+def listing_page(page: int, game_count: int) -> str:
+    """page-th (1-based) "See All" page: LISTING_PAGE_SIZE apps and a link to the next page."""
+    rng = random.Random(page)
+    start = (page - 1) * LISTING_PAGE_SIZE
+    lockups = [_lockup(rng, _app_url(index), _title(index)) for index in range(start, min(game_count, start + LISTING_PAGE_SIZE))]
+    next_link = ""
+    if start + LISTING_PAGE_SIZE < game_count:
+        next_link = f'<a class="link" href="{listing_url(page + 1)}">Next</a>'
+    main = f'<main class="selfservice-main">{_shelf(rng, "iPhone &amp; iPad Apps", lockups)}{next_link}</main>'
+    return f"<!DOCTYPE html><html lang=\"en-US\">{_head(DEVELOPER_NAME)}<body>{_navigation()}{main}{_footer()}</body></html>"
+
+
+def listing_url(page: int) -> str:
+    suffix = f"&page={page}" if page > 1 else ""
+    return f"{DEVELOPER_URL}?see-all=i-phonei-pad-apps{suffix}"
+
+
+def synthesize_corpus(directory: str = DEFAULT_CORPUS_DIR, games: int = DEFAULT_GAMES) -> Corpus:
+    """Writes a synthetic corpus of games game pages (the same pages on every call)."""
+    writer = _CorpusWriter(directory, "synthetic", DEVELOPER_URL)
+    writer.add(DEVELOPER_URL, developer_page(games).encode("utf-8"), "developer")
+    for page in range(1, -(-games // LISTING_PAGE_SIZE) + 1):
+        writer.add(listing_url(page), listing_page(page, games).encode("utf-8"), f"listing-{page}")
+    for index in range(games):
+        url = _app_url(index)
+        writer.add(url, game_page(index, games).encode("utf-8"), f"app-{FIRST_APP_ID + index}")
+        writer.manifest["game_urls"].append(url)
+    return writer.close()
+
+
+def record_corpus(developer_url: str, directory: str = DEFAULT_CORPUS_DIR, max_games: Optional[int] = None) -> Corpus:
+    """
+    Records a developer's live pages (catalog listings and game pages) into
+    directory, through the shared HTTP client. This is the only step that
+    needs network; the benchmarks then replay the recording.
+    """
+    from itertools import islice
+
+    from src.appstore_data_agent.tools import http_client
+    from src.appstore_data_agent.tools.app_identity import app_id
+    from src.appstore_data_agent.tools.catalog_crawler import crawl_catalog
+
+    writer = _CorpusWriter(directory, "recorded", developer_url)
+
+    def fetch(url: str) -> bytes:
+        response = http_client.get(url)
+        response.raise_for_status()
+        return response.content
+
+    def record_listing(url: str):
+        body = fetch(url)
+        writer.add(url, body, f"listing-{len(writer.manifest['pages'])}")
+        return body, "utf-8"
+
+    for url in islice(crawl_catalog(developer_url, fetch=record_listing, max_workers=1), max_games):
+        writer.add(url, fetch(url), f"app-{app_id(url)}")
+        writer.manifest["game_urls"].append(url)
+    return writer.close()
+
+
+def ensure_corpus(directory: str = DEFAULT_CORPUS_DIR, games: int = DEFAULT_GAMES) -> Corpus:
+    """The corpus in directory, synthesized first when missing or when a synthetic one has too few games."""
+    if os.path.exists(os.path.join(directory, MANIFEST_FILE)):
+        corpus = Corpus(directory)
+        if corpus.source == "recorded" or len(corpus.game_urls) >= games:
+            return corpus
+    return synthesize_corpus(directory, games)
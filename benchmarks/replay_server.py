@@ -0,0 +1,158 @@
+import argparse
+import random
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from requests.adapters import HTTPAdapter
+
+from .corpus import DEFAULT_CORPUS_DIR, Corpus
+
+# Local stand-in for apps.apple.com: serves a corpus over HTTP on 127.0.0.1,
+# each answer held back by a configurable latency (plus random jitter) to
+# model the network. Scraper sessions are pointed at it with ReplayAdapter,
+# so the code under test still builds real App Store URLs.
+#
+# For timing runs, start the server in its own process (replay_process): a
+# server thread in the benchmark's process would compete with the crawler
+# for the GIL and skew the numbers.
+
+ROUTED_PREFIX = "https://apps.apple.com/"
+
+
+class ReplayServer:
+    """Serves a corpus. Pages missing from the corpus are answered with a 404."""
+
+    def __init__(
+        self,
+        corpus: Corpus,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 0,
+    ):
+        self.corpus = corpus
+        self.latency = latency
+        self.jitter = jitter
+        self.requests_served = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def delay(self) -> float:
+        with self._lock:
+            self.requests_served += 1
+            return self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def _handler_class(self):
+        server = self
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                time.sleep(server.delay())
+                path = server.corpus.path(self.path)
+                if path is None:
+                    self.send_error(404)
+                    return
+                with open(path, "rb") as page:
+                    body = page.read()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return ReplayHandler
+
+    def start(self) -> "ReplayServer":
+        """Serves from a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Transport adapter that sends requests to the replay server at base_url instead of their own host."""
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = urlsplit(base_url)
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.url = urlunsplit((self.base_url.scheme, self.base_url.netloc, parts.path, parts.query, ""))
+        return super().send(request, **kwargs)
+
+
+def route(session, base_url: str, pool_size: int = 16) -> None:
+    """Sends session's App Store requests to the replay server at base_url."""
+    session.mount(ROUTED_PREFIX, ReplayAdapter(base_url, pool_connections=pool_size, pool_maxsize=pool_size))
+
+
+@contextmanager
+def replay_process(corpus_dir: str = DEFAULT_CORPUS_DIR, latency: float = 0.0, jitter: float = 0.0) -> Iterator[str]:
+    """Runs a replay server in a child process. Yields its base URL."""
+    command = [sys.executable, "-m", "benchmarks.replay_server", corpus_dir, "--latency", str(latency), "--jitter", str(jitter)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    try:
+        # First line: "Serving <corpus> on <base url>"
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"Replay server did not start: {' '.join(command)}")
+        yield line.split(" on ")[-1].strip()
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Serve a recorded App Store corpus on localhost.")
+    parser.add_argument("corpus", nargs="?", default=DEFAULT_CORPUS_DIR, help="Corpus directory")
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on (default: any free port)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds each answer is held back")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Up to this many more seconds, at random")
+    args = parser.parse_args(argv)
+
+    server = ReplayServer(Corpus(args.corpus), latency=args.latency, jitter=args.jitter, port=args.port)
+    print(f"Serving {args.corpus} on {server.base_url}", flush=True)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from typing import Callable, Dict, List, Optional
+
+from src.appstore_data_agent import pipeline
+from src.appstore_data_agent.analytics import summarize_games
+from src.appstore_data_agent.report import build_report, render_report
+from src.appstore_data_agent.tools import (
+    developer_index,
+    developer_url_store,
+    http_cache,
+    http_client,
+    page_parser,
+    profiler,
+    rate_limiter,
+)
+from src.appstore_data_agent.tools.game_record import GameRecord
+from src.appstore_data_agent.tools.page_parser import parse_game_record
+
+from .corpus import DEFAULT_CORPUS_DIR, DEFAULT_GAMES, Corpus, ensure_corpus, record_corpus
+from .replay_server import replay_process, route
+
+# Offline benchmarks of the scraper's hot paths, run against a page corpus
+# replayed from localhost (no request leaves the machine):
+#   parse.*    parse throughput of the game page parsers, per BeautifulSoup parser
+#   crawl.*    catalog crawl plus game page scrape of N games, end to end
+#   memory.*   peak Python heap of the largest crawl and of parsing one page;
+#              bytes held per game as a GameRecord
+#   report.*   report and catalog analytics built from the crawled games
+#   startup.*  wall time of `appstore_data_agent --help` in a fresh interpreter
+# Results are compared with a saved baseline (benchmarks/baseline.json) and
+# anything slower or bigger than the tolerance is flagged as a regression.
+#
+#   python -m benchmarks.run                 # run, compare with the baseline
+#   python -m benchmarks.run --save-baseline # run, make the results the new baseline
+#   python -m benchmarks.run --check         # exit with 1 on a regression (CI)
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_CRAWL_SIZES = (50, 250)
+DEFAULT_LATENCY = 0.05  # seconds per page, roughly a round trip to apps.apple.com
+DEFAULT_JITTER = 0.02
+DEFAULT_PARSE_PAGES = 50
+DEFAULT_TOLERANCE = 0.25  # 25% slower (or bigger) than the baseline is a regression
+# Pacing is not under test: let the rate limiter through at full speed
+BENCHMARK_REQUESTS_PER_SECOND = 10000.0
+
+PARSERS = ["html.parser"]
+try:
+    import lxml  # noqa: F401
+    PARSERS.append("lxml")
+except ImportError:
+    pass
+
+
+def result(value: float, unit: str, better: str = "lower") -> Dict:
+    return {"value": round(value, 4), "unit": unit, "better": better}
+
+
+def _quiet(function: Callable, *args, **kwargs):
+    # The scrapers print progress per page; keep it out of the benchmark output
+    with redirect_stdout(io.StringIO()):
+        return function(*args, **kwargs)
+
+
+def bench_parse(corpus: Corpus, pages: int = DEFAULT_PARSE_PAGES) -> Dict[str, Dict]:
+    """Pages per second of the game page parser, with each available BeautifulSoup parser."""
+    bodies = [body for _, body in corpus.game_pages(pages)]
+    megabytes = sum(len(body) for body in bodies) / 1e6
+    results = {}
+    for parser in PARSERS:
+        default_parser = page_parser.DEFAULT_PARSER
+        page_parser.DEFAULT_PARSER = parser
+        try:
+            started = time.perf_counter()
+            for body in bodies:
+                _quiet(parse_game_record, body)
+            elapsed = time.perf_counter() - started
+        finally:
+            page_parser.DEFAULT_PARSER = default_parser
+        results[f"parse.record[{parser}].pages_per_s"] = result(len(bodies) / elapsed, "pages/s", "higher")
+        results[f"parse.record[{parser}].mb_per_s"] = result(megabytes / elapsed, "MB/s", "higher")
+    return results
+
+
+def crawl(corpus: Corpus, games: int, parse_workers: Optional[int] = pipeline.DEFAULT_PARSE_WORKERS) -> List[GameRecord]:
+    """list_developer_games and scrape_games of games games, through the replay route."""
+    return _quiet(
+        pipeline.scrape_games,
+        pipeline.list_developer_games(corpus.developer_url, games),
+        parse_workers=parse_workers,
+    )
+
+
+def bench_crawl(corpus: Corpus, sizes) -> Dict[str, Dict]:
+    results = {}
+    for games in sizes:
+        started = time.perf_counter()
+        scraped = crawl(corpus, games)
+        elapsed = time.perf_counter() - started
+        if len(scraped) != games:
+            raise RuntimeError(f"Crawl of {games} games scraped {len(scraped)}; is the corpus complete?")
+        results[f"crawl.{games}_games.seconds"] = result(elapsed, "s")
+        results[f"crawl.{games}_games.ms_per_game"] = result(elapsed / games * 1000, "ms")
+    return results
+
+
+def bench_memory(corpus: Corpus, games: int) -> Dict[str, Dict]:
+    """Peak traced Python heap of a crawl (parse stage in worker processes) and of parsing one page."""
+    tracemalloc.start()
+    try:
+        crawl(corpus, games)
+        _, crawl_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        _, body = next(corpus.game_pages(1))
+        baseline, _ = tracemalloc.get_traced_memory()
+        _quiet(parse_game_record, body)
+        _, parse_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        f"memory.crawl_{games}_games.peak_mb": result(crawl_peak / 1e6, "MB"),
+        "memory.parse_page.peak_mb": result((parse_peak - baseline) / 1e6, "MB"),
+    }
+
+
+def bench_records(games: List[GameRecord]) -> Dict[str, Dict]:
+    """Traced heap held per game by copies of the crawled GameRecords."""
+    rows = [game.as_row() for game in games]
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        records = [GameRecord.from_row(row) for row in rows]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"memory.record.bytes_per_game": result((after - before) / len(records), "B")}
+
+
+def bench_report(games: List[GameRecord], repeat: int = 5) -> Dict[str, Dict]:
+    research = {"developer_name": games[0].developer_name, "developer_url": "", "games": games}
+    timings = {"report.build_ms": [], "report.analytics_ms": []}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render_report(build_report(research))
+        timings["report.build_ms"].append(time.perf_counter() - started)
+        started = time.perf_counter()
+        summarize_games(games)
+        timings["report.analytics_ms"].append(time.perf_counter() - started)
+    # Best of repeat: the least disturbed run
+    return {name: result(min(values) * 1000, "ms") for name, values in timings.items()}
+
+
+def bench_startup(repeat: int = 5) -> Dict[str, Dict]:
+    """Best wall time of the CLI's --help, which imports the entry point module and parses arguments."""
+    env = dict(os.environ, PYTHONPATH=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "appstore_data_agent.main", "--help"], env=env,
+                       stdout=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - started)
+    return {"startup.help_ms": result(min(timings) * 1000, "ms")}
+
+
+def configure_offline(base_url: str, state_dir: str) -> None:
+    """Routes App Store requests to the replay server and keeps every on-disk store out of the way."""
+    http_cache.configure(mode="off")
+    http_client.configure()
+    route(http_client.get_session(), base_url)
+    rate_limiter.configure(rate=BENCHMARK_REQUESTS_PER_SECOND, burst=int(BENCHMARK_REQUESTS_PER_SECOND),
+                           max_rate=BENCHMARK_REQUESTS_PER_SECOND)
+    profiler.configure(enabled=False)
+    developer_index.configure(names_file=os.path.join(state_dir, "developer_names.txt"))
+    developer_url_store.configure(store_file=os.path.join(state_dir, "developer_urls.json"))
+
+
+def run_benchmarks(
+    corpus: Corpus,
+    sizes=DEFAULT_CRAWL_SIZES,
+    latency: float = DEFAULT_LATENCY,
+    jitter: float = DEFAULT_JITTER,
+    parse_pages: int = DEFAULT_PARSE_PAGES,
+) -> Dict:
+    results = bench_parse(corpus, parse_pages)
+    results.update(bench_startup())
+    with replay_process(corpus.directory, latency, jitter) as base_url, tempfile.TemporaryDirectory() as state_dir:
+        configure_offline(base_url, state_dir)
+        # Warm-up: the parse workers' fork server and the connection pool start once per process
+        crawl(corpus, min(sizes))
+        results.update(bench_crawl(corpus, sizes))
+        results.update(bench_memory(corpus, max(sizes)))
+        games = crawl(corpus, max(sizes), parse_workers=0)
+        results.update(bench_records(games))
+        results.update(bench_report(games))
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "default_parser": page_parser.DEFAULT_PARSER,
+        },
+        "settings": {
+            "corpus": corpus.source,
+            "corpus_games": len(corpus.game_urls),
+            "crawl_sizes": list(sizes),
+            "latency_s": latency,
+            "jitter_s": jitter,
+            "parse_pages": parse_pages,
+        },
+        "results": results,
+    }
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """Prints results next to the baseline. Returns the names of the regressed benchmarks."""
+    regressions = []
+    rows = [("benchmark", "baseline", "current", "change", "")]
+    for name, current in results["results"].items():
+        saved = baseline.get("results", {}).get(name)
+        if saved is None or not saved["value"]:
+            rows.append((name, "-", f"{current['value']} {current['unit']}", "", "new"))
+            continue
+        change = current["value"] / saved["value"] - 1
+        worse = change > tolerance if current["better"] == "lower" else change < -tolerance
+        if worse:
+            regressions.append(name)
+        rows.append((name, f"{saved['value']} {saved['unit']}", f"{current['value']} {current['unit']}",
+                     f"{change:+.1%}", "REGRESSION" if worse else ""))
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    for row in rows:
+        print("  ".join(value.ljust(width) for value, width in zip(row, widths)).rstrip())
+    if baseline.get("settings") and baseline["settings"] != results["settings"]:
+        print("Note: the baseline was run with other settings:", json.dumps(baseline["settings"]))
+    return regressions
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline benchmarks against a replayed App Store corpus.")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_DIR, help="Corpus directory (synthesized when missing)")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES, help="Games in a synthesized corpus")
+    parser.add_argument("--record", metavar="DEVELOPER_URL", help="Record this developer's live pages as the corpus first (needs network)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_CRAWL_SIZES), help="Games per crawl benchmark")
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY, help="Replay latency per page, in seconds")
+    parser.add_argument("--jitter", type=float, default=DEFAULT_JITTER, help="Extra random latency per page, in seconds")
+    parser.add_argument("--parse-pages", type=int, default=DEFAULT_PARSE_PAGES, help="Pages per parse benchmark")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline results file")
+    parser.add_argument("--save-baseline", action="store_true", help="Save the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed slowdown before a regression, as a fraction")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 when a benchmark regressed")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.record:
+        corpus = record_corpus(args.record, args.corpus, max_games=max(max(args.sizes), args.parse_pages))
+    else:
+        corpus = ensure_corpus(args.corpus, max(args.games, max(args.sizes), args.parse_pages))
+    print(f"Corpus: {corpus.directory} ({corpus.source}, {len(corpus.game_urls)} games, {corpus.total_bytes() / 1e6:.1f} MB)")
+
+    results = run_benchmarks(corpus, args.sizes, args.latency, args.jitter, args.parse_pages)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+    regressions = compare(results, baseline, args.tolerance)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+            baseline_file.write("\n")
+        print(f"Baseline saved to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        if args.check:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
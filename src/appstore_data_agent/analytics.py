@@ -0,0 +1,122 @@
+import csv
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .tools.columnar_export import COLUMNS, read_games, typed_row_from_details
+from .tools.game_record import GameRecord
+
+# Catalog statistics for the report step, computed on whole columns with
+# pandas instead of asking the LLM to do arithmetic over raw CSV text. The
+# summary has a fixed shape (breakdowns are capped at top_n entries), so the
+# prompt it ends up in stays the same size whatever the size of the catalog.
+
+ANALYTICS_OUTPUT_FILE = "analytics.json"
+DEFAULT_TOP_N = 10
+
+FLAG_COLUMNS = ["game_center", "achievements", "leaderboards"]
+_NUMERIC_COLUMNS = ["app_id", "rating", "rating_count", "size_bytes", "age_rating", "price_cents"]
+_BOOLEAN_COLUMNS = ["is_free", "in_app_purchases"] + FLAG_COLUMNS
+
+RATING_BINS = [0, 1, 2, 3, 4, 4.5, 5]
+RATING_LABELS = ["0-1", "1-2", "2-3", "3-4", "4-4.5", "4.5-5"]
+PRICE_BINS = [-np.inf, 0, 99, 299, 999, np.inf]
+PRICE_LABELS = ["free", "$0.01-$0.99", "$1.00-$2.99", "$3.00-$9.99", "$10.00+"]
+SIZE_PERCENTILES = [0.1, 0.5, 0.9, 0.99]
+
+
+def catalog_frame(rows: Iterable[Dict]) -> pd.DataFrame:
+    """DataFrame of typed rows (see columnar_export), with numeric and nullable boolean columns."""
+    frame = pd.DataFrame.from_records(list(rows), columns=[name for name, _ in COLUMNS])
+    frame[_NUMERIC_COLUMNS] = frame[_NUMERIC_COLUMNS].astype("float64")
+    frame[_BOOLEAN_COLUMNS] = frame[_BOOLEAN_COLUMNS].astype("boolean")
+    return frame
+
+
+def frame_from_games(games: Iterable[GameRecord]) -> pd.DataFrame:
+    """catalog_frame of direct pipeline games."""
+    return catalog_frame(game.as_row() for game in games)
+
+
+def read_catalog(path: str) -> pd.DataFrame:
+    """catalog_frame of a scraper CSV file, or of a Parquet/Arrow file written by columnar_export."""
+    if path.endswith(".csv"):
+        with open(path, newline='', encoding='utf-8') as csv_file:
+            return catalog_frame(typed_row_from_details(row) for row in csv.DictReader(csv_file))
+    return catalog_frame(read_games(path).to_pylist())
+
+
+def _value(value, digits: int = 2):
+    if pd.isna(value):
+        return None
+    return round(float(value), digits)
+
+
+def _counts(categories: pd.Series) -> Dict[str, int]:
+    return {str(label): int(count) for label, count in categories.value_counts(sort=False).items()}
+
+
+def _adoption(frame: pd.DataFrame) -> Dict[str, Optional[float]]:
+    """Share of games with each Game Center feature, among games where it is known."""
+    return {flag: _value(rate, 3) for flag, rate in frame[FLAG_COLUMNS].mean().items()}
+
+
+def _breakdown(frame: pd.DataFrame, key: pd.Series, top_n: int) -> Dict:
+    """Per-group statistics for the top_n largest groups of key, plus how many groups were left out."""
+    table = frame.groupby(key.rename("group"), sort=False, observed=True).agg(
+        games=("url", "size"),
+        mean_rating=("rating", "mean"),
+        median_size_mb=("size_bytes", "median"),
+        free_share=("is_free", "mean"),
+        game_center=("game_center", "mean"),
+        achievements=("achievements", "mean"),
+        leaderboards=("leaderboards", "mean"),
+    )
+    table = table.reset_index().sort_values(["games", "group"], ascending=[False, True], kind="stable")
+    top = [
+        {
+            "name": str(row.group),
+            "games": int(row.games),
+            "mean_rating": _value(row.mean_rating),
+            "median_size_mb": _value(row.median_size_mb / 1e6, 1),
+            "free_share": _value(row.free_share, 3),
+            "game_center": _value(row.game_center, 3),
+            "achievements": _value(row.achievements, 3),
+            "leaderboards": _value(row.leaderboards, 3),
+        }
+        for row in table.head(top_n).itertuples(index=False)
+    ]
+    return {"top": top, "others": max(0, len(table) - top_n)}
+
+
+def summarize_catalog(frame: pd.DataFrame, top_n: int = DEFAULT_TOP_N) -> Dict:
+    """
+    Fixed-size statistics of a catalog_frame: ratings, sizes, prices, Game
+    Center adoption, and breakdowns by price model, genre and developer.
+    """
+    ratings = frame["rating"]
+    sizes_mb = frame["size_bytes"].dropna() / 1e6
+    price_model = frame["is_free"].map({True: "free", False: "paid"}, na_action="ignore")
+    return {
+        "games": int(len(frame)),
+        "developers": int(frame["developer_name"].nunique()),
+        "ratings": {
+            "rated_games": int(ratings.notna().sum()),
+            "mean": _value(ratings.mean()),
+            "median": _value(ratings.median()),
+            "distribution": _counts(pd.cut(ratings, RATING_BINS, labels=RATING_LABELS, include_lowest=True)),
+        },
+        "size_mb_percentiles": {
+            f"p{round(q * 100)}": _value(value, 1) for q, value in sizes_mb.quantile(SIZE_PERCENTILES).items()
+        } if len(sizes_mb) else {},
+        "price_buckets": _counts(pd.cut(frame["price_cents"], PRICE_BINS, labels=PRICE_LABELS)),
+        "adoption": _adoption(frame),
+        "free_vs_paid": _breakdown(frame, price_model, top_n=2)["top"],
+        "genres": _breakdown(frame, frame["genre"], top_n),
+        "by_developer": _breakdown(frame, frame["developer_name"], top_n),
+    }
+
+
+def summarize_games(games: List[GameRecord], top_n: int = DEFAULT_TOP_N) -> Dict:
+    return summarize_catalog(frame_from_games(games), top_n)
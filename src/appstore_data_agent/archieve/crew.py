@@ -4,6 +4,7 @@ from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List
 from .tools.intent_identifier import DeveloperNameFuzzyIdentifierTool
 from .tools.custom_tool import GameAppInfoScraperTool
+from .tools.catalog_analytics_tool import CatalogAnalyticsTool
 from .tools.csv_reader_tool import CSVReaderTool
 from .tools.developer_url_finder import DeveloperURLFinderTool
 from textwrap import dedent
@@ -38,7 +39,7 @@ class AppstoreDataAgent():
         return Agent(
             config=self.agents_config['reporting_analyst'], # type: ignore[index]
             verbose=True,
-            tools=[CSVReaderTool()]
+            tools=[CatalogAnalyticsTool(), CSVReaderTool()]
         )
 
     # To learn more about structured task outputs,
@@ -85,7 +86,7 @@ class AppstoreDataAgent():
             output_file='report.md',
             expected_output=dedent("""
                 A markdown file named report.md containing a comprehensive report based on the scraped game data.
-                The report MUST analyze the data from 'game_center_games.csv'.
+                The report MUST be based on the statistics of 'game_center_games.csv' computed by the Catalog Analytics Tool.
                 It should include:
                 - An overview of the developer's games.
                 - Key metrics (ratings, size, price, genre).
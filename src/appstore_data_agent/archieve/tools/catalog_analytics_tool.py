@@ -0,0 +1,28 @@
+import json
+from crewai.tools import BaseTool
+from typing import Type
+from pydantic import BaseModel, Field
+
+class CatalogAnalyticsToolInput(BaseModel):
+    """Input schema for CatalogAnalyticsTool."""
+    file_path: str = Field(..., description="The path to the scraped games file (CSV or Parquet).")
+
+class CatalogAnalyticsTool(BaseTool):
+    name: str = "Catalog Analytics Tool"
+    description: str = (
+        "A tool to compute the statistics of a scraped games file: rating distribution, size percentiles, "
+        "price buckets, Game Center / achievement / leaderboard adoption, free vs paid comparison and "
+        "per-genre and per-developer breakdowns. Returns them as JSON."
+    )
+    args_schema: Type[BaseModel] = CatalogAnalyticsToolInput
+
+    def _run(self, file_path: str) -> str:
+        print(f"Computing catalog statistics: {file_path}")
+        # pandas is only loaded when the tool is used, not when the crew is built
+        from src.appstore_data_agent.analytics import read_catalog, summarize_catalog
+        try:
+            return json.dumps(summarize_catalog(read_catalog(file_path)), indent=2, ensure_ascii=False)
+        except FileNotFoundError:
+            return f"Error: The file {file_path} was not found."
+        except Exception as e:
+            return f"Error computing statistics of {file_path}: {e}"
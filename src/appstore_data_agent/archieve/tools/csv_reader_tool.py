@@ -1,24 +1,248 @@
 from crewai.tools import BaseTool
-from typing import Type
+from typing import Dict, Iterator, Literal, Optional, Type
 from pydantic import BaseModel, Field
+import numpy as np
 import pandas as pd
 
+# The CSV is read chunk_size rows at a time and never as a whole, and the text
+# handed back to the agent is cut to a token budget: either the file's schema
+# and summary statistics, or one page of (optionally filtered) rows.
+
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_TOKEN_BUDGET = 2000
+# Rough size of a token in characters, good enough to budget English and CSV text
+CHARS_PER_TOKEN = 4
+# Distinct values reported per column in the summary
+TOP_VALUES = 5
+# The summary's per-column state is bounded whatever the size of the file:
+# value counts are kept for the TRACKED_VALUES most common values only (pruned
+# after every chunk), and distinct values are counted with a sketch of
+# DISTINCT_SKETCH_SIZE hashes, exact below that many values and an estimate
+# (a few percent off) above it.
+TRACKED_VALUES = 200
+DISTINCT_SKETCH_SIZE = 1024
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def read_chunks(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    # Every value is kept as the scraped text; empty cells stay empty strings
+    return pd.read_csv(file_path, chunksize=chunk_size, dtype=str, keep_default_na=False)
+
+def filter_rows(
+    chunk: pd.DataFrame,
+    developer: Optional[str] = None,
+    price_type: Optional[str] = None,
+    game_center: Optional[bool] = None,
+) -> pd.DataFrame:
+    mask = pd.Series(True, index=chunk.index)
+    if developer:
+        mask &= chunk["Developer Name"].str.casefold() == developer.casefold()
+    if price_type:
+        is_free = chunk["Price"].str.contains("Free", regex=False)
+        # Rows without a known price are neither free nor paid
+        mask &= is_free if price_type == "free" else ~is_free & (chunk["Price"] != "N/A")
+    if game_center is not None:
+        mask &= (chunk["Game Center Integ"] == "Yes") == game_center
+    return chunk[mask]
+
+class DistinctSketch:
+    """K-minimum-values sketch: keeps the size smallest value hashes to estimate the distinct count."""
+
+    def __init__(self, size: int = DISTINCT_SKETCH_SIZE):
+        self.size = size
+        self.hashes = np.empty(0, dtype=np.uint64)
+        self.exact = True
+
+    def add(self, values: pd.Series) -> None:
+        if values.empty:
+            return
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        merged = np.unique(np.concatenate([self.hashes, hashes]))
+        if len(merged) > self.size:
+            self.exact = False
+            merged = merged[:self.size]
+        self.hashes = merged
+
+    def count(self) -> int:
+        if self.exact:
+            return len(self.hashes)
+        # The size-th smallest of n uniform hashes sits around size / n of the hash range
+        return round((self.size - 1) * 2.0 ** 64 / (float(self.hashes[-1]) + 1))
+
+class ColumnStats:
+    """Filled cells, most common values and distinct values of one column, accumulated in bounded memory."""
+
+    def __init__(self, tracked_values: int = TRACKED_VALUES, sketch_size: int = DISTINCT_SKETCH_SIZE):
+        self.tracked_values = tracked_values
+        self.filled = 0
+        self.counts = pd.Series(dtype="float64")
+        self.distinct = DistinctSketch(sketch_size)
+
+    def add(self, values: pd.Series) -> None:
+        self.filled += len(values)
+        self.counts = self.counts.add(values.value_counts(), fill_value=0)
+        if len(self.counts) > self.tracked_values:
+            # A value that only becomes common late in the file may be undercounted
+            self.counts = self.counts.sort_values(ascending=False, kind="stable").head(self.tracked_values)
+        self.distinct.add(values)
+
+    def summary(self) -> Dict:
+        return {
+            "filled": self.filled,
+            "distinct": self.distinct.count(),
+            "distinct_exact": self.distinct.exact,
+            "top": {str(value): int(count) for value, count in self.counts.sort_values(ascending=False, kind="stable").head(TOP_VALUES).items()},
+        }
+
+def summarize_csv(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, **filters) -> Dict:
+    """Schema and summary statistics of the (filtered) rows, accumulated chunk by chunk."""
+    rows = 0
+    columns = None
+    stats: Dict[str, ColumnStats] = {}
+    rating_stats = {"count": 0, "sum": 0.0, "min": float("inf"), "max": float("-inf")}
+    for chunk in read_chunks(file_path, chunk_size):
+        if columns is None:
+            columns = list(chunk.columns)
+        chunk = filter_rows(chunk, **filters)
+        rows += len(chunk)
+        for column in chunk.columns:
+            stats.setdefault(column, ColumnStats()).add(chunk[column][~chunk[column].isin(["", "N/A"])])
+        if "Ratings" in chunk.columns:
+            ratings = pd.to_numeric(chunk["Ratings"], errors="coerce").dropna()
+            if len(ratings):
+                rating_stats["count"] += len(ratings)
+                rating_stats["sum"] += float(ratings.sum())
+                rating_stats["min"] = min(rating_stats["min"], float(ratings.min()))
+                rating_stats["max"] = max(rating_stats["max"], float(ratings.max()))
+
+    summary = {"rows": rows, "columns": {}}
+    for column in columns or []:
+        summary["columns"][column] = stats.get(column, ColumnStats()).summary()
+    if rating_stats["count"]:
+        summary["ratings"] = {
+            "count": rating_stats["count"],
+            "mean": round(rating_stats["sum"] / rating_stats["count"], 2),
+            "min": rating_stats["min"],
+            "max": rating_stats["max"],
+        }
+    return summary
+
+def render_summary(summary: Dict, token_budget: int) -> str:
+    lines = [f"Rows: {summary['rows']}"]
+    if "ratings" in summary:
+        ratings = summary["ratings"]
+        lines.append(f"Ratings: mean {ratings['mean']}, min {ratings['min']}, max {ratings['max']} over {ratings['count']} rated rows")
+    lines.append("Columns (filled / distinct, most common values):")
+    for column, stats in summary["columns"].items():
+        top = ", ".join(f"{value} ({count})" for value, count in stats["top"].items())
+        distinct = stats['distinct'] if stats['distinct_exact'] else f"~{stats['distinct']}"
+        lines.append(f"- {column}: {stats['filled']} / {distinct}; {top}")
+    return truncate_to_budget(lines, token_budget)
+
+def truncate_to_budget(lines, token_budget: int) -> str:
+    kept, used = [], 0
+    for line in lines:
+        cost = estimate_tokens(line + "\n")
+        if used + cost > token_budget:
+            kept.append(f"... (truncated to a {token_budget} token budget)")
+            break
+        kept.append(line)
+        used += cost
+    return "\n".join(kept)
+
+def read_page(
+    file_path: str,
+    offset: int = 0,
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **filters,
+) -> str:
+    """
+    CSV text of the matching rows from offset on, as many as fit in token_budget,
+    followed by a line telling how to get the next page.
+    """
+    header = None
+    lines = []
+    used = 0
+    skipped = 0
+    more = False
+    cost = 0
+    for chunk in read_chunks(file_path, chunk_size):
+        if header is None:
+            header = chunk.head(0).to_csv(index=False).rstrip("\n")
+            used = estimate_tokens(header + "\n")
+        chunk = filter_rows(chunk, **filters)
+        if skipped + len(chunk) <= offset:
+            skipped += len(chunk)
+            continue
+        chunk = chunk.iloc[max(0, offset - skipped):]
+        skipped = offset
+        for line in chunk.to_csv(index=False, header=False).splitlines():
+            cost = estimate_tokens(line + "\n")
+            if used + cost > token_budget:
+                more = True
+                break
+            lines.append(line)
+            used += cost
+        if more:
+            break
+
+    if header is None:
+        return "The file is empty."
+    if not lines and more:
+        # The next row alone does not fit: saying there is nothing left would stall the caller
+        return (
+            f"{header}\n(row {offset} of the matching rows takes about {cost} tokens, over the budget of "
+            f"{token_budget}; call again with a larger max_tokens, or with offset={offset + 1} to skip it)"
+        )
+    if not lines:
+        return f"{header}\n(no matching rows from offset {offset})"
+    footer = f"(rows {offset} to {offset + len(lines) - 1} of the matching rows"
+    footer += f"; more rows follow, call again with offset={offset + len(lines)})" if more else "; no more rows)"
+    return "\n".join([header] + lines + [footer])
+
 class CSVReaderToolInput(BaseModel):
     """Input schema for CSVReaderTool."""
     file_path: str = Field(..., description="The path to the CSV file to be read.")
+    mode: Literal["summary", "rows"] = Field(
+        "summary",
+        description="'summary' for the columns and summary statistics, 'rows' for a page of rows.",
+    )
+    developer: Optional[str] = Field(None, description="Only rows of this developer name.")
+    price_type: Optional[Literal["free", "paid"]] = Field(None, description="Only free or only paid games.")
+    game_center: Optional[bool] = Field(None, description="Only games with (true) or without (false) Game Center.")
+    offset: int = Field(0, description="In 'rows' mode, the first matching row to return (for the next page).")
+    max_tokens: Optional[int] = Field(None, description="Size limit of the answer, in tokens.")
 
 class CSVReaderTool(BaseTool):
     name: str = "CSV Reader Tool"
     description: str = (
-        "A tool to read the content of a CSV file and return it as a string."
+        "A tool to read a CSV file within a token budget: either its columns and summary statistics "
+        "(mode 'summary'), or a page of its rows (mode 'rows'), optionally filtered by developer, "
+        "price type (free/paid) or Game Center support."
     )
     args_schema: Type[BaseModel] = CSVReaderToolInput
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    token_budget: int = DEFAULT_TOKEN_BUDGET
 
-    def _run(self, file_path: str) -> str:
+    def _run(
+        self,
+        file_path: str,
+        mode: str = "summary",
+        developer: Optional[str] = None,
+        price_type: Optional[str] = None,
+        game_center: Optional[bool] = None,
+        offset: int = 0,
+        max_tokens: Optional[int] = None,
+    ) -> str:
         print(f"Reading CSV file: {file_path}")
+        token_budget = min(max_tokens or self.token_budget, self.token_budget)
+        filters = {"developer": developer, "price_type": price_type, "game_center": game_center}
         try:
-            df = pd.read_csv(file_path)
-            return df.to_csv(index=False)
+            if mode == "rows":
+                return read_page(file_path, max(0, offset), token_budget, self.chunk_size, **filters)
+            return render_summary(summarize_csv(file_path, self.chunk_size, **filters), token_budget)
         except FileNotFoundError:
             return f"Error: The file {file_path} was not found."
         except Exception as e:
@@ -1,13 +1,29 @@
 import requests
-from bs4 import BeautifulSoup
 import csv
 from crewai.tools import BaseTool
-from typing import Type
+from typing import Optional, Type
 from pydantic import BaseModel, Field
-from src.appstore_data_agent.tools.developer_url_finder import (
+from src.appstore_data_agent.tools.developer_url_finder_tool import (
     # DeveloperGameURLFinderInput,
     DeveloperURLFinderTool
 )
+from src.appstore_data_agent.tools import checkpoint, http_client
+from src.appstore_data_agent.tools.app_identity import SeenApps, unique_app_urls
+from src.appstore_data_agent.tools.catalog_crawler import crawl_catalog
+from src.appstore_data_agent.tools.checkpoint import CrawlCheckpoint, checkpoint_path, journal_key
+from src.appstore_data_agent.tools.columnar_export import ColumnarSink, available as columnar_available
+from src.appstore_data_agent.tools.csv_sink import CSV_FIELDNAMES, CSVSink, FanOutSink, OrderedRelease
+from src.appstore_data_agent.tools.developer_index import remember_developer_name
+from src.appstore_data_agent.tools.developer_url_store import record_developer_url
+from src.appstore_data_agent.tools.fetch_engine import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PARSE_WORKERS,
+    DEFAULT_PER_HOST_LIMIT,
+    HostLimiter,
+    run_pipeline,
+)
+from src.appstore_data_agent.tools.page_parser import STORY_PAGE_SELECTORS, extract, parse_game_record
+from src.appstore_data_agent.tools.result_store import ResultBatch, get_store, snapshot_from_record
 
 # Base URL for the App Store's top free games story
 APP_STORE_URL = "https://apps.apple.com/us/story/id1302444839"
@@ -16,88 +32,25 @@ APP_STORE_URL = "https://apps.apple.com/us/story/id1302444839"
 OUTPUT_CSV_FILE = "game_center_games.csv"
 SCRAPED_FREE_GAMES_FILE = "game_center_f2p_games.csv"
 SCRAPED_PAID_GAMES_FILE = "game_center_paid_games.csv"
-
-def scrape_game_details(game_url):
-    game_details = {
-        "Developer Name": "N/A",
-        "Game Name": "N/A",
-        "Ratings": "N/A",
-        "Size": "0 MB",
-        "Age Limit": "N/A",
-        "Price": "Free",
-        "Genre": "N/A",
-        "Achievement": "No",
-        "Leaderboard": "No",
-        "Game Center Integ": "No",
-    }
-    developer_url = None
-    try:
-        response = requests.get(game_url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Game Name
-        game_name_tag = soup.find('h1', class_='product-header__title')
-        if game_name_tag and game_name_tag is not None:
-            game_details["Game Name"] = game_name_tag.get_text(strip=True)
-            print("Processing game: " +game_name_tag.get_text(strip=True))
-        
-        # Developer Name
-        developer_tag = soup.find('h2', class_='product-header__identity app-header__identity')
-        if developer_tag and developer_tag.find('a'):
-            game_details["Developer Name"] = developer_tag.find('a').get_text(strip=True)
-            developer_url = developer_tag.find('a').get('href')
-            print(f"Developer URL: {developer_url}")
-
-        # Ratings
-        ratings_tag = soup.find('span', class_='we-customer-ratings__averages__display')
-        if ratings_tag:
-            game_details["Ratings"] = ratings_tag.get_text(strip=True)
-            # print(f"Ratings: " + ratings_tag.get_text(strip=True))
-
-        # Info section begins
-        info_section = soup.find('section', class_='l-content-width section section--bordered section--information')
-        if info_section:
-            info_list_dl = info_section.find('dl', class_='information-list information-list--app medium-columns l-row')
-            if info_list_dl:
-                info_divs = info_list_dl.find_all('div', class_='information-list__item l-column small-12 medium-6 large-4 small-valign-top')
-                for div_item in info_divs:
-                    text = div_item.get_text(strip=True)
-                    if "Size" in text:
-                        size_val = text[4:]
-                        game_details["Size"] = size_val
-                        # print(f"Size: " + size_val)
-                    if "Age Rating" in text:
-                        age_rating_val = text[10:12]
-                        game_details["Age Limit"] = age_rating_val
-                        # print(f"Age Limit: " + age_rating_val)
-                    if "Price" in text:
-                        price_val = text[5:]
-                        game_details["Price"] = price_val
-                        # print(f"Price: " + price_val)
-        # Genre
-        genre_tag = soup.find('span', class_='information-list__item__definition')
-        if genre_tag:
-            game_details["Genre"] = genre_tag.get_text(strip=True)
-            # print(f"Genre: " + genre_tag.get_text(strip=True))
-
-        # Game Center functionality (Achievement, Leaderboard)
-        supports_section = soup.find('div', class_='supports-list__item__copy')
-        if supports_section:
-            support_text = supports_section.get_text().lower()
-            if "Game Center" in support_text or "leaderboards" in support_text or "achievements" in support_text:
-                game_details["Game Center Integ"] = "Yes"
-                # print(f"Game Center Integ: Yes")
-            if "achievements" in support_text:
-                game_details["Achievement"] = "Yes"
-                # print(f"Achievement: Yes")
-            if "leaderboards" in support_text:
-                game_details["Leaderboard"] = "Yes"
-                # print(f"Leaderboard: Yes")
-
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching game details for {game_url}: {e}")
-    return game_details, developer_url
+# Typed copy of the main CSV, written when pyarrow is installed
+OUTPUT_PARQUET_FILE = "game_center_games.parquet"
+
+def fetch_game_page(game_url):
+    print(f"Scraping game URL: {game_url}")
+    response = http_client.get(game_url)
+    response.raise_for_status()
+    # Raw bytes plus the declared encoding: cheap to hand over to a parse worker process
+    return response.content, response.encoding
+
+def fetch_game_record_page(game_url):
+    # The URL goes along to the parse worker so the record carries its app ID
+    return fetch_game_page(game_url) + (game_url,)
+
+def on_game_fetch_error(game_url, error):
+    if not isinstance(error, requests.exceptions.RequestException):
+        raise error
+    print(f"Error fetching game details for {game_url}: {error}")
+    return None, None
 
 def is_game_free2play(game_details):
     if "Free" in game_details["Price"]:
@@ -105,10 +58,13 @@ def is_game_free2play(game_details):
     else:
         return False
 
+def is_game_paid(game_details):
+    # A page without a price is neither: it only goes to the main CSV
+    return game_details["Price"] != "N/A" and not is_game_free2play(game_details)
+
 def write_to_csv(csv_file_name, games_data):
     with open(csv_file_name, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ["Developer Name", "Game Name", "Ratings", "Size", "Age Limit", "Price", "Genre", "Game Center Integ", "Achievement", "Leaderboard"]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
         writer.writeheader()
         writer.writerows(games_data)
     csvfile.flush
@@ -125,9 +81,18 @@ class GameAppInfoScraperTool(BaseTool):
         "Use this tool to scrape the information of a game apps in the App Store."
     )
     args_schema: Type[BaseModel] = GameAppInfoScraperToolInput
+    max_workers: int = DEFAULT_MAX_WORKERS
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT
+    parse_workers: Optional[int] = DEFAULT_PARSE_WORKERS
+    # None follows the process-wide setting (the --resume CLI switch)
+    resume: Optional[bool] = None
 
     def _run(self, app_developer: str, seed_developer_url: str) -> str:
         game_urls = []
+        # Catalog pages and game pages go to the same host: one per-host limit for both
+        limiter = HostLimiter(self.per_host_limit)
+        # Apps already collected, by app ID, whichever page listed them
+        seen = SeenApps()
         app_developer_filter = app_developer if app_developer else None
 
         if 'N/A' in seed_developer_url:
@@ -146,21 +111,19 @@ class GameAppInfoScraperTool(BaseTool):
             developer_store_url = seed_developer_url
             print(f"Attempting to scrape developer page: {developer_store_url}")
             try:
-                dev_response = requests.get(developer_store_url)
-                dev_response.raise_for_status()
-                dev_soup = BeautifulSoup(dev_response.text, 'html.parser')
-                
-                dev_game_links_section = dev_soup.find('section', class_='l-content-width section section--bordered')
-                # print(dev_game_links_section.get_text(strip=True))
-                if dev_game_links_section:
-                    dev_game_links = dev_game_links_section.find_all('a')
-
-                    total_dev_links = len(dev_game_links)
-                    print(f"Total Games found on {developer_store_url} Dev page is {total_dev_links}")
-                    for link in dev_game_links:
-                        print(f"Collecting link: {link}")
-                        if link.get('href') and "/app/" in link.get('href'):
-                            game_urls.append(link.get('href'))
+                # The whole catalog, including "See All" and paged listings
+                dev_game_links = list(crawl_catalog(
+                    developer_store_url,
+                    max_workers=self.max_workers,
+                    limiter=limiter,
+                    seen=seen,
+                ))
+
+                total_dev_links = len(dev_game_links)
+                print(f"Total Games found on {developer_store_url} Dev page is {total_dev_links}")
+                for link in dev_game_links:
+                    print(f"Collecting link: {link}")
+                    game_urls.append(link)
             except requests.exceptions.RequestException as e:
                 print(f"Error fetching developer page {developer_store_url}: {e}")
 
@@ -168,43 +131,104 @@ class GameAppInfoScraperTool(BaseTool):
         if not app_developer_filter or not seed_developer_url:
             print("App Developer URL did not seem to work... Here's a sample report for Top Free and Paid Games")
             try:
-                response = requests.get(APP_STORE_URL)
+                response = http_client.get(APP_STORE_URL)
                 response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                game_links = soup.find_all('a', class_='link link--no-tint link--no-decoration we-product-collection__item')
-                for link in game_links:
-                    if link.get('href') and "/app/" in link.get('href'):
-                        game_urls.append(link.get('href'))
+                game_links = extract(response.text, STORY_PAGE_SELECTORS)["app_links"]
+                game_urls.extend(unique_app_urls((link.get('href') for link in game_links), seen=seen))
             except requests.exceptions.RequestException as e:
                 print(f"Error fetching the main App Store page: {e}")
                 return f"Scraping error. No data to write. Error fetching the main App Store page: {e}"
 
-        game_urls = list(set(game_urls))
-        scraped_games_data = []
-        top_free_games_data = []
-        top_paid_games_data = []
+        # Already one canonical URL per app ID; sorted so the CSV row order is stable from run to run
+        game_urls = sorted(game_urls)
+        # Keyed like the journal (by app ID): a finished app may come back under
+        # another URL (storefront, slug or query string) and must keep its place
+        game_index = {journal_key(url): index for index, url in enumerate(game_urls)}
 
         print(f"Found {len(game_urls)} game URLs. ")
         
-        for url in game_urls:
-            print(f"Scraping game URL: {url}")
-            details, _ = scrape_game_details(url)
-            if details:
-                scraped_games_data.append(details)
-                if is_game_free2play(details):
-                    top_free_games_data.append(details)
-                else:
-                    top_paid_games_data.append(details)
-
-        # Write to CSV
-        if scraped_games_data and len(scraped_games_data) > 0:
-            output_file_path = write_to_csv(OUTPUT_CSV_FILE, scraped_games_data)
-            output_file_name = app_developer_filter + '_' +OUTPUT_CSV_FILE
-            output_file_path = write_to_csv(output_file_name, scraped_games_data)
-            print(f"Successfully wrote {len(scraped_games_data)} games to {output_file_path}")
-        else:
+        # Every finished page is journaled, so an interrupted crawl can be resumed
+        journal = CrawlCheckpoint(
+            checkpoint_path(app_developer_filter or "top_charts"),
+            resume=checkpoint.resume_enabled() if self.resume is None else self.resume,
+        )
+        pending_urls = journal.pending(game_urls)
+        if len(pending_urls) < len(game_urls):
+            print(f"Resuming from {journal.path}: {len(game_urls) - len(pending_urls)} games already scraped, {len(pending_urls)} left.")
+
+        # Rows are streamed to every output as they are produced, instead of
+        # being buffered until the end of the crawl
+        output_file_paths = [OUTPUT_CSV_FILE]
+        if app_developer_filter:
+            output_file_paths.append(app_developer_filter + '_' + OUTPUT_CSV_FILE)
+        main_sinks = [CSVSink(path) for path in output_file_paths]
+        sinks = main_sinks + [
+            CSVSink(SCRAPED_FREE_GAMES_FILE, predicate=is_game_free2play),
+            CSVSink(SCRAPED_PAID_GAMES_FILE, predicate=is_game_paid),
+        ]
+
+        columnar_sinks = [ColumnarSink(OUTPUT_PARQUET_FILE)] if columnar_available() else []
+        # Fresh results also go to the result store, a batch per transaction
+        with FanOutSink(sinks) as sink, FanOutSink(columnar_sinks) as columnar_sink, ResultBatch(get_store()) as stored:
+            def write_row(item):
+                url, record = item
+                if record is not None:
+                    sink.write(record.to_csv_row())
+                    columnar_sink.write(record)
+
+            # Keeps the row order identical to game_urls
+            release = OrderedRelease(write_row)
+
+            def on_error(url, error):
+                on_game_fetch_error(url, error)
+                journal.record_error(url, error)
+                release.put(game_index[journal_key(url)], (url, None))
+                return None
+
+            def on_result(index, url, record):
+                if record.game_name is None:
+                    # Loaded, but not a game page (e.g. a rate limit or error page): retried on resume
+                    journal.record_error(url, "no game data on the page")
+                    release.put(game_index[journal_key(url)], (url, None))
+                    return
+                journal.record_done(url, record.as_row(), record.developer_url)
+                remember_developer_name(record.developer_name)
+                record_developer_url(record.developer_name, record.developer_url)
+                stored.add(snapshot_from_record(record, game_index[journal_key(url)]))
+                release.put(game_index[journal_key(url)], (url, record))
+
+            for url, record in journal.done_records():
+                index = game_index.get(journal_key(url))
+                if index is not None:
+                    release.put(index, (url, record))
+
+            # Pages are fetched on a thread pool and parsed on a process pool
+            _, fetch_stats, parse_stats = run_pipeline(
+                pending_urls,
+                fetch_game_record_page,
+                parse_game_record,
+                on_error=on_error,
+                on_result=on_result,
+                fetch_workers=self.max_workers,
+                parse_workers=self.parse_workers,
+                limiter=limiter,
+                collect=False,
+            )
+            if release.buffered:
+                # A row never arrived for some index: write what came after it rather than lose it
+                print(f"Warning: {release.buffered} rows were held back by a missing row; writing them out of order.")
+                release.flush()
+        print(fetch_stats.summary())
+        print(parse_stats.summary())
+        if journal.failed:
+            print(f"{len(journal.failed)} games failed to scrape and will be retried on resume: {journal.path}")
+
+        rows_written = main_sinks[0].rows_written
+        if rows_written == 0:
             print("No game data to write to main CSV.")
             return f"Scraping complete. No data to write."
 
+        output_file_path = main_sinks[-1].path
+        written_paths = [sink.path for sink in sinks + columnar_sinks if sink.rows_written]
+        print(f"Successfully wrote {rows_written} games to {', '.join(written_paths)}")
         return f"Scraping complete. Data written to {output_file_path}."
@@ -1,7 +1,7 @@
 from crewai.tools import BaseTool
 from typing import Type
 from pydantic import BaseModel, Field
-import ollama
+from src.appstore_data_agent.tools.llm_cache import cached_completion
 
 class DeveloperNameIdentifierInput(BaseModel):
     """Input schema for DeveloperNameIdentifierTool."""
@@ -17,8 +17,15 @@ class DeveloperNameIdentifierTool(BaseTool):
     def _run(self, app_url: str) -> str:
         prompt = f"Extract the full game developer name from the following Apple App Store URL: {app_url}. Only return the name, without any other text."
         try:
-            response = ollama.chat(model='llama2', messages=[{'role': 'user', 'content': prompt}])
-            developer_name = response['message']['content'].strip()
+            messages = [{'role': 'user', 'content': prompt}]
+
+            def ask_ollama():
+                # Only import the client when the answer is not cached yet
+                import ollama
+                return ollama.chat(model='llama2', messages=messages)['message']['content']
+
+            response = cached_completion('llama2', messages, ask_ollama)
+            developer_name = response.strip()
             print(f"Developer name extracted: {developer_name}")
             return developer_name
         except Exception as e:
@@ -1,7 +1,10 @@
 from crewai.tools import BaseTool
 from typing import Type
 from pydantic import BaseModel, Field
-from googlesearch import search
+from src.appstore_data_agent.tools.developer_url_store import (
+    record_developer_url,
+    resolve_developer_url,
+)
 
 class DeveloperURLFinderInput(BaseModel):
     """Input schema for DeveloperGameURLFinderTool."""
@@ -15,11 +18,18 @@ class DeveloperURLFinderTool(BaseTool):
     args_schema: Type[BaseModel] = DeveloperURLFinderInput
 
     def _run(self, developer_name: str) -> str:
+        # Developer pages rarely move: reuse what earlier scrapes have seen
+        known_url = resolve_developer_url(developer_name)
+        if known_url:
+            return known_url
+
+        from googlesearch import search
         query = f"{developer_name} app store developer page url"
         try:
             # Perform a Google search and get the first result
             for url in search(query, num_results=1):
                 if "apps.apple.com" in url and "/developer/" in url:
+                    record_developer_url(developer_name, url)
                     return url
             return "N/A: No App Store Developer Page URL found for this developer."
         except Exception as e:
@@ -1,7 +1,11 @@
 from crewai.tools import BaseTool
 from typing import Type
 from pydantic import BaseModel, Field
-import ollama
+from src.appstore_data_agent.tools.llm_cache import cached_completion
+from src.appstore_data_agent.tools.developer_index import (
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    get_index,
+)
 
 class DeveloperNameFuzzyIdentifierInput(BaseModel):
     """Input schema for DeveloperNameFuzzyIdentifierTool."""
@@ -10,16 +14,30 @@ class DeveloperNameFuzzyIdentifierInput(BaseModel):
 class DeveloperNameFuzzyIdentifierTool(BaseTool):
     name: str = "Developer Name Fuzzy Identifier Tool"
     description: str = (
-        "Identifies the full, correct game developer name on the Apple App Store based on an indicative or potentially misspelled name using Ollama."
+        "Identifies the full, correct game developer name on the Apple App Store based on an indicative or potentially misspelled name, using a local index of known developers and falling back to Ollama."
     )
     args_schema: Type[BaseModel] = DeveloperNameFuzzyIdentifierInput
+    # Minimum local match score before falling back to the LLM
+    confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD
 
     def _run(self, indicative_developer_name: str) -> str:
-        ollama.pull(model='llama2')
+        # Resolve locally first: a fuzzy lookup takes milliseconds, the LLM seconds
+        local_match = get_index().best_match(indicative_developer_name, self.confidence_threshold)
+        if local_match:
+            print(f"Full developer name (local index): {local_match}")
+            return local_match
+
         prompt = f"Given the indicative game developer name \"{indicative_developer_name}\", what is the most likely full and correct game developer name as it appears on the Apple App Store? Only return the full name, without any other text. If no clear match is found, return 'N/A'. I repeat only return the full name and no other text. Example: Given the indicative game developer name \"Nintenddo\", the full and correct game developer name is \"Nintendo Co., Ltd.\""
         try:
-            response = ollama.chat(model='llama2', messages=[{'role': 'user', 'content': prompt}])
-            full_developer_name = response['message']['content'].strip()
+            messages = [{'role': 'user', 'content': prompt}]
+
+            def ask_ollama():
+                # Only import and pull the model when the answer is not cached yet
+                import ollama
+                ollama.pull(model='llama2')
+                return ollama.chat(model='llama2', messages=messages)['message']['content']
+
+            full_developer_name = cached_completion('llama2', messages, ask_ollama).strip()
             print(f"Full developer name: {full_developer_name}")
             return full_developer_name
         except Exception as e:
@@ -0,0 +1,171 @@
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .analytics import ANALYTICS_OUTPUT_FILE, frame_from_games, summarize_catalog, summarize_games
+from .incremental import build_delta, refresh_games
+from .pipeline import assemble_research, locate_developer, scrape_games
+from .report import DeveloperReport, build_report, write_report
+from .tools import checkpoint, columnar_export
+from .tools.checkpoint import CrawlCheckpoint, checkpoint_path
+from .tools.developer_index import normalize_name
+from .tools.result_store import get_store, record_research
+from .tools.fetch_engine import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PARSE_WORKERS,
+    DEFAULT_PER_HOST_LIMIT,
+    HostLimiter,
+)
+
+# Batch mode: many developers in one process. Developer pages are located
+# side by side, then the games of every developer go through a single
+# fetch/parse pipeline, so the HTTP session, response cache, worker pools and
+# per-host limit are shared instead of paid again for each developer.
+
+DEFAULT_OUTPUT_DIR = "reports"
+DEFAULT_DEVELOPERS_IN_FLIGHT = 4
+# Journal of the batch's game pages, for --resume
+BATCH_JOURNAL = "batch"
+INDEX_FILE = "index.json"
+# Typed export of every game of the batch, written when pyarrow is installed
+CATALOG_FILE = "catalog.parquet"
+
+
+def read_developer_names(path: str) -> List[str]:
+    """Developer names from a file (or stdin for "-"), one per line. Blank lines and # comments are skipped."""
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, "r", encoding="utf-8") as names:
+            lines = names.read().splitlines()
+    return unique_names(line.split("#")[0].strip() for line in lines)
+
+
+def unique_names(names: Iterable[str]) -> List[str]:
+    """Drops empty names and other spellings of a name already listed, keeping the first one."""
+    seen = set()
+    unique = []
+    for name in names:
+        key = normalize_name(name)
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(name)
+    return unique
+
+
+def report_filename(developer_name: str, suffix: str = "") -> str:
+    return (re.sub(r"[^a-z0-9]+", "_", developer_name.lower()).strip("_") or "developer") + suffix + ".json"
+
+
+def write_json(path: str, data) -> None:
+    with open(path, 'w', encoding='utf-8', newline='\n') as output:
+        output.write(json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+
+
+def run_batch(
+    developer_names: Iterable[str],
+    output_dir: str = DEFAULT_OUTPUT_DIR,
+    max_games: Optional[int] = None,
+    developers_in_flight: int = DEFAULT_DEVELOPERS_IN_FLIGHT,
+    fetch_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    parse_workers: Optional[int] = DEFAULT_PARSE_WORKERS,
+    commentary: Optional[Callable[[DeveloperReport, Dict], str]] = None,
+    incremental: bool = False,
+) -> List[Dict]:
+    """
+    Writes one report per developer to output_dir, plus an index.json listing
+    them (in input order), and analytics.json comparing the developers.
+    commentary(report, catalog_summary), when given, writes each report's note;
+    it is called from this thread only, one developer at a time.
+    With incremental, games are re-crawled against the result store and a
+    <developer>_delta.json is written next to each report; otherwise game pages
+    are journaled for checkpoint's resume. With pyarrow installed, every game of the
+    batch is also exported to catalog.parquet.
+    """
+    developer_names = unique_names(developer_names)
+    limiter = HostLimiter(per_host_limit)
+    located: Dict[str, Dict] = {}
+    errors: Dict[str, str] = {}
+
+    # Stage 1: name resolution and developer catalogs
+    with ThreadPoolExecutor(max_workers=max(1, min(developers_in_flight, len(developer_names)))) as executor:
+        futures = {executor.submit(locate_developer, name, max_games, limiter): name for name in developer_names}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                developer = future.result()
+            except Exception as e:
+                print(f"Error locating developer {name}: {e}")
+                errors[name] = str(e)
+                continue
+            located[name] = developer
+
+    # Stage 2: every developer's games through one pipeline, each game once
+    game_urls = list(dict.fromkeys(
+        url for name in developer_names if name in located for url in located[name]['game_urls']
+    ))
+    page_hashes: Dict[str, str] = {}
+    if not incremental:
+        games = {record.url: record for record in scrape_games(
+            game_urls,
+            fetch_workers=fetch_workers,
+            parse_workers=parse_workers,
+            limiter=limiter,
+            journal=CrawlCheckpoint(checkpoint_path(BATCH_JOURNAL), resume=checkpoint.resume_enabled()),
+        )}
+    else:
+        games, changes, page_hashes = refresh_games(
+            game_urls,
+            get_store(),
+            fetch_workers=fetch_workers,
+            per_host_limit=per_host_limit,
+            parse_workers=parse_workers,
+        )
+
+    # Stage 3: reports, in input order
+    os.makedirs(output_dir, exist_ok=True)
+    index = []
+    for name in developer_names:
+        entry = {'input_name': name}
+        if name in errors:
+            entry['error'] = errors[name]
+            index.append(entry)
+            continue
+        developer = located[name]
+        research = assemble_research(developer, [games[url] for url in developer['game_urls'] if url in games])
+        record_research(research, page_hashes)
+        report = build_report(research)
+        if commentary is not None:
+            try:
+                report.note = commentary(report, summarize_games(research['games']))
+            except Exception as e:
+                print(f"Error writing the commentary for {name}: {e}")
+        write_report(report, os.path.join(output_dir, report_filename(name)))
+        entry.update(
+            developer_name=report.developer_name,
+            developer_url=research['developer_url'],
+            games=len(report.games),
+            report=report_filename(name),
+        )
+        if incremental:
+            delta = build_delta(
+                developer['developer_url'],
+                developer['game_urls'],
+                changes,
+                get_store(),
+                complete_listing=max_games is None,
+            )
+            write_json(os.path.join(output_dir, report_filename(name, "_delta")), dict(developer_name=report.developer_name, **delta))
+            entry['delta'] = {key: len(value) if isinstance(value, list) else value for key, value in delta.items() if key != "developer_url"}
+        index.append(entry)
+
+    catalog = [games[url] for url in game_urls if url in games]
+    write_json(os.path.join(output_dir, ANALYTICS_OUTPUT_FILE), summarize_catalog(frame_from_games(catalog)))
+    if columnar_export.available():
+        columnar_export.write_games(catalog, os.path.join(output_dir, CATALOG_FILE))
+    write_json(os.path.join(output_dir, INDEX_FILE), index)
+    return index
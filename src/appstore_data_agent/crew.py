@@ -1,7 +1,8 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from .tools.developer_url_finder import DeveloperURLFinderTool
+from .tools.developer_url_finder_tool import DeveloperURLFinderTool
 from .tools.app_store_scraper_tool import AppStoreScraperTool
+from .tools.cached_llm import CachedLLM
 from langchain_google_genai import ChatGoogleGenerativeAI
 import os
 
@@ -12,12 +13,13 @@ class AppstoreDataAgentCrew():
     def __init__(self):
         # Initialize Gemini LLM
         # Ensure GEMINI_API_KEY is set in environment
-        self.llm = ChatGoogleGenerativeAI(
+        # Answers are memoized in the LLM response cache (see tools/llm_cache.py)
+        self.llm = CachedLLM(ChatGoogleGenerativeAI(
             model="gemini-1.5-flash",
             verbose=True,
             temperature=0.5,
             google_api_key=os.getenv("GEMINI_API_KEY")
-        )
+        ))
 
     @agent
     def app_store_researcher(self) -> Agent:
@@ -59,3 +61,18 @@ class AppstoreDataAgentCrew():
             verbose=True,
         )
 
+    def report_commentary_task(self) -> Task:
+        # Not a @task: in direct mode report.json is built in code
+        # (see report.py) and the LLM only writes its "note"
+        return Task(
+            config=self.tasks_config['report_commentary_task'],
+        )
+
+    def commentary_crew(self) -> Crew:
+        """Creates a crew that only comments on an already built report, passed in as inputs"""
+        return Crew(
+            agents=[self.report_generator()],
+            tasks=[self.report_commentary_task()],
+            process=Process.sequential,
+            verbose=True,
+        )
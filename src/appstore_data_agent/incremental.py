@@ -0,0 +1,179 @@
+from typing import Dict, List, Optional, Tuple
+
+from .pipeline import assemble_research, find_developer, list_developer_games
+from .tools import http_client
+from .tools.app_identity import app_id
+from .tools.developer_index import remember_developer_name
+from .tools.developer_url_store import record_developer_url
+from .tools.fetch_engine import DEFAULT_MAX_WORKERS, DEFAULT_PARSE_WORKERS, DEFAULT_PER_HOST_LIMIT, run_pipeline
+from .tools.game_record import GameRecord
+from .tools.page_parser import parse_game_record
+from .tools.result_store import ResultStore, content_hash, get_store, record_hash, record_research, stored_record
+
+# Incremental re-crawl: every game page is still requested, but through the
+# HTTP cache (a stale entry costs a conditional GET and usually a 304), and a
+# page whose bytes match the page hash in the result store is not parsed at
+# all. A parsed page whose record matches the app's latest snapshot is not
+# reported as changed either, so markup noise does not show up in the delta.
+# The listing is diffed against the store to find new and removed apps, and
+# the outcome is summed up in a delta report.
+
+
+def fetch_changed_page(url: str, known_hash: Optional[str]) -> Tuple[Optional[bytes], Optional[str], str, str]:
+    """
+    (content, encoding, page_hash, url) of url. content is None when the page
+    is byte-identical to the known one, so it does not need to be parsed again.
+    """
+    response = http_client.get(url)
+    response.raise_for_status()
+    page_hash = content_hash(response.content)
+    if page_hash == known_hash:
+        return None, response.encoding, page_hash, url
+    return response.content, response.encoding, page_hash, url
+
+
+def parse_changed_page(
+    content: Optional[bytes],
+    encoding: Optional[str],
+    page_hash: str,
+    url: str,
+) -> Tuple[Optional[GameRecord], str]:
+    """(record, page_hash) of a page fetch_changed_page returned; the record is None for unchanged pages."""
+    if content is None:
+        return None, page_hash
+    return parse_game_record(content, from_encoding=encoding, url=url), page_hash
+
+
+def _field_changes(old: Dict, new: Dict) -> Dict[str, Dict]:
+    """Changed fields between two typed record rows."""
+    return {
+        field: {"old": old.get(field), "new": new.get(field)}
+        for field in sorted(set(old) | set(new))
+        if old.get(field) != new.get(field)
+    }
+
+
+def refresh_games(
+    game_urls: List[str],
+    store: ResultStore,
+    fetch_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    parse_workers: Optional[int] = DEFAULT_PARSE_WORKERS,
+) -> Tuple[Dict[str, GameRecord], Dict[str, Dict], Dict[str, str]]:
+    """
+    Re-scrapes game_urls against their latest snapshots in store. Returns
+    (records by url, change by url, page hash by url), where a change has a
+    "status" of new, changed, unchanged or failed. A game that failed to load,
+    or whose page held no game data, keeps its last known record, if any.
+    Store the records with record_research(research, page_hashes).
+    """
+    known_snapshots = {url: store.latest_snapshot(url) for url in game_urls}
+    results, fetch_stats, parse_stats = run_pipeline(
+        game_urls,
+        lambda url: fetch_changed_page(url, (known_snapshots[url] or {}).get("page_hash")),
+        parse_changed_page,
+        on_error=lambda url, error: error,
+        fetch_workers=fetch_workers,
+        per_host_limit=per_host_limit,
+        parse_workers=parse_workers,
+    )
+    print(fetch_stats.summary())
+    print(parse_stats.summary())
+
+    games = {}
+    changes = {}
+    page_hashes = {}
+    for url, result in zip(game_urls, results):
+        known = known_snapshots[url]
+        if not isinstance(result, Exception) and result[0] is not None and result[0].game_name is None:
+            # Loaded, but not a game page (e.g. a rate limit or error page): keep the snapshot
+            result = ValueError("no game data on the page")
+        if isinstance(result, Exception):
+            print(f"Error scraping URL {url}: {result}")
+            changes[url] = {"status": "failed", "error": str(result)}
+            if known:
+                games[url] = stored_record(known)
+            continue
+
+        record, page_hash = result
+        if record is None:
+            # Byte-identical page: nothing to parse
+            record = stored_record(known)
+            status = {"status": "unchanged"}
+        else:
+            if known is None:
+                status = {"status": "new"}
+            elif record_hash(record.as_row()) == known["record_hash"]:
+                status = {"status": "unchanged"}
+            else:
+                status = {"status": "changed", "fields": _field_changes(stored_record(known).as_row(), record.as_row())}
+            if record.developer_url is not None:
+                remember_developer_name(record.developer_name)
+                record_developer_url(record.developer_name, record.developer_url)
+        games[url] = record
+        changes[url] = status
+        page_hashes[url] = page_hash
+    return games, changes, page_hashes
+
+
+def build_delta(
+    developer_url: str,
+    game_urls: List[str],
+    changes: Dict[str, Dict],
+    store: ResultStore,
+    complete_listing: bool = True,
+) -> Dict:
+    """
+    Delta report of one developer's catalog, once its games are recorded in
+    store. With a complete listing, apps that are no longer listed are
+    reported as removed and marked as such in the store.
+    """
+    delta = {"developer_url": developer_url, "new": [], "changed": [], "removed": [], "unchanged": 0, "failed": []}
+    for url in game_urls:
+        change = changes[url]
+        known = store.latest_snapshot(url)
+        title = known["name"] if known else None
+        if change["status"] == "unchanged":
+            delta["unchanged"] += 1
+        elif change["status"] == "failed":
+            delta["failed"].append({"url": url, "error": change["error"]})
+        elif change["status"] == "new":
+            delta["new"].append({"url": url, "title": title})
+        else:
+            delta["changed"].append({"url": url, "title": title, "fields": change["fields"]})
+
+    if complete_listing:
+        listed = {app_id(url) for url in game_urls}
+        for known in sorted(store.latest_snapshots(developer_url), key=lambda known: known["url"]):
+            if app_id(known["url"]) not in listed:
+                delta["removed"].append({"url": known["url"], "title": known["name"]})
+                store.unlist(known["url"])
+    return delta
+
+
+def recrawl_developer(
+    developer_name: str,
+    max_games: Optional[int] = None,
+    fetch_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    parse_workers: Optional[int] = DEFAULT_PARSE_WORKERS,
+) -> Tuple[Dict, Dict]:
+    """
+    Incremental research_developer: returns (research, delta) and records the
+    research in the result store.
+    """
+    store = get_store()
+    developer = find_developer(developer_name)
+    developer_url = developer['developer_url']
+    game_urls = list(list_developer_games(developer_url, max_games))
+    games, changes, page_hashes = refresh_games(
+        game_urls,
+        store,
+        fetch_workers=fetch_workers,
+        per_host_limit=per_host_limit,
+        parse_workers=parse_workers,
+    )
+    research = assemble_research(developer, [games[url] for url in game_urls if url in games])
+    record_research(research, page_hashes)
+    delta = build_delta(developer_url, game_urls, changes, store, complete_listing=max_games is None)
+    return research, dict(developer_name=research['developer_name'], **delta)
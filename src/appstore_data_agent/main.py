@@ -1,27 +1,233 @@
 #!/usr/bin/env python
+import argparse
+import json
 import sys
-from appstore_data_agent.crew import AppstoreDataAgentCrew
+# Only the settings modules are imported up front. The scraping pipeline,
+# pandas and crewAI are imported on the code paths that use them, so --help,
+# replays and short batch runs do not pay for what they never call (see
+# tests/test_startup.py for the import budget).
+from appstore_data_agent.tools import checkpoint, http_cache, llm_cache, profiler, rate_limiter
+
+DELTA_OUTPUT_FILE = "report_delta.json"
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="appstore_data_agent",
+        description="Research an App Store game developer and generate a JSON report.",
+    )
+    # Example input: 'Voodo' or 'Nintendo'
+    parser.add_argument("developer_name", nargs="?", default="Voodoo", help="Indicative developer name.")
+    parser.add_argument(
+        "--cache-mode",
+        choices=http_cache.CACHE_MODES,
+        default="default",
+        help="HTTP response cache behaviour (default: serve fresh entries, revalidate stale ones).",
+    )
+    parser.add_argument(
+        "--offline",
+        dest="cache_mode",
+        action="store_const",
+        const="offline",
+        help="Replay from the HTTP response cache only, without touching the network.",
+    )
+    parser.add_argument("--cache-dir", default=None, help="Directory for the HTTP response cache.")
+    parser.add_argument(
+        "--llm-cache-mode",
+        choices=llm_cache.CACHE_MODES,
+        default="default",
+        help="LLM response cache behaviour: record answers on every call, replay them without calling the model, or off.",
+    )
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=None,
+        help="Starting request rate per host (default: %s). It adapts to 429s, 503s and Retry-After." % rate_limiter.DEFAULT_RATE,
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted crawl: skip games already in the checkpoint journal and retry failed ones.",
+    )
+    parser.add_argument(
+        "--direct",
+        action="store_true",
+        help="Build the report with plain code instead of the agents; the LLM only adds a short commentary.",
+    )
+    parser.add_argument(
+        "--no-llm",
+        action="store_true",
+        help="Direct mode without any LLM call: report.json is built from the scraped data alone.",
+    )
+    parser.add_argument(
+        "--max-games",
+        type=int,
+        default=None,
+        help="In direct mode, only scrape the first N games listed on the developer page.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="In direct and batch mode, only re-parse games whose page changed since the last run, and write a delta report.",
+    )
+    parser.add_argument(
+        "--from-store",
+        action="store_true",
+        help="In direct mode, build the report from the games stored by earlier runs instead of crawling.",
+    )
+    parser.add_argument(
+        "--results-db",
+        default=None,
+        help="SQLite database every scrape is stored in (default: .cache/results.sqlite3).",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="FILE",
+        help="Write a JSON lines run profile (HTTP, parsing, LLM and tool timings) and print a summary table "
+             "at the end. FILE defaults to .cache/profiles/run-<time>.jsonl.",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        default=None,
+        help="Direct mode for every developer listed in FILE (one per line, '-' for stdin).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="Where --batch writes one report per developer and index.json (default: reports).",
+    )
+    parser.add_argument(
+        "--developers-in-flight",
+        type=int,
+        default=None,
+        help="How many developer pages --batch looks up at the same time (default: 4).",
+    )
+    return parser.parse_args(argv)
+
+def write_commentary(crew, report, catalog_summary):
+    # The LLM only sees the computed statistics, never the per-game rows
+    inputs = {
+        'developer_name': report.developer_name,
+        'catalog_summary': json.dumps(catalog_summary, ensure_ascii=False),
+    }
+    return str(crew.commentary_crew().kickoff(inputs=inputs)).strip()
+
+def run_direct(args):
+    """
+    Run the research step as code and build report.json from its data. Unless
+    --no-llm is given, the LLM adds a commentary note to the report.
+    """
+    from appstore_data_agent.pipeline import research_developer, stored_research
+    from appstore_data_agent.report import build_report, render_report, write_report
+
+    if args.from_store:
+        research = stored_research(args.developer_name)
+    elif args.incremental:
+        from appstore_data_agent.batch import write_json
+        from appstore_data_agent.incremental import recrawl_developer
+        research, delta = recrawl_developer(args.developer_name, max_games=args.max_games)
+        write_json(DELTA_OUTPUT_FILE, delta)
+    else:
+        research = research_developer(args.developer_name, max_games=args.max_games)
+    report = build_report(research)
+    if not args.no_llm:
+        from appstore_data_agent.analytics import summarize_games
+        from appstore_data_agent.crew import AppstoreDataAgentCrew
+        report.note = write_commentary(AppstoreDataAgentCrew(), report, summarize_games(research['games']))
+    write_report(report)
+    return render_report(report)
+
+def run_batch(args):
+    """
+    Run direct mode for a list of developers, sharing the fetch pipeline and the LLM client.
+    """
+    from appstore_data_agent import batch
+
+    commentary = None
+    if not args.no_llm:
+        from appstore_data_agent.crew import AppstoreDataAgentCrew
+        crew = AppstoreDataAgentCrew()
+        commentary = lambda report, catalog_summary: write_commentary(crew, report, catalog_summary)
+    index = batch.run_batch(
+        batch.read_developer_names(args.batch),
+        output_dir=args.output_dir if args.output_dir is not None else batch.DEFAULT_OUTPUT_DIR,
+        max_games=args.max_games,
+        developers_in_flight=args.developers_in_flight or batch.DEFAULT_DEVELOPERS_IN_FLIGHT,
+        commentary=commentary,
+        incremental=args.incremental,
+    )
+    return json.dumps(index, indent=2, ensure_ascii=False)
+
+def finish_profile(profile):
+    """Adds the cache and rate limiter counters to the run profile, closes it and prints its summary."""
+    responses = http_cache.get_cache()
+    if responses is not None:
+        profile.count("http_cache.hits", responses.hits)
+        profile.count("http_cache.misses", responses.misses)
+        profile.count("http_cache.revalidated", responses.revalidated)
+    answers = llm_cache.get_cache()
+    if answers is not None:
+        profile.count("llm_cache.hits", answers.hits)
+        profile.count("llm_cache.misses", answers.misses)
+    for host, stats in rate_limiter.get_limiter().stats().items():
+        profile.count(f"rate_limiter.{host}.throttled", stats["throttled"])
+        profile.count(f"rate_limiter.{host}.circuit_opened", stats["circuit_opened"])
+    profile.close()
+    print("\n## Run profile ##\n")
+    print(profile.summary_table())
+    if profile.path:
+        print(f"Run profile written to {profile.path}")
 
 def run():
     """
     Run the crew.
     """
-    # Example input: 'Voodo' or 'Nintendo'
-    developer_name = sys.argv[1] if len(sys.argv) > 1 else 'Voodoo'
-    
+    args = parse_args(sys.argv[1:])
+    from appstore_data_agent.tools import result_store
+    direct = args.direct or args.no_llm or args.from_store
+    # The crew path never loads the scraping pipeline (and its bs4 and search imports)
+    research_errors = ()
+    if args.batch or direct:
+        from appstore_data_agent.pipeline import ResearchError
+        research_errors = (ResearchError,)
+
+    http_cache.configure(mode=args.cache_mode, directory=args.cache_dir)
+    checkpoint.configure(resume=args.resume)
+    llm_cache.configure(mode=args.llm_cache_mode)
+    result_store.configure(db_path=args.results_db)
+    rate_limiter.configure(rate=args.requests_per_second)
+    profile = None
+    if args.profile is not None:
+        profile = profiler.configure(path=args.profile or profiler.default_profile_path())
+        if not args.no_llm:
+            profiler.watch_crew_events(profile)
+
     inputs = {
-        'developer_name': developer_name
+        'developer_name': args.developer_name
     }
-    
+
     try:
-        result = AppstoreDataAgentCrew().crew().kickoff(inputs=inputs)
+        if args.batch:
+            result = run_batch(args)
+        elif direct:
+            result = run_direct(args)
+        else:
+            from appstore_data_agent.crew import AppstoreDataAgentCrew
+            result = AppstoreDataAgentCrew().crew().kickoff(inputs=inputs)
         print("\n\n########################")
         print("## Final Report JSON: ##")
         print("########################\n")
         print(result)
+    except research_errors as e:
+        print(f"An error occurred while researching the developer: {e}")
     except Exception as e:
         print(f"An error occurred while running the crew: {e}")
+    finally:
+        if profile is not None:
+            finish_profile(profile)
 
 if __name__ == "__main__":
     run()
-
@@ -0,0 +1,199 @@
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .tools import checkpoint
+from .tools.catalog_crawler import crawl_catalog, fetch_page
+from .tools.checkpoint import CrawlCheckpoint, checkpoint_path, journal_key
+from .tools.developer_index import get_index, remember_developer_name
+from .tools.developer_url_finder import find_developer_url
+from .tools.developer_url_store import record_developer_url, resolve_developer_url
+from .tools.fetch_engine import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PARSE_WORKERS,
+    DEFAULT_PER_HOST_LIMIT,
+    HostLimiter,
+    run_pipeline,
+)
+from .tools.game_record import GameRecord
+from .tools.page_parser import parse_game_record
+from .tools.result_store import get_store, record_research
+
+# The research task as plain code: resolve the developer name, find the
+# developer page, list its games and scrape each game page. No LLM turns are
+# involved, so the only model call left in a direct run is the report step.
+
+
+class ResearchError(Exception):
+    """Raised when the direct research pipeline cannot get past the developer page."""
+
+
+def resolve_developer_name(developer_name: str) -> str:
+    """Closest known developer name, or developer_name itself when nothing is close enough."""
+    return get_index().best_match(developer_name) or developer_name
+
+
+def fetch_game_page(url: str):
+    # The URL goes along to the parse worker so the record carries its app ID
+    return fetch_page(url) + (url,)
+
+
+def list_developer_games(
+    developer_url: str,
+    max_games: Optional[int] = None,
+    limiter: Optional[HostLimiter] = None,
+) -> Iterator[str]:
+    """App page URLs of a developer's whole catalog, yielded while the listing pages are crawled."""
+    return islice(crawl_catalog(developer_url, limiter=limiter), max_games)
+
+
+def scrape_games(
+    game_urls: Iterable[str],
+    fetch_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    parse_workers: Optional[int] = DEFAULT_PARSE_WORKERS,
+    limiter: Optional[HostLimiter] = None,
+    journal: Optional[CrawlCheckpoint] = None,
+) -> List[GameRecord]:
+    """
+    Records of the given game pages in input order. Pages that fail to load
+    are left out. game_urls may be a stream, e.g. list_developer_games, in
+    which case pass the crawl's limiter so both share one per-host limit.
+    With a journal, every page is journaled as it finishes, and pages the
+    journal already holds as done are taken from it instead of fetched.
+    """
+    failures = []
+    parsed = {}
+    positions = []  # input position of each fetched URL, by pipeline index
+    journaled = {}  # input position -> journal key, for pages done in an earlier run
+
+    def pending_urls() -> Iterator[str]:
+        for position, url in enumerate(game_urls):
+            if journal is not None and journal.is_done(url):
+                journaled[position] = journal_key(url)
+                continue
+            positions.append(position)
+            yield url
+
+    def on_error(url, error):
+        failures.append((url, error))
+        if journal is not None:
+            journal.record_error(url, error)
+
+    def on_result(index, url, record):
+        parsed[positions[index]] = (url, record)
+        if journal is None:
+            return
+        if record.game_name is None:
+            journal.record_error(url, "no game data on the page")
+        else:
+            journal.record_done(url, record.as_row(), record.developer_url)
+
+    _, fetch_stats, parse_stats = run_pipeline(
+        pending_urls(),
+        fetch_game_page,
+        parse_game_record,
+        on_error=on_error,
+        on_result=on_result,
+        fetch_workers=fetch_workers,
+        per_host_limit=per_host_limit,
+        parse_workers=parse_workers,
+        collect=False,
+        limiter=limiter,
+    )
+    print(fetch_stats.summary())
+    print(parse_stats.summary())
+    for url, error in failures:
+        print(f"Error scraping URL {url}: {error}")
+
+    if journaled:
+        print(f"Resuming: {len(journaled)} games taken from {journal.path}")
+        wanted = {key: position for position, key in journaled.items()}
+        for url, record in journal.done_records():
+            position = wanted.get(journal_key(url))
+            if position is not None:
+                parsed[position] = (url, record)
+
+    games = []
+    for position in sorted(parsed):
+        url, record = parsed[position]
+        if record.game_name is None:
+            # Loaded, but not a game page (e.g. a rate limit or error page)
+            print(f"Error scraping URL {url}: no game data on the page")
+            continue
+        remember_developer_name(record.developer_name)
+        record_developer_url(record.developer_name, record.developer_url)
+        games.append(record)
+    return games
+
+
+def find_developer(developer_name: str) -> Dict:
+    """Resolves developer_name and its developer page: {"developer_name", "developer_url"}"""
+    resolved_name = resolve_developer_name(developer_name)
+    developer_url = find_developer_url(resolved_name)
+    if not developer_url:
+        raise ResearchError(f"No App Store developer page found for '{resolved_name}'")
+    print(f"Developer page for {resolved_name}: {developer_url}")
+    return {'developer_name': resolved_name, 'developer_url': developer_url}
+
+
+def locate_developer(
+    developer_name: str,
+    max_games: Optional[int] = None,
+    limiter: Optional[HostLimiter] = None,
+) -> Dict:
+    """find_developer plus the full list of its games: {"developer_name", "developer_url", "game_urls"}"""
+    developer = find_developer(developer_name)
+    developer['game_urls'] = list(list_developer_games(developer['developer_url'], max_games, limiter=limiter))
+    return developer
+
+
+def assemble_research(developer: Dict, games: List[GameRecord]) -> Dict:
+    """The research data for a located developer and its scraped games."""
+    # Game pages carry the developer's registered name
+    official_names = [game.developer_name for game in games if game.developer_name]
+    return {
+        'developer_name': official_names[0] if official_names else developer['developer_name'],
+        'developer_url': developer['developer_url'],
+        'games': games,
+    }
+
+
+def research_developer(
+    developer_name: str,
+    max_games: Optional[int] = None,
+    fetch_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    parse_workers: Optional[int] = DEFAULT_PARSE_WORKERS,
+) -> Dict:
+    """
+    Collects the research task's data for developer_name:
+    {"developer_name", "developer_url", "games": [GameRecord, ...]}
+    """
+    developer = find_developer(developer_name)
+    # Game pages are fetched while the catalog is still being crawled, both within one per-host limit
+    limiter = HostLimiter(per_host_limit)
+    games = scrape_games(
+        list_developer_games(developer['developer_url'], max_games, limiter=limiter),
+        fetch_workers=fetch_workers,
+        parse_workers=parse_workers,
+        limiter=limiter,
+        journal=CrawlCheckpoint(checkpoint_path(developer['developer_name']), resume=checkpoint.resume_enabled()),
+    )
+    research = assemble_research(developer, games)
+    record_research(research)
+    return research
+
+
+def stored_research(developer_name: str) -> Dict:
+    """
+    research_developer's data rebuilt from the result store, without any
+    request: the developer page must already be known and its games stored.
+    """
+    resolved_name = resolve_developer_name(developer_name)
+    developer_url = resolve_developer_url(resolved_name)
+    if not developer_url:
+        raise ResearchError(f"No known App Store developer page for '{resolved_name}'")
+    research = get_store().research(developer_url)
+    if research is None:
+        raise ResearchError(f"No stored games for {developer_url}")
+    return research
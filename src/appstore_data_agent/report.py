@@ -0,0 +1,116 @@
+import json
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from .tools.game_record import GameRecord, format_price
+
+# Builds the developer report (the template in config/tasks.yaml, see
+# reporting_task) directly from the direct pipeline's research data. Every
+# field comes from the GameRecords of the scraped pages, so the same research
+# data always gives the same report.json, byte for byte. The only free text is the optional
+# "note", which may be written by the LLM.
+
+REPORT_OUTPUT_FILE = "report.json"
+NOT_AVAILABLE = "N/A"
+
+
+class ReportModel(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+class Pricing(ReportModel):
+    is_free_to_play: bool
+    price_usd: str
+
+
+class GamekitIntegration(ReportModel):
+    leaderboards: str
+    achievements: str
+
+
+class ContentDescription(ReportModel):
+    apple_age_rating: str
+    violence: str
+    nudity_sexual_content: str
+    other_content_warnings: str
+
+
+class GameReport(ReportModel):
+    game_name: str
+    app_store_url: str
+    rating_score: str
+    number_of_ratings: str
+    pricing: Pricing
+    gamekit_integration: GamekitIntegration
+    content_description: ContentDescription
+
+
+class DeveloperReport(ReportModel):
+    developer_name: str
+    note: Optional[str] = None
+    games: List[GameReport]
+
+
+def _pricing(game: GameRecord) -> Pricing:
+    price = format_price(game.price_cents)
+    if game.in_app_purchases:
+        price = f"{price} (Offers In-App Purchases)"
+    return Pricing(is_free_to_play=bool(game.is_free), price_usd=price)
+
+
+def _yes_no(flag: Optional[bool]) -> str:
+    return "Yes" if flag else "No"
+
+
+def _content_description(game: GameRecord) -> ContentDescription:
+    descriptors = game.content_warnings.split("; ") if game.content_warnings else []
+    violence = [d for d in descriptors if "Violence" in d]
+    nudity = [d for d in descriptors if "Nudity" in d or "Sexual" in d]
+    other = [d for d in descriptors if d not in violence and d not in nudity]
+    return ContentDescription(
+        apple_age_rating=NOT_AVAILABLE if game.age_rating is None else f"{game.age_rating}+",
+        violence="; ".join(violence) or "None",
+        nudity_sexual_content="; ".join(nudity) or "None",
+        other_content_warnings="; ".join(other) or "None",
+    )
+
+
+def build_game_report(game: GameRecord) -> GameReport:
+    """Maps one game of pipeline.research_developer's output onto the report template."""
+    return GameReport(
+        game_name=game.game_name or NOT_AVAILABLE,
+        app_store_url=game.url,
+        rating_score=NOT_AVAILABLE if game.rating is None else f"{game.rating:.1f}",
+        number_of_ratings=NOT_AVAILABLE if game.rating_count is None else str(game.rating_count),
+        pricing=_pricing(game),
+        gamekit_integration=GamekitIntegration(
+            leaderboards=_yes_no(game.leaderboards),
+            achievements=_yes_no(game.achievements),
+        ),
+        content_description=_content_description(game),
+    )
+
+
+def build_report(research: Dict, note: Optional[str] = None) -> DeveloperReport:
+    """Developer report for the research data collected by pipeline.research_developer."""
+    return DeveloperReport(
+        developer_name=research["developer_name"],
+        note=note,
+        games=[build_game_report(game) for game in research["games"]],
+    )
+
+
+def validate_report(data: Dict) -> DeveloperReport:
+    """Checks a report (e.g. one written by the LLM) against the template. Raises pydantic.ValidationError."""
+    return DeveloperReport.model_validate(data)
+
+
+def render_report(report: DeveloperReport) -> str:
+    return json.dumps(report.model_dump(exclude_none=True), indent=2, ensure_ascii=False) + "\n"
+
+
+def write_report(report: DeveloperReport, path: str = REPORT_OUTPUT_FILE) -> str:
+    with open(path, 'w', encoding='utf-8', newline='\n') as output:
+        output.write(render_report(report))
+    return path
@@ -0,0 +1,92 @@
+import re
+import threading
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+# One identity per App Store app, whatever URL it was found under. The same
+# app shows up with different slugs, storefronts (/us/ vs /gb/), query strings
+# and trailing paths; its numeric ID is the only stable part.
+
+DEFAULT_STOREFRONT = "us"
+
+_APP_URL_PATTERN = re.compile(
+    r"^(?:https?://[^/]+)?(?:/(?P<storefront>[a-z]{2}))?/app/(?:(?P<slug>[^/?#]+)/)?id(?P<id>\d+)",
+    re.IGNORECASE,
+)
+
+
+class AppIdentity(NamedTuple):
+    app_id: int
+    storefront: str
+    slug: Optional[str]
+
+    @property
+    def url(self) -> str:
+        """Canonical app page URL: no query string, fragment or trailing path."""
+        slug = f"{self.slug}/" if self.slug else ""
+        return f"https://apps.apple.com/{self.storefront}/app/{slug}id{self.app_id}"
+
+
+def parse_app_url(url: str) -> Optional[AppIdentity]:
+    """Identity of an App Store app page URL, or None for any other URL."""
+    if not url:
+        return None
+    match = _APP_URL_PATTERN.match(url.strip())
+    if not match:
+        return None
+    return AppIdentity(
+        int(match.group("id")),
+        (match.group("storefront") or DEFAULT_STOREFRONT).lower(),
+        match.group("slug"),
+    )
+
+
+def app_id(url: str) -> Optional[str]:
+    """Numeric App Store ID of an app page URL."""
+    identity = parse_app_url(url)
+    return str(identity.app_id) if identity else None
+
+
+def canonical_app_url(url: str) -> Optional[str]:
+    identity = parse_app_url(url)
+    return identity.url if identity else None
+
+
+class SeenApps:
+    """
+    Set of app IDs already handed out, kept as integers rather than URL strings.
+    Share one between the collectors of a crawl (catalog pages, story pages)
+    so each app is fetched once.
+    """
+
+    def __init__(self):
+        self._ids = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, url: str) -> bool:
+        identity = parse_app_url(url)
+        return identity is not None and identity.app_id in self._ids
+
+    def add(self, url: str) -> bool:
+        """Adds the app behind url. Returns False if it was already seen or url is not an app page."""
+        identity = parse_app_url(url)
+        if identity is None:
+            return False
+        with self._lock:
+            if identity.app_id in self._ids:
+                return False
+            self._ids.add(identity.app_id)
+        return True
+
+
+def unique_app_urls(urls: Iterable[str], seen: Optional[SeenApps] = None) -> Iterator[str]:
+    """
+    Canonical URLs of the apps in urls, each app once, in input order.
+    Links that are not app pages are dropped.
+    """
+    seen = SeenApps() if seen is None else seen
+    for url in urls:
+        if seen.add(url):
+            yield canonical_app_url(url)
@@ -0,0 +1,66 @@
+from typing import Any, Dict, List, Optional
+
+from crewai.llms.base_llm import BaseLLM
+from crewai.utilities.llm_utils import create_llm
+
+from . import llm_cache, profiler
+
+
+class CachedLLM(BaseLLM):
+    """
+    crewAI LLM that answers repeated prompts from the LLM response cache and
+    only forwards new ones to the wrapped model.
+    """
+
+    def __init__(self, llm: Any):
+        llm = create_llm(llm)
+        super().__init__(model=llm.model, temperature=llm.temperature)
+        self._llm = llm
+
+    def _stop_words(self) -> List[str]:
+        return list(getattr(self, "stop_sequences", None) or self.stop or [])
+
+    def _cache_params(self, tools: Optional[List[Dict]]) -> Dict[str, Any]:
+        tool_names = sorted(
+            str(tool.get("function", tool).get("name")) if isinstance(tool, dict) else str(tool)
+            for tool in tools or []
+        )
+        return {
+            "temperature": self.temperature,
+            "max_tokens": getattr(self._llm, "max_tokens", None),
+            "stop": sorted(self._stop_words()) or None,
+            "tools": tool_names or None,
+        }
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        # The agent executor sets its stop words on this wrapper, not on the wrapped model
+        self._llm.stop = self._stop_words()
+
+        task = kwargs.get("from_task")
+        with profiler.span("llm.call", model=self.model, task=getattr(task, "name", None), cached=True) as span:
+            def complete():
+                usage = self._llm.get_token_usage_summary()
+                span["cached"] = False
+                try:
+                    return self._llm.call(
+                        messages,
+                        tools=tools,
+                        callbacks=callbacks,
+                        available_functions=available_functions,
+                        **kwargs,
+                    )
+                finally:
+                    used = self._llm.get_token_usage_summary()
+                    span["prompt_tokens"] = used.prompt_tokens - usage.prompt_tokens
+                    span["completion_tokens"] = used.completion_tokens - usage.completion_tokens
+
+            return llm_cache.cached_completion(self.model, messages, complete, **self._cache_params(tools))
+
+    def supports_function_calling(self) -> bool:
+        return self._llm.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self._llm.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self._llm.get_context_window_size()
@@ -0,0 +1,115 @@
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+import requests
+
+from . import http_client
+from .app_identity import SeenApps, canonical_app_url
+from .fetch_engine import DEFAULT_MAX_WORKERS, DEFAULT_PER_HOST_LIMIT, HostLimiter
+from .http_cache import normalize_url
+from .page_parser import parse_links
+
+# Walks a developer's whole catalog. The first developer page only lists a
+# few apps per section; the rest sit behind "See All" (?see-all=...) and paged
+# listings of the same developer. Listing pages are fetched concurrently and
+# every app is yielded as soon as the page listing it has been parsed, so the
+# game detail stage can start before the listing crawl is over.
+
+# Upper bound on listing pages per developer, in case a site loops its pagination
+DEFAULT_MAX_CATALOG_PAGES = 50
+
+_DEVELOPER_ID_PATTERN = re.compile(r"/developer/(?:[^/?#]+/)?id(\d+)")
+
+
+def developer_id(url: str) -> Optional[str]:
+    match = _DEVELOPER_ID_PATTERN.search(url)
+    return match.group(1) if match else None
+
+
+def fetch_page(url: str):
+    response = http_client.get(url)
+    response.raise_for_status()
+    return response.content, response.encoding
+
+
+def parse_catalog_page(html, page_url: str, from_encoding: Optional[str] = None) -> Tuple[List[str], List[str]]:
+    """
+    (canonical app page URLs, further listing pages of the same developer)
+    linked from a developer listing page, in page order.
+    """
+    owner = developer_id(page_url)
+    app_links = []
+    listing_links = []
+    for href in parse_links(html, from_encoding=from_encoding):
+        url = urljoin(page_url, href).split("#")[0]
+        app_url = canonical_app_url(url)
+        if app_url:
+            app_links.append(app_url)
+        elif owner and developer_id(url) == owner and urlsplit(url).query:
+            # "See All" sections and further pages of the same developer
+            listing_links.append(url)
+    return app_links, listing_links
+
+
+def crawl_catalog(
+    developer_url: str,
+    fetch: Callable[[str], Tuple[bytes, Optional[str]]] = fetch_page,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    max_pages: int = DEFAULT_MAX_CATALOG_PAGES,
+    limiter: Optional[HostLimiter] = None,
+    seen: Optional[SeenApps] = None,
+) -> Iterator[str]:
+    """
+    Yields the app page URLs of every app listed on developer_url and the
+    listing pages it links to, each app (by numeric ID) once, in page order. Errors on the
+    developer page itself are raised; a failed listing page is skipped.
+    Crawls running side by side can share one limiter; apps already in seen
+    (e.g. from another listing) are not yielded again.
+    """
+    limiter = limiter or HostLimiter(per_host_limit)
+    seen_pages = {normalize_url(developer_url)}
+    seen_apps = SeenApps() if seen is None else seen
+
+    def load(url: str):
+        with limiter.slot(url):
+            payload = fetch(url)
+        return parse_catalog_page(payload[0], url, from_encoding=payload[1])
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    # Pages are released in the order they were discovered, so the app order
+    # is the same from run to run whichever page finishes first
+    finished = {}
+    next_page = 0
+    try:
+        pending = {executor.submit(load, developer_url): (0, developer_url)}
+        page_count = 1
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                page_number, page_url = pending.pop(future)
+                try:
+                    app_links, listing_links = future.result()
+                except requests.exceptions.RequestException as e:
+                    if page_number == 0:
+                        raise
+                    print(f"Error fetching catalog page {page_url}: {e}")
+                    app_links, listing_links = [], []
+
+                for listing_url in listing_links:
+                    key = normalize_url(listing_url)
+                    if key not in seen_pages and len(seen_pages) < max_pages:
+                        seen_pages.add(key)
+                        pending[executor.submit(load, listing_url)] = (page_count, listing_url)
+                        page_count += 1
+                finished[page_number] = app_links
+
+            while next_page in finished:
+                for url in finished.pop(next_page):
+                    if seen_apps.add(url):
+                        yield url
+                next_page += 1
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
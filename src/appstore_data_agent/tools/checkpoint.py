@@ -0,0 +1,141 @@
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .app_identity import app_id
+from .game_record import GameRecord, record_from_details
+
+# Append-only JSON-lines journal of a developer crawl. Every finished game page
+# is written as soon as it is parsed, so a crawl that dies halfway can resume
+# from the journal instead of starting over:
+#   {"key": "id123", "url": "...", "status": "done", "details": {...}, "developer_url": "..."}
+#   {"key": "id456", "url": "...", "status": "error", "error": "..."}
+# Later lines win, so a page that failed and then succeeded on retry is done.
+
+DEFAULT_CHECKPOINT_DIR = os.path.join(".cache", "checkpoints")
+
+_settings = {
+    "directory": DEFAULT_CHECKPOINT_DIR,
+    "resume": False,
+}
+
+
+def configure(directory: Optional[str] = None, resume: Optional[bool] = None) -> None:
+    """Updates the default checkpoint directory and resume behaviour."""
+    if directory is not None:
+        _settings["directory"] = directory
+    if resume is not None:
+        _settings["resume"] = resume
+
+
+def resume_enabled() -> bool:
+    return _settings["resume"]
+
+
+def journal_key(url: str) -> str:
+    """Identifies a game page by its numeric App Store ID, falling back to the URL."""
+    numeric_id = app_id(url)
+    return f"id{numeric_id}" if numeric_id else url.split("?")[0]
+
+
+def checkpoint_path(name: str, directory: Optional[str] = None) -> str:
+    safe_name = re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("._-") or "crawl"
+    return os.path.join(directory or _settings["directory"], f"{safe_name}.jsonl")
+
+
+class CrawlCheckpoint:
+    """Journal of finished and failed game pages for one crawl."""
+
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self.done: Dict[str, str] = {}
+        self.failed: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if resume:
+            self._load()
+        else:
+            # A fresh crawl starts a fresh journal
+            open(path, "w", encoding="utf-8").close()
+
+    def _records(self) -> Iterator[Dict]:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # Torn last line from a crash mid-write
+                    continue
+
+    def _load(self) -> None:
+        for record in self._records():
+            self._apply(record)
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            with open(self.path, "rb") as journal:
+                journal.seek(-1, os.SEEK_END)
+                torn = journal.read(1) != b"\n"
+            if torn:
+                # Terminate the torn line so the next record starts on its own line
+                with open(self.path, "a", encoding="utf-8") as journal:
+                    journal.write("\n")
+
+    def _apply(self, record: Dict) -> None:
+        # Only keys and URLs are kept in memory; scraped details stay on disk
+        key = record["key"]
+        if record["status"] == "done":
+            self.done[key] = record["url"]
+            self.failed.pop(key, None)
+        elif key not in self.done:
+            self.failed[key] = {"url": record["url"], "error": record.get("error")}
+
+    def _append(self, record: Dict) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as journal:
+                journal.write(line)
+            self._apply(record)
+
+    def record_done(self, url: str, details: Dict, developer_url: Optional[str]) -> None:
+        self._append({
+            "key": journal_key(url),
+            "url": url,
+            "status": "done",
+            "finished_at": time.time(),
+            "details": details,
+            "developer_url": developer_url,
+        })
+
+    def record_error(self, url: str, error: Exception) -> None:
+        self._append({
+            "key": journal_key(url),
+            "url": url,
+            "status": "error",
+            "finished_at": time.time(),
+            "error": str(error),
+        })
+
+    def is_done(self, url: str) -> bool:
+        return journal_key(url) in self.done
+
+    def pending(self, urls: Iterable[str]) -> List[str]:
+        """URLs that still need to be fetched: never attempted, or failed last time."""
+        return [url for url in urls if not self.is_done(url)]
+
+    def done_results(self) -> Iterator[Tuple[str, Dict, Optional[str]]]:
+        """Streams (url, details, developer_url) for every finished page, in journal order."""
+        for record in self._records():
+            if record["status"] == "done" and self.done.get(record["key"]) == record["url"]:
+                yield record["url"], record["details"], record.get("developer_url")
+
+    def done_records(self) -> Iterator[Tuple[str, GameRecord]]:
+        """done_results as (url, GameRecord); journals written before records held CSV rows."""
+        for url, details, developer_url in self.done_results():
+            if "Game Name" in details:
+                yield url, record_from_details(details, url, developer_url)
+            else:
+                yield url, GameRecord.from_row(details)
@@ -0,0 +1,127 @@
+from typing import Dict, Iterable, List, Optional, Union
+
+from .game_record import GameRecord, record_from_details
+
+# Typed, columnar copy of the scraped games: sizes in bytes, prices in cents,
+# ratings as floats, age ratings as ints and Game Center flags as booleans,
+# so analytics jobs can memory-map the file and compute on whole columns
+# instead of re-parsing "325.1 MB" or "$6.99" from the CSV files.
+# The file format follows the extension: Arrow IPC for .arrow / .feather
+# (uncompressed, best for memory-mapping), Parquet for anything else.
+# pyarrow is optional: install it with `pip install appstore_data_agent[columnar]`.
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# Rows buffered in memory before they are written out as one row group / record batch
+DEFAULT_ROW_GROUP_SIZE = 1000
+
+IPC_EXTENSIONS = (".arrow", ".feather")
+
+# Column name -> pyarrow type factory
+COLUMNS = [
+    ("app_id", "int64"),
+    ("url", "string"),
+    ("developer_name", "string"),
+    ("developer_url", "string"),
+    ("game_name", "string"),
+    ("rating", "float64"),
+    ("rating_count", "int64"),
+    ("size_bytes", "int64"),
+    ("age_rating", "int8"),
+    ("price_cents", "int32"),
+    ("is_free", "bool_"),
+    ("genre", "string"),
+    ("game_center", "bool_"),
+    ("achievements", "bool_"),
+    ("leaderboards", "bool_"),
+    ("in_app_purchases", "bool_"),
+    ("content_warnings", "string"),
+]
+
+def available() -> bool:
+    return pa is not None
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Columnar export needs pyarrow: pip install appstore_data_agent[columnar]")
+
+
+def schema():
+    _require_pyarrow()
+    return pa.schema([(name, getattr(pa, type_name)()) for name, type_name in COLUMNS])
+
+
+def typed_row_from_details(
+    details: Dict,
+    url: Optional[str] = None,
+    developer_url: Optional[str] = None,
+) -> Dict:
+    """Typed row of a scraped games CSV row (see GameRecord.to_csv_row)."""
+    return record_from_details(details, url, developer_url).as_row()
+
+
+class ColumnarSink:
+    """
+    Writes typed rows to a Parquet or Arrow IPC file, row_group_size rows at a
+    time. The file is only created when the first row group is written.
+    """
+
+    def __init__(self, path: str, row_group_size: int = DEFAULT_ROW_GROUP_SIZE):
+        _require_pyarrow()
+        self.path = path
+        self.row_group_size = max(1, row_group_size)
+        self.schema = schema()
+        self.rows_written = 0
+        self._rows: List[Dict] = []
+        self._writer = None
+
+    def write(self, row: Union[Dict, GameRecord]) -> None:
+        self._rows.append(row.as_row() if isinstance(row, GameRecord) else row)
+        if len(self._rows) >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._rows:
+            return
+        table = pa.Table.from_pylist(self._rows, schema=self.schema)
+        if self._writer is None:
+            if self.path.endswith(IPC_EXTENSIONS):
+                self._writer = pa.ipc.new_file(self.path, self.schema)
+            else:
+                self._writer = pq.ParquetWriter(self.path, self.schema)
+        self._writer.write_table(table)
+        self.rows_written += len(self._rows)
+        self._rows = []
+
+    def close(self) -> None:
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "ColumnarSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_games(games: Iterable[GameRecord], path: str) -> int:
+    """Writes direct pipeline games to path. Returns the number of rows written."""
+    with ColumnarSink(path) as sink:
+        for game in games:
+            sink.write(game)
+    return sink.rows_written
+
+
+def read_games(path: str):
+    """pyarrow Table of an exported file, memory-mapped rather than read into memory where possible."""
+    _require_pyarrow()
+    if path.endswith(IPC_EXTENSIONS):
+        # The table's buffers point into the mapping, which stays open as long as they do
+        return pa.ipc.open_file(pa.memory_map(path)).read_all()
+    return pq.read_table(path, memory_map=True)
@@ -0,0 +1,139 @@
+import csv
+import pickle
+import tempfile
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Column order of the scraped games CSV files
+CSV_FIELDNAMES = ["Developer Name", "Game Name", "Ratings", "Size", "Age Limit", "Price", "Genre", "Game Center Integ", "Achievement", "Leaderboard"]
+
+# Rows written between two flushes of the underlying file
+DEFAULT_FLUSH_EVERY = 25
+# Out-of-order items OrderedRelease keeps in memory; later ones go to a temporary file
+DEFAULT_MAX_BUFFERED = 1000
+
+
+class CSVSink:
+    """
+    Appends rows to a CSV file as soon as they are produced.
+    The file (and its header) is only created when the first row arrives.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fieldnames: List[str] = CSV_FIELDNAMES,
+        predicate: Optional[Callable[[Dict], bool]] = None,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+    ):
+        self.path = path
+        self.fieldnames = fieldnames
+        self.predicate = predicate
+        self.flush_every = max(1, flush_every)
+        self.rows_written = 0
+        self._file = None
+        self._writer = None
+
+    def write(self, row: Dict) -> None:
+        if self.predicate is not None and not self.predicate(row):
+            return
+        if self._writer is None:
+            self._file = open(self.path, 'w', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames)
+            self._writer.writeheader()
+        self._writer.writerow(row)
+        self.rows_written += 1
+        if self.rows_written % self.flush_every == 0:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+
+class FanOutSink:
+    """Sends every row to several sinks."""
+
+    def __init__(self, sinks: Iterable[CSVSink]):
+        self.sinks = list(sinks)
+
+    def write(self, row: Dict) -> None:
+        for sink in self.sinks:
+            sink.write(row)
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+    def __enter__(self) -> "FanOutSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class OrderedRelease:
+    """
+    Hands items to emit in index order, however they arrive.
+    Out-of-order items are held only until the gap before them is filled.
+    At most max_buffered of them are held in memory: when an early item is
+    late (a slow page, an open circuit), the rest are pickled to a temporary
+    file until it arrives, so memory stays flat however long the gap lasts.
+    """
+
+    def __init__(self, emit: Callable, start: int = 0, max_buffered: int = DEFAULT_MAX_BUFFERED):
+        self.emit = emit
+        self.next_index = start
+        self.max_buffered = max(0, max_buffered)
+        self._pending: Dict[int, object] = {}
+        # Index -> (offset, length) of the spilled items in _spill_file
+        self._spilled: Dict[int, Tuple[int, int]] = {}
+        self._spill_file = None
+
+    def _hold(self, index: int, item) -> None:
+        if len(self._pending) < self.max_buffered:
+            self._pending[index] = item
+            return
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile()
+        data = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+        offset = self._spill_file.seek(0, 2)
+        self._spill_file.write(data)
+        self._spilled[index] = (offset, len(data))
+
+    def _take(self, index: int):
+        if index in self._pending:
+            return self._pending.pop(index)
+        offset, length = self._spilled.pop(index)
+        self._spill_file.seek(offset)
+        return pickle.loads(self._spill_file.read(length))
+
+    def _release_spill_file(self) -> None:
+        if self._spill_file is not None and not self._spilled:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def put(self, index: int, item) -> None:
+        if index != self.next_index:
+            self._hold(index, item)
+            return
+        self.emit(item)
+        self.next_index += 1
+        while self.next_index in self._pending or self.next_index in self._spilled:
+            self.emit(self._take(self.next_index))
+            self.next_index += 1
+        self._release_spill_file()
+
+    @property
+    def buffered(self) -> int:
+        return len(self._pending) + len(self._spilled)
+
+    def flush(self) -> int:
+        """Emits the items still held back by a gap, in index order. Returns how many there were."""
+        flushed = self.buffered
+        for index in sorted(list(self._pending) + list(self._spilled)):
+            self.emit(self._take(index))
+            self.next_index = index + 1
+        self._release_spill_file()
+        return flushed
@@ -0,0 +1,198 @@
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Local index of known App Store developer names, used to resolve misspelled or
+# partial names ("Voodo", "Nintenddo") without a round trip to an LLM. It is
+# seeded with the publishers we track and grows with every developer name the
+# scrapers read from a game page's product-header__identity.
+
+DEFAULT_NAMES_FILE = os.path.join(".cache", "developer_names.txt")
+DEFAULT_CONFIDENCE_THRESHOLD = 0.75
+# Candidates (by shared trigrams) that get a full edit-distance comparison
+CANDIDATE_LIMIT = 20
+# Score multiplier when the query only matches the leading words of a name
+PARTIAL_MATCH_FACTOR = 0.95
+
+SEED_DEVELOPER_NAMES = [
+    "Voodoo",
+    "Supercell",
+    "Nintendo Co., Ltd.",
+    "SYBO Games",
+    "Miniclip.com",
+    "King",
+    "Rockstar Games",
+    "Electronic Arts",
+    "Activision Publishing, Inc.",
+    "Ubisoft",
+    "Zynga Inc.",
+    "Rovio Entertainment Oyj",
+    "Playrix",
+    "Niantic, Inc.",
+    "Epic Games",
+    "Square Enix",
+    "BANDAI NAMCO Entertainment Inc.",
+    "SEGA CORPORATION",
+    "Kabam Games, Inc.",
+    "Scopely",
+    "Moon Active",
+    "Playtika",
+    "Ketchapp",
+    "Gameloft",
+    "Episode Interactive",
+    "Warner Bros.",
+    "Netflix, Inc.",
+    "Tencent Mobile International Limited",
+    "Roblox Corporation",
+    "Mojang",
+]
+
+# Legal-entity suffixes that carry no identifying information
+_SUFFIXES = {
+    "co", "ltd", "inc", "llc", "corp", "corporation", "limited", "gmbh", "plc",
+    "pty", "sa", "sas", "srl", "bv", "ab", "oy", "oyj", "as", "kk", "com",
+}
+
+
+def normalize_name(name: str) -> str:
+    """Lower-cases a developer name and drops punctuation and legal suffixes."""
+    tokens = re.sub(r"[^a-z0-9]+", " ", name.lower()).split()
+    while len(tokens) > 1 and tokens[-1] in _SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance between two strings."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        previous = current
+    return previous[-1]
+
+
+def similarity(a: str, b: str) -> float:
+    if not a or not b:
+        return 0.0
+    return 1.0 - edit_distance(a, b) / max(len(a), len(b))
+
+
+class DeveloperNameIndex:
+    """Trigram index over developer names with edit-distance ranking."""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: Dict[str, str] = {}  # normalized -> display name
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_name(name) in self.names
+
+    def add(self, name: str) -> bool:
+        """Adds a name; returns False if it (or an equivalent spelling) is already indexed."""
+        name = name.strip()
+        key = normalize_name(name)
+        if not key:
+            return False
+        with self._lock:
+            if key in self.names:
+                return False
+            self.names[key] = name
+            for trigram in _trigrams(key):
+                self._trigrams.setdefault(trigram, set()).add(key)
+        return True
+
+    def _score(self, query: str, key: str) -> float:
+        score = similarity(query, key)
+        # "Sybo" should still find "SYBO Games"
+        query_words = len(query.split())
+        leading = " ".join(key.split()[:query_words])
+        if leading != key:
+            score = max(score, similarity(query, leading) * PARTIAL_MATCH_FACTOR)
+        return score
+
+    def lookup(self, query: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """Returns up to limit (display name, score) pairs, best first."""
+        key = normalize_name(query)
+        if not key:
+            return []
+        shared: Dict[str, int] = {}
+        with self._lock:
+            if key in self.names:
+                return [(self.names[key], 1.0)]
+            for trigram in _trigrams(key):
+                for candidate in self._trigrams.get(trigram, ()):
+                    shared[candidate] = shared.get(candidate, 0) + 1
+            names = dict(self.names)
+        candidates = sorted(shared, key=lambda candidate: (-shared[candidate], candidate))[:CANDIDATE_LIMIT]
+        scored = sorted(
+            ((names[candidate], self._score(key, candidate)) for candidate in candidates),
+            key=lambda item: (-item[1], item[0]),
+        )
+        return scored[:limit]
+
+    def best_match(self, query: str, threshold: float = DEFAULT_CONFIDENCE_THRESHOLD) -> Optional[str]:
+        """The best matching name, or None when no candidate reaches threshold."""
+        matches = self.lookup(query, limit=1)
+        if matches and matches[0][1] >= threshold:
+            return matches[0][0]
+        return None
+
+
+_index: Optional[DeveloperNameIndex] = None
+_index_lock = threading.Lock()
+_names_file = DEFAULT_NAMES_FILE
+
+
+def configure(names_file: Optional[str] = None) -> None:
+    """Points the shared index at another names file. It is reloaded on next use."""
+    global _index, _names_file
+    with _index_lock:
+        if names_file is not None:
+            _names_file = names_file
+        _index = None
+
+
+def _load_scraped_names(path: str) -> List[str]:
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as names:
+        return [line.strip() for line in names if line.strip()]
+
+
+def get_index() -> DeveloperNameIndex:
+    """Shared index built from the seed list plus every developer name scraped so far."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = DeveloperNameIndex(SEED_DEVELOPER_NAMES + _load_scraped_names(_names_file))
+        return _index
+
+
+def remember_developer_name(name: Optional[str]) -> None:
+    """Adds a scraped developer name to the shared index and persists it."""
+    if not name or name == "N/A":
+        return
+    if get_index().add(name):
+        os.makedirs(os.path.dirname(_names_file) or ".", exist_ok=True)
+        with open(_names_file, "a", encoding="utf-8") as names:
+            names.write(name.strip() + "\n")
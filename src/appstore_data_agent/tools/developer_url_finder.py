@@ -1,26 +1,35 @@
-from crewai.tools import BaseTool
-from typing import Type
-from pydantic import BaseModel, Field
+from typing import Optional
 from googlesearch import search
+from .developer_url_store import record_developer_url, resolve_developer_url
+from .rate_limiter import get_limiter
 
-class DeveloperURLFinderInput(BaseModel):
-    """Input schema for DeveloperURLFinderTool."""
-    developer_name: str = Field(..., description="The full name of the game developer.")
+# No crewAI here: the direct pipeline finds developer pages without loading
+# the agent framework. The crewAI tool lives in developer_url_finder_tool.
 
-class DeveloperURLFinderTool(BaseTool):
-    name: str = "Developer URL Finder Tool"
-    description: str = (
-        "Finds the Apple App Store URL for a given game developer's page using a web search."
-    )
-    args_schema: Type[BaseModel] = DeveloperURLFinderInput
+SEARCH_URL = "https://www.google.com/search"
 
-    def _run(self, developer_name: str) -> str:
-        query = f"{developer_name} app store developer page"
-        try:
-            for url in search(query, num_results=5):
-                if "apps.apple.com" in url and "/developer/" in url:
-                    return url
-            return "N/A: No App Store Developer Page URL found."
-        except Exception as e:
-            return f"Error finding developer URL: {e}"
+def find_developer_url(developer_name: str) -> Optional[str]:
+    """
+    Returns the App Store developer page URL for developer_name, or None.
+    Search errors are raised to the caller.
+    """
+    # Developer pages rarely move: reuse what earlier scrapes have seen
+    known_url = resolve_developer_url(developer_name)
+    if known_url:
+        return known_url
 
+    query = f"{developer_name} app store developer page"
+    # Paced like any other host; a 429 from the search engine is waited out and retried
+    results = get_limiter().call(SEARCH_URL, lambda: list(search(query, num_results=5)))
+    for url in results:
+        if "apps.apple.com" in url and "/developer/" in url:
+            record_developer_url(developer_name, url)
+            return url
+    return None
+
+def __getattr__(name):
+    # The tool classes used to live here; they are imported on first use
+    if name in ("DeveloperURLFinderInput", "DeveloperURLFinderTool"):
+        from . import developer_url_finder_tool
+        return getattr(developer_url_finder_tool, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,23 @@
+from crewai.tools import BaseTool
+from typing import Type
+from pydantic import BaseModel, Field
+from .developer_url_finder import find_developer_url
+
+class DeveloperURLFinderInput(BaseModel):
+    """Input schema for DeveloperURLFinderTool."""
+    developer_name: str = Field(..., description="The full name of the game developer.")
+
+class DeveloperURLFinderTool(BaseTool):
+    name: str = "Developer URL Finder Tool"
+    description: str = (
+        "Finds the Apple App Store URL for a given game developer's page, from previously scraped pages or a web search."
+    )
+    args_schema: Type[BaseModel] = DeveloperURLFinderInput
+
+    def _run(self, developer_name: str) -> str:
+        try:
+            url = find_developer_url(developer_name)
+            return url if url else "N/A: No App Store Developer Page URL found."
+        except Exception as e:
+            return f"Error finding developer URL: {e}"
+
@@ -0,0 +1,136 @@
+import json
+import os
+import re
+import threading
+from typing import Dict, Optional
+
+from .developer_index import DeveloperNameIndex, normalize_name
+
+# Persistent map from developer names (and their aliases) to App Store
+# developer pages. Developer pages almost never move, so once a game page has
+# shown us a developer's link, later runs resolve that developer without a web
+# search. On disk:
+#   {"developers": {"<developer id>": {"name": ..., "url": ...}},
+#    "aliases": {"<normalized name>": "<developer id>"}}
+
+DEFAULT_STORE_FILE = os.path.join(".cache", "developer_urls.json")
+# Fuzzy alias matches must be much closer than general name resolution
+DEFAULT_ALIAS_THRESHOLD = 0.85
+
+_DEVELOPER_URL_PATTERN = re.compile(r"/developer/([^/?#]+)/id(\d+)")
+
+
+def parse_developer_url(url: str) -> Optional[Dict[str, str]]:
+    """Splits an App Store developer URL into its slug, numeric ID and a clean URL."""
+    if not url or "apps.apple.com" not in url:
+        return None
+    match = _DEVELOPER_URL_PATTERN.search(url)
+    if not match:
+        return None
+    return {
+        "slug": match.group(1),
+        "id": match.group(2),
+        "url": url.split("?")[0].split("#")[0],
+    }
+
+
+class DeveloperURLStore:
+    """Name/alias -> developer page resolution, persisted as JSON."""
+
+    def __init__(self, path: str = DEFAULT_STORE_FILE):
+        self.path = path
+        self.developers: Dict[str, Dict[str, str]] = {}
+        self.aliases: Dict[str, str] = {}
+        self._alias_index = DeveloperNameIndex()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as store:
+                data = json.load(store)
+        except (OSError, ValueError):
+            return
+        self.developers = data.get("developers", {})
+        self.aliases = data.get("aliases", {})
+        for alias in self.aliases:
+            self._alias_index.add(alias)
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as store:
+            json.dump({"developers": self.developers, "aliases": self.aliases}, store, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def _add_alias(self, alias: str, developer_id: str) -> bool:
+        key = normalize_name(alias)
+        if not key or self.aliases.get(key) == developer_id:
+            return False
+        self.aliases[key] = developer_id
+        self._alias_index.add(key)
+        return True
+
+    def record(self, name: Optional[str], url: Optional[str]) -> bool:
+        """Remembers that name is published at developer page url. Returns True if anything changed."""
+        parsed = parse_developer_url(url or "")
+        if parsed is None:
+            return False
+        with self._lock:
+            changed = False
+            developer = self.developers.get(parsed["id"])
+            if developer is None or developer["url"] != parsed["url"]:
+                self.developers[parsed["id"]] = {
+                    "name": name if name and name != "N/A" else (developer or {}).get("name", parsed["slug"]),
+                    "url": parsed["url"],
+                }
+                changed = True
+            changed |= self._add_alias(parsed["slug"].replace("-", " "), parsed["id"])
+            if name and name != "N/A":
+                changed |= self._add_alias(name, parsed["id"])
+            if changed:
+                self._save()
+            return changed
+
+    def resolve(self, name: str, threshold: float = DEFAULT_ALIAS_THRESHOLD) -> Optional[str]:
+        """Developer page URL for name, or None when it has not been seen yet."""
+        with self._lock:
+            key = normalize_name(name)
+            developer_id = self.aliases.get(key)
+            if developer_id is None:
+                alias = self._alias_index.best_match(key, threshold)
+                developer_id = self.aliases.get(alias) if alias else None
+            developer = self.developers.get(developer_id) if developer_id else None
+            return developer["url"] if developer else None
+
+
+_store: Optional[DeveloperURLStore] = None
+_store_lock = threading.Lock()
+_store_file = DEFAULT_STORE_FILE
+
+
+def configure(store_file: Optional[str] = None) -> None:
+    """Points the shared store at another file. It is reloaded on next use."""
+    global _store, _store_file
+    with _store_lock:
+        if store_file is not None:
+            _store_file = store_file
+        _store = None
+
+
+def get_store() -> DeveloperURLStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = DeveloperURLStore(_store_file)
+        return _store
+
+
+def record_developer_url(name: Optional[str], url: Optional[str]) -> None:
+    get_store().record(name, url)
+
+
+def resolve_developer_url(name: str) -> Optional[str]:
+    return get_store().resolve(name)
@@ -0,0 +1,87 @@
+import os
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Size-bounded directory of cache entries, shared by the HTTP and LLM caches.
+# An entry is <key>.json plus optional companion files with the same key
+# (e.g. <key>.body for a response body). The .json file's mtime doubles as
+# the LRU timestamp, so a hit only costs a utime() call.
+
+META_SUFFIX = ".json"
+
+
+class DiskLRU:
+    """Atomic writes, size accounting and least recently used eviction for a cache directory."""
+
+    def __init__(self, directory: str, max_bytes: int, companions: Tuple[str, ...] = ()):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffixes = (META_SUFFIX,) + tuple(companions)
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.size = sum(size for _, _, size in self.entries())
+
+    def path(self, key: str, suffix: str = META_SUFFIX) -> str:
+        return os.path.join(self.directory, key + suffix)
+
+    def _paths(self, key: str) -> List[str]:
+        return [self.path(key, suffix) for suffix in self.suffixes]
+
+    @staticmethod
+    def _size_of(paths: List[str]) -> int:
+        return sum(os.path.getsize(path) for path in paths if os.path.exists(path))
+
+    def entries(self) -> Iterator[Tuple[str, float, int]]:
+        """Yields (key, last_used, size) for every stored entry."""
+        for name in os.listdir(self.directory):
+            if not name.endswith(META_SUFFIX):
+                continue
+            key = name[:-len(META_SUFFIX)]
+            try:
+                last_used = os.stat(self.path(key)).st_mtime
+            except OSError:
+                continue
+            yield key, last_used, self._size_of(self._paths(key))
+
+    def touch(self, key: str) -> None:
+        """Marks key as just used."""
+        try:
+            os.utime(self.path(key))
+        except OSError:
+            pass
+
+    def write(self, key: str, files: Dict[str, Optional[bytes]]) -> None:
+        """
+        Stores the entry's files (suffix -> data, None keeps the stored file) in
+        the given order, then evicts old entries if the directory is over budget.
+        Put the .json file last: an entry only counts once its metadata is written.
+        """
+        paths = self._paths(key)
+        with self._lock:
+            old_size = self._size_of(paths)
+            for suffix, data in files.items():
+                if data is not None:
+                    self._atomic_write(self.path(key, suffix), data)
+            self.size += self._size_of(paths) - old_size
+            if self.size > self.max_bytes:
+                self._evict()
+
+    @staticmethod
+    def _atomic_write(path: str, data: bytes) -> None:
+        # Write to a temp file first so a crash never leaves a torn entry
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+
+    def _evict(self) -> None:
+        """Drops least recently used entries until the directory fits in max_bytes."""
+        for key, _, size in sorted(self.entries(), key=lambda entry: entry[1]):
+            if self.size <= self.max_bytes:
+                break
+            for path in self._paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self.size -= size
@@ -0,0 +1,283 @@
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+from . import profiler
+
+T = TypeVar("T")
+
+# Defaults for the concurrent fetch engine
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_HOST_LIMIT = 4
+# Parse stage: None means one worker process per CPU for large crawls, 0 parses in the calling thread
+DEFAULT_PARSE_WORKERS = None
+DEFAULT_QUEUE_SIZE = 32
+# Below this many pages, starting worker processes costs more than it saves
+MIN_PROCESS_PARSE_BATCH = 16
+
+# Queue marker sent by run_pipeline's feeder once every url has been submitted
+_END_OF_URLS = -1
+
+
+class HostLimiter:
+    """Caps the number of in-flight requests per host."""
+
+    def __init__(self, per_host_limit: int = DEFAULT_PER_HOST_LIMIT):
+        self.per_host_limit = max(1, per_host_limit)
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    @contextmanager
+    def slot(self, url: str):
+        semaphore = self._semaphore(urlsplit(url).netloc.lower())
+        with semaphore:
+            yield
+
+
+class StageStats:
+    """Throughput counters for one stage of the fetch/parse pipeline."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.errors = 0
+        self.bytes = 0
+        self.busy_seconds = 0.0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.started is None:
+                self.started = time.perf_counter()
+
+    def record(self, seconds: float, nbytes: int = 0, error: bool = False) -> None:
+        with self._lock:
+            self.items += 1
+            self.errors += int(error)
+            self.bytes += nbytes
+            self.busy_seconds += seconds
+            self.finished = time.perf_counter()
+        profiler.record(f"pipeline.{self.name}", seconds, error=error, bytes=nbytes)
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.items / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.name}: {self.items} pages ({self.errors} errors), "
+            f"{self.bytes / 1_000_000:.1f} MB in {self.elapsed:.2f}s "
+            f"({self.pages_per_second:.1f} pages/s, {self.busy_seconds:.2f}s busy)"
+        )
+
+
+def _timed_call(function: Callable[..., T], *args) -> Tuple[T, float]:
+    # Runs in the parse worker process, so the timing excludes queueing and IPC
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def _parse_context(parse: Callable):
+    # Never fork: the fetch threads may hold locks when a worker starts. A fork
+    # server pays the interpreter start-up and import cost (including __main__)
+    # once, instead of once per worker.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["__main__", parse.__module__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def _payload_size(payload: Any) -> int:
+    if isinstance(payload, (bytes, str)):
+        return len(payload)
+    if isinstance(payload, tuple) and payload and isinstance(payload[0], (bytes, str)):
+        return len(payload[0])
+    return 0
+
+
+def run_pipeline(
+    urls: Iterable[str],
+    fetch: Callable[[str], Any],
+    parse: Callable[..., T],
+    on_error: Optional[Callable[[str, Exception], T]] = None,
+    on_result: Optional[Callable[[int, str, T], None]] = None,
+    fetch_workers: int = DEFAULT_MAX_WORKERS,
+    parse_workers: Optional[int] = DEFAULT_PARSE_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    collect: bool = True,
+    limiter: Optional[HostLimiter] = None,
+) -> Tuple[List[T], StageStats, StageStats]:
+    """
+    Fetches urls on a thread pool and parses the payloads on a process pool.
+
+    fetch(url) returns the raw payload (e.g. HTML bytes, or a tuple of arguments
+    for parse); parse must be a picklable, module-level function. The two stages
+    are connected by a bounded queue, so fetching stalls instead of buffering
+    unbounded HTML when parsing falls behind. When fetch raises, on_error(url, exc)
+    provides the result instead; without on_error the first error is re-raised
+    once the pipeline has drained. on_result(index, url, result) is called as soon
+    as each page has been parsed, in completion order. Results are returned in the
+    same order as urls; with collect=False they are only passed to the callbacks,
+    so memory stays flat on large crawls.
+
+    urls may also be a lazy iterator (e.g. a catalog crawl): each url is fetched
+    as soon as it is produced, and indexes follow the order urls were produced in.
+    An error raised by the iterator is re-raised once the pipeline has drained.
+    Pass the limiter of a crawl that runs alongside (e.g. the catalog crawl
+    feeding urls) so both stay within one per-host limit.
+    """
+    sized = isinstance(urls, Sequence)
+    seen_urls: List[str] = []
+    results: List[Any] = []
+    fetch_stats = StageStats("fetch")
+    parse_stats = StageStats("parse")
+    if sized and not urls:
+        return results, fetch_stats, parse_stats
+
+    limiter = limiter or HostLimiter(per_host_limit)
+    fetched: "queue.Queue" = queue.Queue(maxsize=max(1, queue_size))
+
+    stopping = threading.Event()
+
+    def deliver(item) -> None:
+        # Blocks while the parse stage is behind, but gives up if the pipeline is aborted
+        while not stopping.is_set():
+            try:
+                fetched.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def fetch_task(index: int, url: str) -> None:
+        if stopping.is_set():
+            return
+        fetch_stats.start()
+        started = time.perf_counter()
+        try:
+            with limiter.slot(url):
+                payload = fetch(url)
+        except Exception as e:
+            fetch_stats.record(time.perf_counter() - started, error=True)
+            deliver((index, url, None, e))
+            return
+        fetch_stats.record(time.perf_counter() - started, _payload_size(payload))
+        deliver((index, url, payload, None))
+
+    feed_error: List[Exception] = []
+
+    def feed() -> None:
+        # Submits urls as they are produced; the end marker carries the total count
+        try:
+            for url in urls:
+                if stopping.is_set():
+                    return
+                seen_urls.append(url)
+                if collect:
+                    results.append(None)
+                fetch_pool.submit(fetch_task, len(seen_urls) - 1, url)
+        except Exception as e:
+            feed_error.append(e)
+        deliver((_END_OF_URLS, len(seen_urls), None, None))
+
+    if parse_workers is None:
+        if sized:
+            parse_workers = (os.cpu_count() or 1) if len(urls) >= MIN_PROCESS_PARSE_BATCH else 0
+        else:
+            parse_workers = os.cpu_count() or 1
+    if sized:
+        parse_workers = min(parse_workers, len(urls))
+    parse_pool = None
+
+    first_error: Optional[Exception] = None
+    pending = {}
+
+    def finish(index: int, result) -> None:
+        if collect:
+            results[index] = result
+        if on_result is not None:
+            on_result(index, seen_urls[index], result)
+
+    def harvest(done) -> None:
+        for future in done:
+            index = pending.pop(future)
+            result, seconds = future.result()
+            parse_stats.record(seconds)
+            finish(index, result)
+
+    fetch_pool = ThreadPoolExecutor(max_workers=max(1, min(fetch_workers, len(urls)) if sized else fetch_workers))
+    feeder = threading.Thread(target=feed, name="pipeline-feeder", daemon=True)
+    try:
+        feeder.start()
+        received = 0
+        total = None
+        while total is None or received < total:
+            index, url, payload, error = fetched.get()
+            if index == _END_OF_URLS:
+                total = url
+                continue
+            received += 1
+            if error is not None:
+                if on_error is None:
+                    first_error = first_error or error
+                else:
+                    result = on_error(url, error)
+                    if collect:
+                        results[index] = result
+                continue
+
+            args = payload if isinstance(payload, tuple) else (payload,)
+            parse_stats.start()
+            if parse_workers <= 0:
+                result, seconds = _timed_call(parse, *args)
+                parse_stats.record(seconds)
+                finish(index, result)
+                continue
+
+            if parse_pool is None:
+                parse_pool = ProcessPoolExecutor(max_workers=parse_workers, mp_context=_parse_context(parse))
+            pending[parse_pool.submit(_timed_call, parse, *args)] = index
+            # Keep the number of in-flight parses bounded as well
+            if len(pending) >= queue_size:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                harvest(done)
+
+        if pending:
+            done, _ = wait(pending)
+            harvest(done)
+    finally:
+        stopping.set()
+        feeder.join()
+        fetch_pool.shutdown(wait=True, cancel_futures=True)
+        if parse_pool is not None:
+            parse_pool.shutdown(wait=True, cancel_futures=True)
+
+    if feed_error:
+        raise feed_error[0]
+    if first_error is not None:
+        raise first_error
+    return results, fetch_stats, parse_stats
@@ -0,0 +1,234 @@
+import json
+import re
+import sys
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
+
+from .app_identity import parse_app_url
+
+# One scraped game as typed values, parsed once where the page is read: sizes
+# in bytes, prices in cents, ratings as floats, age ratings as ints and Game
+# Center flags as booleans. Records are slotted (no per-instance __dict__) and
+# their repeated strings (developer, genre, content warnings) are interned, so a large catalog
+# costs a fraction of the string-keyed dicts of page text it replaces. They
+# serialize straight to the CSV row, JSON and columnar formats.
+
+NOT_AVAILABLE = "N/A"
+
+_NUMBER = r"(\d+(?:[.,]\d+)*)"
+_NUMBER_PATTERN = re.compile(_NUMBER)
+_SIZE_PATTERN = re.compile(_NUMBER + r"\s*(bytes|KB|MB|GB|TB)", re.IGNORECASE)
+_COUNT_PATTERN = re.compile(_NUMBER + r"\s*([KMB])?", re.IGNORECASE)
+_AGE_PATTERN = re.compile(r"(\d+)")
+_SIZE_UNITS = {"bytes": 1, "kb": 10 ** 3, "mb": 10 ** 6, "gb": 10 ** 9, "tb": 10 ** 12}
+_COUNT_UNITS = {None: 1, "k": 10 ** 3, "m": 10 ** 6, "b": 10 ** 9}
+
+# Apple content descriptors start with their intensity, e.g.
+# "Infrequent/Mild Cartoon or Fantasy Violence"
+_DESCRIPTOR_SPLIT = re.compile(r"(?=Infrequent/Mild|Frequent/Intense|Unrestricted Web Access)")
+_AGE_RATING = re.compile(r"^\s*(\d+\+)")
+
+
+def _number(text: str) -> float:
+    # "1,234.5" and "1.234,5" style grouping; a lone comma is a decimal comma
+    if "," in text and "." not in text and len(text.rsplit(",", 1)[1]) != 3:
+        text = text.replace(",", ".")
+    elif "," in text and "." in text and text.rfind(",") > text.rfind("."):
+        text = text.replace(".", "").replace(",", ".")
+    else:
+        text = text.replace(",", "")
+    return float(text)
+
+
+def parse_size_bytes(text: Optional[str]) -> Optional[int]:
+    """"325.1 MB" -> 325100000 (App Store sizes are decimal units)."""
+    match = _SIZE_PATTERN.search(text or "")
+    if not match:
+        return None
+    return round(_number(match.group(1)) * _SIZE_UNITS[match.group(2).lower()])
+
+
+def parse_price_cents(text: Optional[str]) -> Optional[int]:
+    """"$6.99" -> 699, "Free" -> 0."""
+    if not text:
+        return None
+    if "free" in text.lower():
+        return 0
+    match = _NUMBER_PATTERN.search(text)
+    return round(_number(match.group(1)) * 100) if match else None
+
+
+def parse_rating(text: Optional[str]) -> Optional[float]:
+    match = _NUMBER_PATTERN.search(text or "")
+    return _number(match.group(1)) if match else None
+
+
+def parse_rating_count(text: Optional[str]) -> Optional[int]:
+    """"1.2M Ratings" -> 1200000."""
+    match = _COUNT_PATTERN.search(text or "")
+    if not match:
+        return None
+    unit = match.group(2).lower() if match.group(2) else None
+    return round(_number(match.group(1)) * _COUNT_UNITS[unit])
+
+
+def parse_age_rating(text: Optional[str]) -> Optional[int]:
+    """"4+", "Rated 12+" (or a truncated "12") -> the minimum age."""
+    match = _AGE_PATTERN.search(text or "")
+    return int(match.group(1)) if match else None
+
+
+def parse_flag(text: Optional[str]) -> Optional[bool]:
+    if text == "Yes":
+        return True
+    if text == "No":
+        return False
+    return None
+
+
+def split_age_rating(text: Optional[str]) -> Tuple[Optional[str], List[str]]:
+    """"12+Infrequent/Mild Cartoon or Fantasy Violence..." -> ("12+", [content descriptors])."""
+    text = text or ""
+    match = _AGE_RATING.match(text)
+    descriptors = [d.strip() for d in _DESCRIPTOR_SPLIT.split(text[match.end():] if match else "") if d.strip()]
+    return (match.group(1) if match else None), descriptors
+
+
+def _text(value: Optional[str]) -> Optional[str]:
+    return None if value in (None, "", NOT_AVAILABLE) else value
+
+
+def _interned(value: Optional[str]) -> Optional[str]:
+    # Shared by every game of a developer, genre or content rating: one copy in memory
+    value = _text(value)
+    return sys.intern(value) if value is not None else None
+
+
+def format_size(size_bytes: Optional[int]) -> str:
+    """325100000 -> "325.1 MB" and 85000000 -> "85 MB", the App Store's own notation."""
+    if size_bytes is None:
+        return NOT_AVAILABLE
+    for unit, factor in (("GB", 10 ** 9), ("MB", 10 ** 6), ("KB", 10 ** 3)):
+        if size_bytes >= factor:
+            return f"{size_bytes / factor:.1f}".removesuffix(".0") + f" {unit}"
+    return f"{size_bytes} bytes"
+
+
+def format_price(price_cents: Optional[int]) -> str:
+    if price_cents is None:
+        return NOT_AVAILABLE
+    return "Free" if price_cents == 0 else f"${price_cents / 100:.2f}"
+
+
+def _yes_no(flag: Optional[bool]) -> str:
+    return "Yes" if flag else "No"
+
+
+@dataclass(slots=True)
+class GameRecord:
+    """A scraped game. Fields the page did not show are None."""
+    app_id: Optional[int] = None
+    url: Optional[str] = None
+    developer_name: Optional[str] = None
+    developer_url: Optional[str] = None
+    game_name: Optional[str] = None
+    rating: Optional[float] = None
+    rating_count: Optional[int] = None
+    size_bytes: Optional[int] = None
+    age_rating: Optional[int] = None
+    price_cents: Optional[int] = None
+    is_free: Optional[bool] = None
+    genre: Optional[str] = None
+    game_center: Optional[bool] = None
+    achievements: Optional[bool] = None
+    leaderboards: Optional[bool] = None
+    in_app_purchases: Optional[bool] = None
+    content_warnings: Optional[str] = None  # Apple's content descriptors, "; " separated
+
+    def as_row(self) -> Dict:
+        """Typed row, in column order (see columnar_export.COLUMNS)."""
+        return dict(zip(RECORD_FIELDS, _field_values(self)))
+
+    def to_json(self) -> str:
+        return json.dumps(self.as_row(), ensure_ascii=False)
+
+    def to_csv_row(self) -> Dict[str, str]:
+        """Row of the scraped games CSV files (csv_sink.CSV_FIELDNAMES)."""
+        return {
+            "Developer Name": self.developer_name or NOT_AVAILABLE,
+            "Game Name": self.game_name or NOT_AVAILABLE,
+            "Ratings": NOT_AVAILABLE if self.rating is None else f"{self.rating:.1f}",
+            "Size": format_size(self.size_bytes),
+            "Age Limit": NOT_AVAILABLE if self.age_rating is None else f"{self.age_rating}+",
+            "Price": format_price(self.price_cents),
+            "Genre": self.genre or NOT_AVAILABLE,
+            "Game Center Integ": _yes_no(self.game_center),
+            "Achievement": _yes_no(self.achievements),
+            "Leaderboard": _yes_no(self.leaderboards),
+        }
+
+    @classmethod
+    def from_row(cls, row: Dict) -> "GameRecord":
+        """Inverse of as_row; unknown keys are ignored."""
+        return cls(**{name: row.get(name) for name in RECORD_FIELDS})
+
+
+RECORD_FIELDS = tuple(field.name for field in fields(GameRecord))
+_field_values = attrgetter(*RECORD_FIELDS)
+
+
+def record_from_details(
+    details: Dict,
+    url: Optional[str] = None,
+    developer_url: Optional[str] = None,
+) -> GameRecord:
+    """Record of a scraped games CSV row, as GameRecord.to_csv_row writes it."""
+    identity = parse_app_url(url)
+    price_cents = parse_price_cents(details.get("Price"))
+    return GameRecord(
+        app_id=identity.app_id if identity else None,
+        url=identity.url if identity else url,
+        developer_name=_interned(details.get("Developer Name")),
+        developer_url=_interned(developer_url),
+        game_name=_text(details.get("Game Name")),
+        rating=parse_rating(details.get("Ratings")),
+        size_bytes=parse_size_bytes(details.get("Size")),
+        age_rating=parse_age_rating(details.get("Age Limit")),
+        price_cents=price_cents,
+        is_free=None if price_cents is None else price_cents == 0,
+        genre=_interned(details.get("Genre")),
+        game_center=parse_flag(details.get("Game Center Integ")),
+        achievements=parse_flag(details.get("Achievement")),
+        leaderboards=parse_flag(details.get("Leaderboard")),
+    )
+
+
+def record_from_summary(game: Dict, developer_url: Optional[str] = None) -> GameRecord:
+    """Record of a game page's fields as parse_game_record reads them (url, title, info_list, ...)."""
+    identity = parse_app_url(game.get("url"))
+    info_list = game.get("info_list", {})
+    price_cents = parse_price_cents(info_list.get("Price"))
+    supports = (game.get("game_center") or "").lower()
+    achievements = "achievements" in supports
+    leaderboards = "leaderboards" in supports
+    age_rating, descriptors = split_age_rating(info_list.get("Age Rating"))
+    return GameRecord(
+        app_id=identity.app_id if identity else None,
+        url=identity.url if identity else game.get("url"),
+        developer_name=_interned(game.get("developer")),
+        developer_url=_interned(developer_url),
+        game_name=_text(game.get("title")),
+        rating=parse_rating(game.get("rating")),
+        rating_count=parse_rating_count(game.get("rating_count")),
+        size_bytes=parse_size_bytes(info_list.get("Size")),
+        age_rating=parse_age_rating(age_rating or info_list.get("Age Rating")),
+        price_cents=price_cents,
+        is_free=None if price_cents is None else price_cents == 0,
+        genre=_interned(info_list.get("Category")),
+        game_center="game center" in supports or achievements or leaderboards,
+        achievements=achievements,
+        leaderboards=leaderboards,
+        in_app_purchases="In-App Purchases" in info_list,
+        content_warnings=_interned("; ".join(descriptors)),
+    )
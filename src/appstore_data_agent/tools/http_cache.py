@@ -0,0 +1,199 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .disk_lru import DiskLRU
+
+# Persistent on-disk cache for scraped pages. Each entry is stored as two
+# files named after the hash of the normalized URL: <key>.body holds the raw
+# response bytes and <key>.json holds the metadata used for expiry and
+# conditional revalidation (ETag / Last-Modified). Size and LRU eviction are
+# handled by disk_lru.
+
+# default: serve fresh entries, revalidate stale ones with a conditional GET
+# refresh: always revalidate, even when the entry is still fresh
+# offline: only serve from the cache, never touch the network
+# off:     bypass the cache entirely
+CACHE_MODES = ("default", "refresh", "offline", "off")
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "http")
+DEFAULT_TTL = 6 * 60 * 60  # seconds
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Query parameters that only carry referral/tracking data
+TRACKING_PARAMS = {"uo", "at", "ct", "mt", "ls", "pt"}
+
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class CacheMissError(requests.exceptions.RequestException):
+    """Raised in offline mode when a URL is not in the cache."""
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a URL used as the cache key."""
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def _build_response(url: str, entry: Dict, body: bytes) -> requests.Response:
+    response = requests.models.Response()
+    response.status_code = entry.get("status", 200)
+    response.url = url
+    response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+    response.encoding = entry.get("encoding")
+    response._content = body
+    response.from_cache = True
+    return response
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of HTTP responses with TTL expiry."""
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        mode: str = "default",
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode '{mode}', expected one of {CACHE_MODES}")
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.files = DiskLRU(directory, max_bytes, companions=(".body",))
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+    def load(self, url: str):
+        """Returns (metadata, body) for url, or None when it is not cached."""
+        key = self._key(url)
+        meta_path, body_path = self.files.path(key), self.files.path(key, ".body")
+        try:
+            with open(meta_path, "r", encoding="utf-8") as meta_file:
+                entry = json.load(meta_file)
+            with open(body_path, "rb") as body_file:
+                body = body_file.read()
+        except (OSError, ValueError):
+            return None
+        return entry, body
+
+    def is_fresh(self, entry: Dict) -> bool:
+        return time.time() - entry.get("stored_at", 0) < self.ttl
+
+    def _touch(self, url: str) -> None:
+        self.files.touch(self._key(url))
+
+    def store(self, url: str, response: requests.Response) -> None:
+        entry = {
+            "url": normalize_url(url),
+            "status": response.status_code,
+            "encoding": response.encoding,
+            "stored_at": time.time(),
+            "headers": {name: response.headers[name] for name in STORED_HEADERS if name in response.headers},
+        }
+        self._write(url, entry, response.content)
+
+    def _write(self, url: str, entry: Dict, body: Optional[bytes]) -> None:
+        # The body goes first: the entry only exists once its metadata is written
+        self.files.write(self._key(url), {".body": body, ".json": json.dumps(entry).encode("utf-8")})
+
+    def get(self, url: str, send: Callable[[Dict[str, str]], requests.Response]) -> requests.Response:
+        """
+        Serves url from the cache or through send(extra_headers).
+        Stale entries are revalidated with If-None-Match / If-Modified-Since.
+        """
+        cached = self.load(url)
+        if self.mode == "offline":
+            if cached is None:
+                self.misses += 1
+                raise CacheMissError(f"{url} is not in the cache (offline mode)")
+            self.hits += 1
+            self._touch(url)
+            return _build_response(url, *cached)
+
+        if cached is not None and self.mode == "default" and self.is_fresh(cached[0]):
+            self.hits += 1
+            self._touch(url)
+            return _build_response(url, *cached)
+
+        conditional_headers = {}
+        if cached is not None:
+            stored_headers = cached[0].get("headers", {})
+            if "ETag" in stored_headers:
+                conditional_headers["If-None-Match"] = stored_headers["ETag"]
+            if "Last-Modified" in stored_headers:
+                conditional_headers["If-Modified-Since"] = stored_headers["Last-Modified"]
+
+        response = send(conditional_headers)
+        if response.status_code == 304 and cached is not None:
+            self.revalidated += 1
+            entry, body = cached
+            entry["stored_at"] = time.time()
+            for name in STORED_HEADERS:
+                if name in response.headers:
+                    entry["headers"][name] = response.headers[name]
+            self._write(url, entry, None)
+            return _build_response(url, entry, body)
+
+        self.misses += 1
+        if response.status_code == 200:
+            self.store(url, response)
+        return response
+
+
+_settings = {
+    "directory": DEFAULT_CACHE_DIR,
+    "ttl": DEFAULT_TTL,
+    "max_bytes": DEFAULT_MAX_BYTES,
+    "mode": "default",
+}
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def configure(
+    mode: Optional[str] = None,
+    directory: Optional[str] = None,
+    ttl: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+) -> None:
+    """Updates cache settings. The shared cache is rebuilt on next use."""
+    global _cache
+    if mode is not None and mode not in CACHE_MODES:
+        raise ValueError(f"Unknown cache mode '{mode}', expected one of {CACHE_MODES}")
+    updates = {"mode": mode, "directory": directory, "ttl": ttl, "max_bytes": max_bytes}
+    with _cache_lock:
+        _settings.update({key: value for key, value in updates.items() if value is not None})
+        _cache = None
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """Returns the shared cache, or None when caching is switched off."""
+    global _cache
+    with _cache_lock:
+        if _settings["mode"] == "off":
+            return None
+        if _cache is None:
+            _cache = ResponseCache(**_settings)
+        return _cache
@@ -0,0 +1,136 @@
+import threading
+from typing import Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import http_cache, profiler, rate_limiter
+
+# Shared HTTP transport for every scraping tool. A single Session keeps
+# connections to apps.apple.com alive between pages instead of paying a new
+# TCP+TLS handshake per request.
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+DEFAULT_POOL_SIZE = 16
+DEFAULT_TIMEOUT = (5.0, 30.0)  # (connect, read) seconds
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+# Server errors retried by the transport itself. Throttling answers (429 and
+# 503, rate_limiter.THROTTLE_STATUS_CODES) are left to the rate limiter alone,
+# which slows the host down and honours Retry-After; retrying them here too
+# would back off twice and hide most of them from the limiter.
+RETRY_STATUS_CODES = (500, 502, 504)
+
+Timeout = Union[float, Tuple[float, float]]
+
+_settings = {
+    "pool_size": DEFAULT_POOL_SIZE,
+    "timeout": DEFAULT_TIMEOUT,
+    "retries": DEFAULT_RETRIES,
+    "backoff_factor": DEFAULT_BACKOFF_FACTOR,
+}
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def configure(
+    pool_size: Optional[int] = None,
+    timeout: Optional[Timeout] = None,
+    retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None,
+) -> None:
+    """Updates transport settings. The shared session is rebuilt on next use."""
+    global _session
+    updates = {
+        "pool_size": pool_size,
+        "timeout": timeout,
+        "retries": retries,
+        "backoff_factor": backoff_factor,
+    }
+    with _session_lock:
+        _settings.update({key: value for key, value in updates.items() if value is not None})
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def build_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    retries: int = DEFAULT_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+) -> requests.Session:
+    """Creates a Session with a pooled, retrying adapter mounted for http and https."""
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Returns the process-wide shared session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = build_session(
+                pool_size=_settings["pool_size"],
+                retries=_settings["retries"],
+                backoff_factor=_settings["backoff_factor"],
+            )
+        return _session
+
+
+def send(url: str, **kwargs) -> requests.Response:
+    """
+    A GET through the shared session, paced by the per-host rate limiter.
+    Throttled answers (429/503) are retried once the host's pause is over;
+    the last one is returned as is.
+    """
+    limiter = rate_limiter.get_limiter()
+    host = limiter.host_of(url)
+    for attempt in range(1, rate_limiter.DEFAULT_ATTEMPTS + 1):
+        waited = limiter.acquire(url)
+        if waited:
+            profiler.record("http.rate_wait", waited, host=host)
+        with profiler.span("http.get", host=host, attempt=attempt) as span:
+            try:
+                response = get_session().get(url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                limiter.record_failure(url)
+                raise
+            span.update(status=response.status_code, bytes=len(response.content or b""))
+        if not limiter.record_response(url, response) or attempt == rate_limiter.DEFAULT_ATTEMPTS:
+            return response
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """
+    Issues a GET through the shared session, applying the default timeout.
+    Plain page fetches are served through the on-disk response cache.
+    """
+    kwargs.setdefault("timeout", _settings["timeout"])
+    cache = http_cache.get_cache()
+    if cache is None or kwargs.get("params"):
+        return send(url, **kwargs)
+
+    headers = kwargs.pop("headers", None) or {}
+
+    def send_conditional(conditional_headers):
+        return send(url, headers={**headers, **conditional_headers}, **kwargs)
+
+    return cache.get(url, send_conditional)
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .disk_lru import DiskLRU
+
+# Persistent cache of LLM answers. An entry is keyed on the model, its
+# sampling parameters and the normalized prompt messages, and stored as
+# <key>.json holding the request and the answer, in a disk_lru directory
+# like the HTTP cache.
+
+# default: serve cached answers, call the model on a miss and store its answer
+# record:  always call the model and (re)store its answer
+# replay:  only serve cached answers, never call the model
+# off:     bypass the cache entirely
+CACHE_MODES = ("default", "record", "replay", "off")
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "llm")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+Messages = Union[str, List[Dict[str, Any]]]
+
+
+class LLMCacheMissError(RuntimeError):
+    """Raised in replay mode when a prompt has no recorded answer."""
+
+
+def _normalize_text(text: str) -> str:
+    return "\n".join(line.rstrip() for line in text.strip().splitlines())
+
+
+def normalize_messages(messages: Messages) -> List[Dict[str, str]]:
+    """Chat messages with only role and content, and insignificant whitespace removed."""
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+    normalized = []
+    for message in messages:
+        content = message.get("content") or ""
+        if not isinstance(content, str):
+            content = json.dumps(content, sort_keys=True)
+        normalized.append({"role": message.get("role", "user"), "content": _normalize_text(content)})
+    return normalized
+
+
+def cache_key(model: str, messages: Messages, params: Optional[Dict[str, Any]] = None) -> str:
+    request = {
+        "model": model,
+        "params": {name: value for name, value in (params or {}).items() if value is not None},
+        "messages": normalize_messages(messages),
+    }
+    return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Size-bounded LRU cache of LLM answers."""
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        mode: str = "default",
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode '{mode}', expected one of {CACHE_MODES}")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self.files = DiskLRU(directory, max_bytes)
+
+    def load(self, key: str) -> Optional[str]:
+        """The stored answer for key, or None."""
+        try:
+            with open(self.files.path(key), "r", encoding="utf-8") as entry_file:
+                response = json.load(entry_file)["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+        self.files.touch(key)
+        return response
+
+    def store(self, key: str, model: str, messages: Messages, params: Optional[Dict[str, Any]], response: str) -> None:
+        entry = {
+            "model": model,
+            "params": params or {},
+            "messages": normalize_messages(messages),
+            "response": response,
+            "stored_at": time.time(),
+        }
+        self.files.write(key, {".json": json.dumps(entry, default=str).encode("utf-8")})
+
+    def get(
+        self,
+        model: str,
+        messages: Messages,
+        call: Callable[[], Any],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Serves the answer to messages from the cache or through call().
+        Only string answers are stored.
+        """
+        key = cache_key(model, messages, params)
+        if self.mode != "record":
+            response = self.load(key)
+            if response is not None:
+                self.hits += 1
+                return response
+        self.misses += 1
+        if self.mode == "replay":
+            raise LLMCacheMissError(f"No recorded {model} answer for this prompt (replay mode)")
+
+        response = call()
+        if isinstance(response, str):
+            self.store(key, model, messages, params, response)
+        return response
+
+
+_settings = {
+    "directory": DEFAULT_CACHE_DIR,
+    "max_bytes": DEFAULT_MAX_BYTES,
+    "mode": "default",
+}
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def configure(
+    mode: Optional[str] = None,
+    directory: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+) -> None:
+    """Updates cache settings. The shared cache is rebuilt on next use."""
+    global _cache
+    if mode is not None and mode not in CACHE_MODES:
+        raise ValueError(f"Unknown cache mode '{mode}', expected one of {CACHE_MODES}")
+    updates = {"mode": mode, "directory": directory, "max_bytes": max_bytes}
+    with _cache_lock:
+        _settings.update({key: value for key, value in updates.items() if value is not None})
+        _cache = None
+
+
+def get_cache() -> Optional[LLMResponseCache]:
+    """Returns the shared cache, or None when caching is switched off."""
+    global _cache
+    with _cache_lock:
+        if _settings["mode"] == "off":
+            return None
+        if _cache is None:
+            _cache = LLMResponseCache(**_settings)
+        return _cache
+
+
+def cached_completion(model: str, messages: Messages, call: Callable[[], Any], **params) -> Any:
+    """call()'s answer to messages, served from the shared cache when it has been seen before."""
+    cache = get_cache()
+    if cache is None:
+        return call()
+    return cache.get(model, messages, call, params)
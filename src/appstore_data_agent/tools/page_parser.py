@@ -0,0 +1,191 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, Tag
+
+from .game_record import GameRecord, record_from_summary
+
+# lxml builds the tree several times faster than the pure-Python html.parser.
+# It is optional: install it with `pip install appstore_data_agent[fast]`.
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = "lxml"
+except ImportError:
+    DEFAULT_PARSER = "html.parser"
+
+
+class Selector(NamedTuple):
+    """Declares where a field lives in a page."""
+    field: str
+    tag: str
+    css_class: Optional[str] = None  # a single class, or the full class attribute value
+    many: bool = False  # collect every match instead of only the first one
+    within: Optional[str] = None  # field whose (first) match must contain this element
+
+
+class CompiledSelectors:
+    """Selectors indexed by tag name so each element is only checked against relevant ones."""
+
+    def __init__(self, selectors: Iterable[Selector]):
+        self.selectors = list(selectors)
+        self.by_tag: Dict[str, List[Selector]] = {}
+        for selector in self.selectors:
+            self.by_tag.setdefault(selector.tag, []).append(selector)
+        self.single_fields = {selector.field for selector in self.selectors if not selector.many}
+        self.has_many = any(selector.many for selector in self.selectors)
+
+
+def compile_selectors(selectors: Iterable[Selector]) -> CompiledSelectors:
+    return CompiledSelectors(selectors)
+
+
+def _class_matches(element: Tag, css_class: Optional[str]) -> bool:
+    # Same rule as BeautifulSoup's class_ filter: either one of the element's
+    # classes, or the exact value of the whole class attribute.
+    if css_class is None:
+        return True
+    classes = element.get("class")
+    if not classes:
+        return False
+    return css_class in classes or " ".join(classes) == css_class
+
+
+def parse_html(
+    html: Union[str, bytes],
+    parser: Optional[str] = None,
+    from_encoding: Optional[str] = None,
+) -> BeautifulSoup:
+    if isinstance(html, bytes):
+        return BeautifulSoup(html, parser or DEFAULT_PARSER, from_encoding=from_encoding)
+    return BeautifulSoup(html, parser or DEFAULT_PARSER)
+
+
+def extract(
+    page: Union[str, bytes, BeautifulSoup],
+    selectors: CompiledSelectors,
+    parser: Optional[str] = None,
+) -> Dict[str, Union[Tag, List[Tag], None]]:
+    """
+    Pulls every declared field out of page in a single traversal of the tree.
+    Returns the first matching Tag (or None) for single fields and a list of Tags for many fields.
+    """
+    soup = page if isinstance(page, BeautifulSoup) else parse_html(page, parser)
+    found: Dict[str, Union[Tag, List[Tag], None]] = {
+        selector.field: [] if selector.many else None for selector in selectors.selectors
+    }
+    remaining = set(selectors.single_fields)
+
+    for element in soup.descendants:
+        if not isinstance(element, Tag):
+            continue
+        candidates = selectors.by_tag.get(element.name)
+        if not candidates:
+            continue
+        for selector in candidates:
+            if not selector.many and found[selector.field] is not None:
+                continue
+            if not _class_matches(element, selector.css_class):
+                continue
+            if selector.within is not None:
+                container = found.get(selector.within)
+                if container is None or not any(parent is container for parent in element.parents):
+                    continue
+            if selector.many:
+                found[selector.field].append(element)
+            else:
+                found[selector.field] = element
+                remaining.discard(selector.field)
+        # Every field found and nothing left to collect: stop walking the tree
+        if not remaining and not selectors.has_many:
+            break
+    return found
+
+
+# Game detail page, as a typed GameRecord
+GAME_RECORD_SELECTORS = compile_selectors([
+    Selector("title", "h1", "product-header__title"),
+    Selector("developer", "h2", "product-header__identity"),
+    Selector("rating", "span", "we-customer-ratings__averages__display"),
+    Selector("rating_count", "p", "we-customer-ratings__count"),
+    # Only the game's own information list: other lists on the page reuse the item class
+    Selector("info_list", "dl", "information-list"),
+    Selector("info_items", "div", "information-list__item", many=True, within="info_list"),
+    Selector("genre", "span", "information-list__item__definition", within="info_list"),
+    Selector("supports", "div", "supports-list__item__copy", many=True),
+])
+
+# Links anywhere on a page
+PAGE_LINK_SELECTORS = compile_selectors([
+    Selector("links", "a", many=True),
+])
+
+# Editorial story page (APP_STORE_URL)
+STORY_PAGE_SELECTORS = compile_selectors([
+    Selector("app_links", "a", "link link--no-tint link--no-decoration we-product-collection__item", many=True),
+])
+
+
+# Terms of a game page's information list, for items without <dt>/<dd> markup
+INFO_TERMS = (
+    "Seller", "Size", "Category", "Compatibility", "Languages", "Age Rating",
+    "Copyright", "Price", "In-App Purchases", "Location", "Provider",
+)
+
+
+def info_entry(item: Tag) -> Optional[Tuple[str, str]]:
+    """(term, value) of an information list item, e.g. ("Size", "325.1 MB"); None for unknown items."""
+    dt = item.find('dt')
+    dd = item.find('dd')
+    if dt and dd:
+        return dt.get_text(strip=True), dd.get_text(strip=True)
+    text = item.get_text(strip=True)
+    for term in INFO_TERMS:
+        if text.startswith(term):
+            return term, text[len(term):].strip()
+    return None
+
+
+def title_text(title: Tag) -> str:
+    """Text of a product title, without the age rating badge App Store pages put inside the <h1>."""
+    return "".join(
+        string for string in title.find_all(string=True) if not _class_matches(string.parent, "badge")
+    ).strip()
+
+
+def parse_game_record(
+    html: Union[str, bytes],
+    from_encoding: Optional[str] = None,
+    url: Optional[str] = None,
+) -> GameRecord:
+    """
+    Parses a game detail page (found at url) straight into a GameRecord, its
+    values typed once here rather than by every consumer of the page text.
+    """
+    fields = extract(parse_html(html, from_encoding=from_encoding), GAME_RECORD_SELECTORS)
+    title = fields['title']
+    developer = fields['developer']
+    developer_link = developer.find('a') if developer else None
+    rating = fields['rating']
+    rating_count = fields['rating_count']
+    # The first item of each term wins, as with the single-match fields
+    info_list = {}
+    for term, value in filter(None, map(info_entry, fields['info_items'])):
+        info_list.setdefault(term, value)
+    if "Category" not in info_list and fields['genre']:
+        # Older pages show the genre without a term
+        info_list["Category"] = fields['genre'].get_text(strip=True)
+    game = {
+        'url': url,
+        'title': title_text(title) if title else None,
+        'developer': (developer_link or developer).get_text(strip=True) if developer else None,
+        'rating': rating.get_text(strip=True) if rating else None,
+        'rating_count': rating_count.get_text(strip=True) if rating_count else None,
+        'info_list': info_list,
+        'game_center': " ".join(item.get_text(strip=True) for item in fields['supports']),
+    }
+    return record_from_summary(game, developer_link.get('href') if developer_link else None)
+
+
+def parse_links(html: Union[str, bytes], from_encoding: Optional[str] = None) -> List[str]:
+    """Every href on a page, in page order."""
+    links = extract(parse_html(html, from_encoding=from_encoding), PAGE_LINK_SELECTORS)["links"]
+    return [a.get('href') for a in links if a.get('href')]
@@ -0,0 +1,189 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+# Run profile: timed events from the hot paths (HTTP fetches, page parsing,
+# LLM calls, tool calls), written as JSON lines while the run goes on, and
+# rolled up into an end-of-run summary table. Profiling is off unless
+# configured; the module-level span() and record() are then no-ops.
+#
+# One line per event:
+#   {"ts": <epoch start>, "name": "http.get", "duration_ms": 12.3, "error": false, ...attributes}
+# and a last line {"name": "run.summary", "stats": {...}, "counters": {...}}.
+
+DEFAULT_PROFILE_DIR = os.path.join(".cache", "profiles")
+
+# Attributes summed up per event name in the summary
+SUMMED_ATTRIBUTES = ("bytes", "prompt_tokens", "completion_tokens")
+
+
+def default_profile_path() -> str:
+    return os.path.join(DEFAULT_PROFILE_DIR, time.strftime("run-%Y%m%d-%H%M%S.jsonl"))
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class RunProfile:
+    """Collects timed events and counters; optionally streams them to a JSON lines file."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.started = time.perf_counter()
+        self.counters: Dict[str, int] = {}
+        self._durations: Dict[str, List[float]] = {}
+        self._errors: Dict[str, int] = {}
+        self._sums: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._file = None
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._file = open(path, "w", encoding="utf-8")
+
+    def _write(self, entry: Dict) -> None:
+        if self._file is not None:
+            self._file.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+
+    def record(self, name: str, seconds: float, error: bool = False, **attributes) -> None:
+        with self._lock:
+            self._durations.setdefault(name, []).append(seconds)
+            self._errors[name] = self._errors.get(name, 0) + int(error)
+            sums = self._sums.setdefault(name, {})
+            for key in SUMMED_ATTRIBUTES:
+                if isinstance(attributes.get(key), (int, float)):
+                    sums[key] = sums.get(key, 0) + attributes[key]
+            self._write({
+                "ts": round(time.time() - seconds, 6),
+                "name": name,
+                "duration_ms": round(seconds * 1000, 3),
+                "error": error,
+                **attributes,
+            })
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Dict]:
+        """Times the block. It may add attributes to the yielded dict; an exception marks the event as an error."""
+        started = time.perf_counter()
+        try:
+            yield attributes
+        except BaseException:
+            self.record(name, time.perf_counter() - started, error=True, **attributes)
+            raise
+        self.record(name, time.perf_counter() - started, **attributes)
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            stats = {}
+            for name, durations in sorted(self._durations.items()):
+                ordered = sorted(durations)
+                stats[name] = {
+                    "count": len(ordered),
+                    "errors": self._errors[name],
+                    "total_s": round(sum(ordered), 3),
+                    "mean_ms": round(sum(ordered) / len(ordered) * 1000, 1),
+                    "p50_ms": round(_percentile(ordered, 0.5) * 1000, 1),
+                    "p95_ms": round(_percentile(ordered, 0.95) * 1000, 1),
+                    "max_ms": round(ordered[-1] * 1000, 1),
+                    **{key: value for key, value in self._sums[name].items()},
+                }
+            return stats
+
+    def summary_table(self) -> str:
+        stats = self.stats()
+        header = ["event", "count", "errors", "total s", "mean ms", "p50 ms", "p95 ms", "max ms", "bytes", "tokens"]
+        rows = [header]
+        for name, entry in stats.items():
+            tokens = entry.get("prompt_tokens", 0) + entry.get("completion_tokens", 0)
+            rows.append([
+                name, entry["count"], entry["errors"], entry["total_s"], entry["mean_ms"], entry["p50_ms"],
+                entry["p95_ms"], entry["max_ms"], int(entry.get("bytes", 0)) or "", int(tokens) or "",
+            ])
+        widths = [max(len(str(row[column])) for row in rows) for column in range(len(header))]
+        lines = [
+            "  ".join(str(value).ljust(width) if column == 0 else str(value).rjust(width)
+                      for column, (value, width) in enumerate(zip(row, widths)))
+            for row in rows
+        ]
+        lines.insert(1, "-" * len(lines[0]))
+        with self._lock:
+            counters = dict(sorted(self.counters.items()))
+        if counters:
+            lines.append("")
+            lines.extend(f"{name}: {value}" for name, value in counters.items())
+        lines.append(f"wall time: {time.perf_counter() - self.started:.1f} s")
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        stats = self.stats()
+        with self._lock:
+            self._write({
+                "name": "run.summary",
+                "wall_s": round(time.perf_counter() - self.started, 3),
+                "stats": stats,
+                "counters": dict(self.counters),
+            })
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def watch_crew_events(profile: RunProfile) -> None:
+    """Records every crewAI tool call (name, task, duration) in profile."""
+    from crewai.events import ToolUsageErrorEvent, ToolUsageFinishedEvent, crewai_event_bus
+
+    @crewai_event_bus.on(ToolUsageFinishedEvent)
+    def on_tool_finished(source, event):
+        profile.record(
+            f"tool.{event.tool_name}",
+            (event.finished_at - event.started_at).total_seconds(),
+            task=event.task_name,
+            from_cache=event.from_cache,
+        )
+
+    @crewai_event_bus.on(ToolUsageErrorEvent)
+    def on_tool_error(source, event):
+        profile.count(f"tool.{event.tool_name}.errors")
+
+
+_profile: Optional[RunProfile] = None
+
+
+def configure(path: Optional[str] = None, enabled: bool = True) -> Optional[RunProfile]:
+    """Starts a new run profile (streamed to path, if given), or turns profiling off."""
+    global _profile
+    if _profile is not None:
+        _profile.close()
+    _profile = RunProfile(path) if enabled else None
+    return _profile
+
+
+def get_profile() -> Optional[RunProfile]:
+    return _profile
+
+
+def record(name: str, seconds: float, error: bool = False, **attributes) -> None:
+    if _profile is not None:
+        _profile.record(name, seconds, error=error, **attributes)
+
+
+def count(name: str, n: int = 1) -> None:
+    if _profile is not None:
+        _profile.count(name, n)
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Dict]:
+    if _profile is None:
+        yield attributes
+        return
+    with _profile.span(name, **attributes) as span_attributes:
+        yield span_attributes
@@ -0,0 +1,229 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+
+# Per-host request pacing for apps.apple.com and the search engine. Every
+# host gets a token bucket whose rate adapts to how the host answers: it
+# creeps up while requests succeed and is halved on a 429/503 (AIMD). A
+# Retry-After header pauses the host for that long. After several failures in
+# a row the host's circuit opens: its requests wait out a cooldown, which
+# doubles while failures continue, instead of being fired (and failing) anyway.
+
+DEFAULT_RATE = 5.0  # requests per second, per host
+DEFAULT_BURST = 5
+DEFAULT_MIN_RATE = 0.2
+DEFAULT_MAX_RATE = 20.0
+DEFAULT_RATE_INCREASE = 0.1  # added to the rate after each success
+DEFAULT_FAILURE_THRESHOLD = 5  # consecutive failures that open the circuit
+DEFAULT_COOLDOWN = 10.0  # seconds, first pause of an open circuit
+DEFAULT_MAX_COOLDOWN = 300.0
+DEFAULT_ATTEMPTS = 4  # tries of a throttled request before giving up
+
+# Answers that mean "slow down" rather than "this page is broken"
+THROTTLE_STATUS_CODES = (429, 503)
+
+T = TypeVar("T")
+
+
+def retry_after_seconds(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Delay of a Retry-After header, given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - (time.time() if now is None else now))
+
+
+def _status_of(error: Exception) -> Optional[int]:
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+class TokenBucket:
+    """Hands out rate tokens per second, with up to burst of them saved up."""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.clock = clock
+        self.tokens = float(self.burst)
+        self.updated = clock()
+
+    def reserve(self) -> float:
+        """Takes a token. Returns how long to wait before using it (not thread safe on its own)."""
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class HostState:
+    """Rate, pause and failure count of one host."""
+
+    def __init__(self, limiter: "RateLimiter"):
+        self.bucket = TokenBucket(limiter.rate, limiter.burst, limiter.clock)
+        self.paused_until = 0.0
+        self.failures = 0
+        self.cooldown = limiter.cooldown
+        self.throttled = 0
+        self.circuit_opened = 0
+
+
+class RateLimiter:
+    """Adaptive token bucket and circuit breaker per host."""
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        min_rate: float = DEFAULT_MIN_RATE,
+        max_rate: float = DEFAULT_MAX_RATE,
+        rate_increase: float = DEFAULT_RATE_INCREASE,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+        max_cooldown: float = DEFAULT_MAX_COOLDOWN,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max(rate, max_rate)
+        self.rate_increase = rate_increase
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+        self.sleep = sleep
+        self._hosts: Dict[str, HostState] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlsplit(url).netloc.lower() or url.lower()
+
+    def state(self, host: str) -> HostState:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = HostState(self)
+            return state
+
+    def acquire(self, url: str) -> float:
+        """Blocks until a request to url's host may go out. Returns the time waited."""
+        host = self.host_of(url)
+        state = self.state(host)
+        with self._lock:
+            delay = max(0.0, state.paused_until - self.clock()) + state.bucket.reserve()
+        if delay > 0:
+            self.sleep(delay)
+        return delay
+
+    def record_success(self, url: str) -> None:
+        state = self.state(self.host_of(url))
+        with self._lock:
+            state.failures = 0
+            state.cooldown = self.cooldown
+            state.bucket.rate = min(self.max_rate, state.bucket.rate + self.rate_increase)
+
+    def record_failure(self, url: str, throttled: bool = False, retry_after: Optional[float] = None) -> None:
+        """
+        A failed request: throttled when the host asked to slow down (429/503),
+        otherwise a connection error or timeout.
+        """
+        state = self.state(self.host_of(url))
+        with self._lock:
+            now = self.clock()
+            state.failures += 1
+            if throttled:
+                state.throttled += 1
+                state.bucket.rate = max(self.min_rate, state.bucket.rate / 2)
+            if retry_after is not None:
+                state.paused_until = max(state.paused_until, now + retry_after)
+            if state.failures >= self.failure_threshold:
+                # Open circuit: hold every request to the host for the cooldown
+                state.paused_until = max(state.paused_until, now + state.cooldown)
+                state.cooldown = min(self.max_cooldown, state.cooldown * 2)
+                state.circuit_opened += 1
+                state.failures = 0
+
+    def record_response(self, url: str, response: requests.Response) -> bool:
+        """
+        Records a response. Returns True when the host throttled it. Only 2xx
+        and 3xx answers raise the rate; other 5xx count towards opening the
+        circuit, and 4xx (e.g. a 404 for a removed app) say nothing about the host.
+        """
+        status = response.status_code
+        if status in THROTTLE_STATUS_CODES:
+            self.record_failure(url, throttled=True, retry_after=retry_after_seconds(response.headers.get("Retry-After")))
+            return True
+        if status < 400:
+            self.record_success(url)
+        elif status >= 500:
+            self.record_failure(url)
+        return False
+
+    def call(self, url: str, function: Callable[[], T], attempts: int = DEFAULT_ATTEMPTS) -> T:
+        """
+        function() paced as a request to url's host, for clients that do not
+        go through http_client (e.g. the search library). Throttling errors
+        are retried up to attempts times; other errors are raised.
+        """
+        for attempt in range(1, attempts + 1):
+            self.acquire(url)
+            try:
+                result = function()
+            except requests.exceptions.RequestException as e:
+                status = _status_of(e)
+                throttled = status in THROTTLE_STATUS_CODES
+                retry_after = retry_after_seconds(e.response.headers.get("Retry-After")) if throttled else None
+                if status is None or status >= 500 or throttled:
+                    self.record_failure(url, throttled=throttled, retry_after=retry_after)
+                if not throttled or attempt == attempts:
+                    raise
+                continue
+            self.record_success(url)
+            return result
+
+    def stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {
+                host: {
+                    "rate": round(state.bucket.rate, 2),
+                    "throttled": state.throttled,
+                    "circuit_opened": state.circuit_opened,
+                }
+                for host, state in self._hosts.items()
+            }
+
+
+_settings = {"rate": DEFAULT_RATE, "burst": DEFAULT_BURST, "max_rate": DEFAULT_MAX_RATE}
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def configure(rate: Optional[float] = None, burst: Optional[int] = None, max_rate: Optional[float] = None) -> None:
+    """Updates the pacing settings. The shared limiter starts over on next use."""
+    global _limiter
+    updates = {"rate": rate, "burst": burst, "max_rate": max_rate}
+    with _limiter_lock:
+        _settings.update({key: value for key, value in updates.items() if value is not None})
+        _limiter = None
+
+
+def get_limiter() -> RateLimiter:
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter(**_settings)
+        return _limiter
@@ -0,0 +1,405 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Union
+
+from .app_identity import parse_app_url
+from .developer_url_store import parse_developer_url
+from .game_record import GameRecord, record_from_details, record_from_summary
+
+# Embedded SQLite store of every scrape, for cross-run queries. An app gets a
+# new row in snapshots only when its scraped data changed since its latest
+# snapshot; otherwise only apps.last_seen moves. Writes are batched into one
+# transaction per developer (or per flush of a ResultBatch). Snapshots keep
+# the GameRecord's typed values (sizes in bytes, prices in cents), so
+# analytics queries filter and aggregate on the columns directly. Incremental
+# re-crawls read the last page hash and snapshot of every app from here too.
+
+DEFAULT_DB_PATH = os.path.join(".cache", "results.sqlite3")
+DEFAULT_BATCH_SIZE = 100
+
+# Version 1 kept snapshots as page text; see ResultStore._migrate
+SCHEMA_VERSION = 2
+
+GAME_CENTER_FEATURES = ("game_center", "achievements", "leaderboards")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS developers (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    url TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS developers_name ON developers (name);
+
+CREATE TABLE IF NOT EXISTS apps (
+    id INTEGER PRIMARY KEY,
+    developer_id INTEGER REFERENCES developers (id),
+    name TEXT,
+    url TEXT NOT NULL,
+    -- Position in the developer's listing when last recorded, i.e. catalog order
+    listing_position INTEGER NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    -- sha256 of the app's page when last scraped: an identical page is not parsed again
+    page_hash TEXT,
+    -- 0 once a complete crawl of the developer's catalog no longer lists the app
+    listed INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS apps_developer ON apps (developer_id);
+
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    app_id INTEGER NOT NULL REFERENCES apps (id),
+    scraped_at REAL NOT NULL,
+    kind TEXT NOT NULL,
+    -- The developer as the game page shows it (apps.developer_id is the catalog that lists the app)
+    page_developer_name TEXT,
+    page_developer_url TEXT,
+    name TEXT,
+    rating REAL,
+    rating_count INTEGER,
+    size_bytes INTEGER,
+    age_rating INTEGER,
+    price_cents INTEGER,
+    is_free INTEGER,
+    genre TEXT,
+    in_app_purchases INTEGER,
+    content_warnings TEXT,
+    record_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_app ON snapshots (app_id, scraped_at);
+CREATE INDEX IF NOT EXISTS snapshots_scraped_at ON snapshots (scraped_at);
+
+CREATE TABLE IF NOT EXISTS game_center_features (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+    feature TEXT NOT NULL,
+    PRIMARY KEY (snapshot_id, feature)
+);
+CREATE INDEX IF NOT EXISTS game_center_features_feature ON game_center_features (feature);
+"""
+
+# Typed GameRecord values kept in snapshots, by column
+SNAPSHOT_COLUMNS = {
+    "page_developer_name": "developer_name",
+    "page_developer_url": "developer_url",
+    "name": "game_name",
+    "rating": "rating",
+    "rating_count": "rating_count",
+    "size_bytes": "size_bytes",
+    "age_rating": "age_rating",
+    "price_cents": "price_cents",
+    "is_free": "is_free",
+    "genre": "genre",
+    "in_app_purchases": "in_app_purchases",
+    "content_warnings": "content_warnings",
+}
+
+# Latest snapshot of every listed app, with its Game Center features ("," separated)
+LATEST_SNAPSHOTS = """
+SELECT apps.id AS app_id, apps.url, apps.developer_id, apps.page_hash, developers.name AS developer_name,
+       developers.url AS developer_url, snapshots.*,
+       (SELECT GROUP_CONCAT(feature) FROM game_center_features f WHERE f.snapshot_id = snapshots.id) AS features
+FROM apps
+JOIN developers ON developers.id = apps.developer_id
+JOIN snapshots ON snapshots.id = (
+    SELECT id FROM snapshots WHERE snapshots.app_id = apps.id ORDER BY scraped_at DESC, id DESC LIMIT 1
+)
+WHERE apps.listed = 1
+"""
+
+
+def content_hash(data: Union[bytes, str]) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def record_hash(record: Dict) -> str:
+    return content_hash(json.dumps(record, sort_keys=True, ensure_ascii=False))
+
+
+def _flag(value: Optional[int]) -> Optional[bool]:
+    return None if value is None else bool(value)
+
+
+def snapshot_from_record(
+    record: GameRecord,
+    position: Optional[int] = None,
+    kind: str = 'details',
+    page_hash: Optional[str] = None,
+) -> Dict:
+    """
+    Store row for a GameRecord, position-th in its developer's listing. kind
+    tells the scrapers apart: 'details' for GameAppInfoScraperTool, 'research'
+    for the direct pipeline. page_hash is the hash of the page it was parsed from.
+    """
+    row = {column: getattr(record, field) for column, field in SNAPSHOT_COLUMNS.items()}
+    row.update(
+        url=record.url,
+        developer_url=record.developer_url,
+        developer_name=record.developer_name,
+        kind=kind,
+        features=[feature for feature in GAME_CENTER_FEATURES if getattr(record, feature)],
+        record_hash=record_hash(record.as_row()),
+        position=position,
+        page_hash=page_hash,
+    )
+    for column in ("is_free", "in_app_purchases"):
+        row[column] = None if row[column] is None else int(row[column])
+    return row
+
+
+def stored_record(row: Dict) -> GameRecord:
+    """GameRecord of a latest_snapshots row."""
+    features = set((row['features'] or "").split(","))
+    values = {field: row[column] for column, field in SNAPSHOT_COLUMNS.items()}
+    values.update(
+        is_free=_flag(row['is_free']),
+        in_app_purchases=_flag(row['in_app_purchases']),
+        **{feature: feature in features for feature in GAME_CENTER_FEATURES},
+    )
+    return GameRecord(app_id=row['app_id'], url=row['url'], **values)
+
+
+def _version_1_record(kind: str, data: Dict, url: str, developer_url: Optional[str]) -> GameRecord:
+    # Version 1 snapshots held the page summary, the CSV row or (lately) the typed row
+    if kind == 'summary':
+        return record_from_summary(dict(data, url=url), developer_url)
+    if "Game Name" in data:
+        return record_from_details(data, url, developer_url)
+    return GameRecord.from_row(data)
+
+
+class ResultStore:
+    """SQLite store of developers, apps and their scraped snapshots."""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            if self._connection.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                self._migrate()
+            self._connection.executescript(SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _migrate(self) -> None:
+        """
+        Rebuilds the snapshots of a version 1 database with typed columns, in
+        one transaction. Snapshot IDs are kept, so their Game Center features stay.
+        """
+        db = self._connection
+        columns = {row['name'] for row in db.execute("PRAGMA table_info(snapshots)")}
+        if 'record' not in columns:
+            # A new database
+            return
+        old_rows = [dict(row) for row in db.execute(
+            "SELECT snapshots.id, snapshots.app_id, snapshots.scraped_at, snapshots.kind, snapshots.record, "
+            "apps.url, developers.url AS developer_url FROM snapshots "
+            "JOIN apps ON apps.id = snapshots.app_id LEFT JOIN developers ON developers.id = apps.developer_id"
+        )]
+        db.execute("BEGIN")
+        try:
+            db.execute("DROP TABLE snapshots")
+            db.execute("ALTER TABLE apps ADD COLUMN page_hash TEXT")
+            db.execute("ALTER TABLE apps ADD COLUMN listed INTEGER NOT NULL DEFAULT 1")
+            for statement in filter(str.strip, SCHEMA.split(";")):
+                db.execute(statement)
+            for old in old_rows:
+                record = _version_1_record(old['kind'], json.loads(old['record']), old['url'], old['developer_url'])
+                row = snapshot_from_record(record)
+                db.execute(
+                    f"INSERT INTO snapshots (id, app_id, scraped_at, kind, {', '.join(SNAPSHOT_COLUMNS)}, record_hash) "
+                    f"VALUES (?, ?, ?, ?, {', '.join('?' * len(SNAPSHOT_COLUMNS))}, ?)",
+                    (old['id'], old['app_id'], old['scraped_at'], old['kind'],
+                     *(row[column] for column in SNAPSHOT_COLUMNS), row['record_hash']),
+                )
+            db.commit()
+        except BaseException:
+            db.rollback()
+            raise
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def record(self, rows: Iterable[Dict], scraped_at: Optional[float] = None) -> int:
+        """
+        Bulk-inserts snapshot rows (see snapshot_from_record)
+        in one transaction. Returns the number of new snapshots. Rows without a
+        listing position take their place in rows.
+        """
+        scraped_at = time.time() if scraped_at is None else scraped_at
+        added = 0
+        with self._lock, self._connection as db:
+            for position, row in enumerate(rows):
+                identity = parse_app_url(row['url'])
+                if identity is None:
+                    continue
+                developer = parse_developer_url(row['developer_url'] or "")
+                developer_id = int(developer['id']) if developer else None
+                if developer is not None:
+                    db.execute(
+                        "INSERT INTO developers (id, name, url, updated_at) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT (id) DO UPDATE SET name = COALESCE(excluded.name, name), "
+                        "url = excluded.url, updated_at = excluded.updated_at",
+                        (developer_id, row['developer_name'], developer['url'], scraped_at),
+                    )
+                db.execute(
+                    "INSERT INTO apps (id, developer_id, name, url, listing_position, first_seen, last_seen, page_hash) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (id) DO UPDATE SET developer_id = COALESCE(excluded.developer_id, developer_id), "
+                    "name = excluded.name, url = excluded.url, listing_position = excluded.listing_position, "
+                    "last_seen = excluded.last_seen, page_hash = COALESCE(excluded.page_hash, page_hash), listed = 1",
+                    (identity.app_id, developer_id, row['name'], identity.url,
+                     position if row.get('position') is None else row['position'], scraped_at, scraped_at,
+                     row.get('page_hash')),
+                )
+
+                latest = db.execute(
+                    "SELECT record_hash FROM snapshots WHERE app_id = ? ORDER BY scraped_at DESC, id DESC LIMIT 1",
+                    (identity.app_id,),
+                ).fetchone()
+                if latest is not None and latest['record_hash'] == row['record_hash']:
+                    continue
+                cursor = db.execute(
+                    f"INSERT INTO snapshots (app_id, scraped_at, kind, {', '.join(SNAPSHOT_COLUMNS)}, record_hash) "
+                    f"VALUES (?, ?, ?, {', '.join('?' * len(SNAPSHOT_COLUMNS))}, ?)",
+                    (identity.app_id, scraped_at, row['kind'],
+                     *(row[column] for column in SNAPSHOT_COLUMNS), row['record_hash']),
+                )
+                db.executemany(
+                    "INSERT INTO game_center_features (snapshot_id, feature) VALUES (?, ?)",
+                    [(cursor.lastrowid, feature) for feature in row['features']],
+                )
+                added += 1
+        return added
+
+    def record_research(self, research: Dict, page_hashes: Optional[Dict[str, str]] = None) -> int:
+        """
+        Stores the games (GameRecords) of a direct pipeline research dict, under
+        the developer whose catalog listed them. page_hashes maps game urls to
+        the hash of the page each was parsed from.
+        """
+        page_hashes = page_hashes or {}
+        return self.record(
+            dict(
+                snapshot_from_record(game, position, kind='research', page_hash=page_hashes.get(game.url)),
+                developer_url=research['developer_url'],
+            )
+            for position, game in enumerate(research['games'])
+        )
+
+    def unlist(self, url: str) -> None:
+        """Marks an app as no longer listed on its developer's catalog. Its snapshots stay."""
+        identity = parse_app_url(url)
+        if identity is None:
+            return
+        with self._lock, self._connection as db:
+            db.execute("UPDATE apps SET listed = 0 WHERE id = ?", (identity.app_id,))
+
+    def query(self, sql: str, params: Iterable = ()) -> List[Dict]:
+        with self._lock:
+            return [dict(row) for row in self._connection.execute(sql, tuple(params))]
+
+    def latest_snapshot(self, url: str) -> Optional[Dict]:
+        """Latest snapshot of the (listed) app at url, with its page_hash, or None."""
+        identity = parse_app_url(url)
+        if identity is None:
+            return None
+        rows = self.query(LATEST_SNAPSHOTS + " AND apps.id = ?", [identity.app_id])
+        return rows[0] if rows else None
+
+    def latest_snapshots(self, developer_url: Optional[str] = None, features: Iterable[str] = ()) -> List[Dict]:
+        """Latest snapshot of every listed app (of one developer), optionally only apps with all the given features."""
+        sql = LATEST_SNAPSHOTS
+        params = []
+        developer = parse_developer_url(developer_url or "")
+        if developer_url is not None:
+            sql += " AND apps.developer_id = ?"
+            params.append(int(developer['id']) if developer else -1)
+        for feature in features:
+            sql += " AND EXISTS (SELECT 1 FROM game_center_features f WHERE f.snapshot_id = snapshots.id AND f.feature = ?)"
+            params.append(feature)
+        return self.query(sql + " ORDER BY apps.developer_id, apps.listing_position, apps.id", params)
+
+    def research(self, developer_url: str) -> Optional[Dict]:
+        """
+        The direct pipeline's research dict rebuilt from the latest stored
+        snapshot of each of developer_url's apps, whichever scraper took it,
+        or None when nothing is stored.
+        """
+        rows = self.latest_snapshots(developer_url)
+        if not rows:
+            return None
+        return {
+            'developer_name': rows[0]['developer_name'],
+            'developer_url': rows[0]['developer_url'],
+            'games': [stored_record(row) for row in rows],
+        }
+
+
+class ResultBatch:
+    """Buffers snapshot rows and writes them batch_size at a time, in one transaction each."""
+
+    def __init__(self, store: ResultStore, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.store = store
+        self.batch_size = max(1, batch_size)
+        self._rows: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def add(self, row: Dict) -> None:
+        with self._lock:
+            self._rows.append(row)
+            full = len(self._rows) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            rows, self._rows = self._rows, []
+        if rows:
+            self.store.record(rows)
+
+    def __enter__(self) -> "ResultBatch":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+
+_store: Optional[ResultStore] = None
+_store_lock = threading.Lock()
+_db_path = DEFAULT_DB_PATH
+
+
+def configure(db_path: Optional[str] = None) -> None:
+    """Points the shared store at another database. It is reopened on next use."""
+    global _store, _db_path
+    with _store_lock:
+        if db_path is not None:
+            _db_path = db_path
+        if _store is not None:
+            _store.close()
+        _store = None
+
+
+def get_store() -> ResultStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ResultStore(_db_path)
+        return _store
+
+
+def record_research(research: Dict, page_hashes: Optional[Dict[str, str]] = None) -> int:
+    return get_store().record_research(research, page_hashes)
@@ -0,0 +1,77 @@
+# tests/test_analytics.py
+
+import csv
+import json
+
+from src.appstore_data_agent.analytics import frame_from_games, read_catalog, summarize_catalog, summarize_games
+from src.appstore_data_agent.tools.csv_sink import CSV_FIELDNAMES
+from src.appstore_data_agent.tools.game_record import record_from_summary
+
+def game(i, developer="VOODOO", rating="4.5", price="Free", size="100 MB", category="Games", game_center="None"):
+    return record_from_summary({
+        "url": f"https://apps.apple.com/us/app/game-{i}/id{i}",
+        "title": f"Game {i}",
+        "developer": developer,
+        "rating": rating,
+        "rating_count": "1K Ratings",
+        "info_list": {"Price": price, "Size": size, "Category": category},
+        "game_center": game_center,
+    })
+
+GAMES = [
+    game(1, rating="4.8", size="100 MB", game_center="Game Center, Achievements, Leaderboards"),
+    game(2, rating="3.5", size="300 MB", price="$2.99", category="Puzzle"),
+    game(3, rating="4.2", size="200 MB", game_center="Game Center"),
+    game(4, developer="Supercell", rating="N/A", size="1.5 GB", price="$0.99", game_center="Achievements"),
+]
+
+def test_summary_figures():
+    summary = summarize_games(GAMES)
+
+    assert (summary["games"], summary["developers"]) == (4, 2)
+    assert summary["ratings"]["rated_games"] == 3
+    assert summary["ratings"]["mean"] == 4.17
+    assert summary["ratings"]["distribution"] == {"0-1": 0, "1-2": 0, "2-3": 0, "3-4": 1, "4-4.5": 1, "4.5-5": 1}
+    assert summary["size_mb_percentiles"]["p50"] == 250.0
+    assert summary["price_buckets"] == {"free": 2, "$0.01-$0.99": 1, "$1.00-$2.99": 1, "$3.00-$9.99": 0, "$10.00+": 0}
+    assert summary["adoption"] == {"game_center": 0.75, "achievements": 0.5, "leaderboards": 0.25}
+
+def test_breakdowns_are_sorted_and_capped():
+    summary = summarize_games(GAMES, top_n=1)
+
+    free, paid = summary["free_vs_paid"]
+    assert (free["name"], free["games"], free["mean_rating"], free["game_center"]) == ("free", 2, 4.5, 1.0)
+    assert (paid["name"], paid["games"], paid["free_share"]) == ("paid", 2, 0.0)
+    assert summary["genres"] == {"top": [dict(summary["genres"]["top"][0], name="Games", games=3)], "others": 1}
+    assert summary["by_developer"]["top"][0]["name"] == "VOODOO"
+    assert summary["by_developer"]["others"] == 1
+
+def test_summary_size_does_not_grow_with_the_catalog():
+    def catalog(size):
+        return [game(i, category=f"Genre {i % 50}", developer=f"Dev {i % 40}") for i in range(1, size + 1)]
+
+    small = json.dumps(summarize_games(catalog(100)))
+    large = json.dumps(summarize_games(catalog(5000)))
+
+    assert len(large) < len(small) + 100
+
+def test_empty_catalog():
+    summary = summarize_catalog(frame_from_games([]))
+
+    assert summary["games"] == 0
+    assert summary["ratings"]["mean"] is None
+    assert summary["free_vs_paid"] == []
+
+def test_read_catalog_from_scraper_csv(tmp_path):
+    path = tmp_path / "game_center_games.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+        writer.writeheader()
+        writer.writerow({"Developer Name": "Dev1", "Game Name": "Game1", "Ratings": "5.0", "Size": "100 MB", "Age Limit": "4+", "Price": "Free", "Genre": "Action", "Game Center Integ": "Yes", "Achievement": "Yes", "Leaderboard": "No"})
+        writer.writerow({"Developer Name": "Dev1", "Game Name": "Game2", "Ratings": "4.0", "Size": "200 MB", "Age Limit": "9+", "Price": "$2.99", "Genre": "Puzzle", "Game Center Integ": "No", "Achievement": "No", "Leaderboard": "No"})
+
+    summary = summarize_catalog(read_catalog(str(path)))
+
+    assert summary["ratings"]["mean"] == 4.5
+    assert summary["adoption"] == {"game_center": 0.5, "achievements": 0.5, "leaderboards": 0.0}
+    assert [genre["name"] for genre in summary["genres"]["top"]] == ["Action", "Puzzle"]
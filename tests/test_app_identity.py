@@ -0,0 +1,51 @@
+# tests/test_app_identity.py
+
+from src.appstore_data_agent.tools.app_identity import (
+    SeenApps,
+    app_id,
+    canonical_app_url,
+    parse_app_url,
+    unique_app_urls,
+)
+
+HELIX_URL = "https://apps.apple.com/us/app/helix-jump/id1345968745"
+
+
+def test_parse_app_url():
+    identity = parse_app_url("https://apps.apple.com/GB/app/helix-jump/id1345968745?platform=iphone#reviews")
+
+    assert identity.app_id == 1345968745
+    assert identity.storefront == "gb"
+    assert identity.slug == "helix-jump"
+    assert parse_app_url("/app/id1345968745").storefront == "us"
+    assert parse_app_url("https://apps.apple.com/us/developer/voodoo/id714804730") is None
+    assert parse_app_url("https://apps.apple.com/us/story/id1302444839") is None
+
+def test_canonical_app_url_drops_query_and_trailing_path():
+    assert canonical_app_url(HELIX_URL + "?see-all=reviews") == HELIX_URL
+    assert canonical_app_url(HELIX_URL + "/reviews") == HELIX_URL
+    assert canonical_app_url("https://apps.apple.com/us/app/id1345968745") == "https://apps.apple.com/us/app/id1345968745"
+    assert app_id("https://apps.apple.com/fr/app/helix/id1345968745") == "1345968745"
+
+def test_unique_app_urls_keeps_first_url_per_app():
+    urls = [
+        HELIX_URL + "?platform=iphone",
+        "https://apps.apple.com/gb/app/helix-jump/id1345968745",
+        "https://apps.apple.com/us/app/helix-jump-3d/id1345968745",
+        "https://apps.apple.com/us/story/id1302444839",
+        "https://apps.apple.com/us/app/paper-io-2/id1446339408",
+    ]
+
+    assert list(unique_app_urls(urls)) == [HELIX_URL, "https://apps.apple.com/us/app/paper-io-2/id1446339408"]
+
+def test_seen_apps_are_shared_between_collectors():
+    seen = SeenApps()
+
+    assert seen.add(HELIX_URL)
+    assert not seen.add("https://apps.apple.com/gb/app/helix/id1345968745")
+    assert not seen.add("https://example.com/")
+    assert len(seen) == 1
+    assert "https://apps.apple.com/de/app/x/id1345968745" in seen
+    assert list(unique_app_urls([HELIX_URL, "/us/app/paper-io-2/id1446339408"], seen=seen)) == [
+        "https://apps.apple.com/us/app/paper-io-2/id1446339408",
+    ]
@@ -0,0 +1,122 @@
+# tests/test_batch.py
+
+import json
+
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from src.appstore_data_agent.batch import read_developer_names, report_filename, run_batch
+from src.appstore_data_agent.tools import checkpoint, developer_index, developer_url_store, result_store
+from src.appstore_data_agent.tools.columnar_export import read_games
+
+VOODOO_URL = "https://apps.apple.com/us/developer/voodoo/id714804730"
+SUPERCELL_URL = "https://apps.apple.com/us/developer/supercell/id488106216"
+HELIX_URL = "https://apps.apple.com/us/app/helix-jump/id1345968745"
+CLASH_URL = "https://apps.apple.com/us/app/clash-royale/id1053012308"
+
+def developer_page(*game_urls):
+    links = "".join(f'<a href="{url}">Game</a>' for url in game_urls)
+    return f'<section class="l-content-width section section--bordered">{links}</section>'
+
+def game_page(title, developer, developer_url):
+    return f"""
+    <h1 class="product-header__title">{title}</h1>
+    <h2 class="product-header__identity app-header__identity"><a href="{developer_url}">{developer}</a></h2>
+    <dl class="information-list">
+        <div class="information-list__item"><dt>Price</dt><dd>Free</dd></div>
+    </dl>
+    """
+
+PAGES = {
+    VOODOO_URL: developer_page(HELIX_URL),
+    SUPERCELL_URL: developer_page(CLASH_URL),
+    HELIX_URL: game_page("Helix Jump", "VOODOO", VOODOO_URL),
+    CLASH_URL: game_page("Clash Royale", "Supercell", SUPERCELL_URL),
+}
+SEARCH_RESULTS = {"Voodoo": VOODOO_URL, "Supercell": SUPERCELL_URL}
+
+
+def mock_get(url, **kwargs):
+    if url not in PAGES:
+        raise requests.exceptions.HTTPError(f"404 for {url}")
+    response = MagicMock()
+    response.content = PAGES[url].encode("utf-8")
+    response.encoding = "utf-8"
+    return response
+
+def mock_search(query, num_results):
+    name = query.replace(" app store developer page", "")
+    return iter([SEARCH_RESULTS[name]] if name in SEARCH_RESULTS else [])
+
+@pytest.fixture(autouse=True)
+def local_stores(tmp_path):
+    checkpoint.configure(directory=str(tmp_path / "checkpoints"))
+    developer_index.configure(names_file=str(tmp_path / "developer_names.txt"))
+    developer_url_store.configure(store_file=str(tmp_path / "developer_urls.json"))
+    result_store.configure(db_path=str(tmp_path / "results.sqlite3"))
+    yield
+    checkpoint.configure(directory=checkpoint.DEFAULT_CHECKPOINT_DIR, resume=False)
+    developer_index.configure(names_file=developer_index.DEFAULT_NAMES_FILE)
+    developer_url_store.configure(store_file=developer_url_store.DEFAULT_STORE_FILE)
+    result_store.configure(db_path=result_store.DEFAULT_DB_PATH)
+
+def test_read_developer_names_skips_comments_and_duplicates(tmp_path):
+    path = tmp_path / "developers.txt"
+    path.write_text("# nightly\nVoodoo\n\nSupercell  # clash\nVOODOO\n", encoding="utf-8")
+
+    assert read_developer_names(str(path)) == ["Voodoo", "Supercell"]
+
+def test_report_filename():
+    assert report_filename("Nintendo Co., Ltd.") == "nintendo_co_ltd.json"
+
+@patch("src.appstore_data_agent.tools.developer_url_finder.search", side_effect=mock_search)
+@patch("src.appstore_data_agent.tools.http_client.get", side_effect=mock_get)
+def test_run_batch_writes_reports_and_index(mock_http_get, mock_search_call, tmp_path):
+    output_dir = tmp_path / "reports"
+    commentary = MagicMock(side_effect=lambda report, summary: f"{summary['games']} game(s).")
+
+    index = run_batch(["Supercell", "Voodo", "Unknown Studio"], output_dir=str(output_dir), parse_workers=0, commentary=commentary)
+
+    assert [entry["input_name"] for entry in index] == ["Supercell", "Voodo", "Unknown Studio"]
+    assert index[0]["developer_name"] == "Supercell"
+    assert index[1]["developer_name"] == "VOODOO"
+    assert index[1]["report"] == "voodo.json"
+    assert "No App Store developer page" in index[2]["error"]
+    assert commentary.call_count == 2
+
+    with open(output_dir / "voodo.json", encoding="utf-8") as f:
+        report = json.load(f)
+    assert report["note"] == "1 game(s)."
+    assert [game["game_name"] for game in report["games"]] == ["Helix Jump"]
+    with open(output_dir / "index.json", encoding="utf-8") as f:
+        assert json.load(f) == index
+    with open(output_dir / "analytics.json", encoding="utf-8") as f:
+        analytics = json.load(f)
+    assert [developer["name"] for developer in analytics["by_developer"]["top"]] == ["Supercell", "VOODOO"]
+
+@patch("src.appstore_data_agent.tools.developer_url_finder.search", side_effect=mock_search)
+@patch("src.appstore_data_agent.tools.http_client.get", side_effect=mock_get)
+def test_run_batch_exports_typed_catalog(mock_http_get, mock_search_call, tmp_path):
+    pytest.importorskip("pyarrow")
+    output_dir = tmp_path / "reports"
+
+    run_batch(["Supercell", "Voodoo"], output_dir=str(output_dir), parse_workers=0)
+
+    catalog = read_games(str(output_dir / "catalog.parquet"))
+    assert catalog.column("developer_name").to_pylist() == ["Supercell", "VOODOO"]
+    assert catalog.column("price_cents").to_pylist() == [0, 0]
+
+@patch("src.appstore_data_agent.tools.developer_url_finder.search", side_effect=mock_search)
+@patch("src.appstore_data_agent.tools.http_client.get", side_effect=mock_get)
+def test_incremental_batch_writes_delta_reports(mock_http_get, mock_search_call, tmp_path):
+    output_dir = tmp_path / "reports"
+
+    run_batch(["Voodoo", "Supercell"], output_dir=str(output_dir), parse_workers=0, incremental=True)
+    index = run_batch(["Voodoo", "Supercell"], output_dir=str(output_dir), parse_workers=0, incremental=True)
+
+    assert index[0]["delta"] == {"new": 0, "changed": 0, "removed": 0, "unchanged": 1, "failed": 0}
+    with open(output_dir / "supercell_delta.json", encoding="utf-8") as f:
+        delta = json.load(f)
+    assert delta["developer_name"] == "Supercell"
+    assert delta["unchanged"] == 1
@@ -0,0 +1,104 @@
+# tests/test_benchmarks.py
+
+import pytest
+import requests
+
+from benchmarks import corpus
+from benchmarks.replay_server import ReplayServer, route
+from benchmarks.run import compare, configure_offline, crawl, result
+from src.appstore_data_agent.tools import (
+    developer_index,
+    developer_url_store,
+    http_cache,
+    http_client,
+    profiler,
+    rate_limiter,
+)
+from src.appstore_data_agent.tools.page_parser import parse_game_record
+
+GAMES = 7
+
+
+@pytest.fixture
+def small_corpus(tmp_path, monkeypatch):
+    # Small listing pages, so the crawl has to follow the pagination
+    monkeypatch.setattr(corpus, "LISTING_PAGE_SIZE", 3)
+    return corpus.synthesize_corpus(str(tmp_path / "corpus"), games=GAMES)
+
+
+@pytest.fixture
+def replay(small_corpus):
+    with ReplayServer(small_corpus) as server:
+        yield server
+
+
+def test_synthetic_game_pages_parse_like_app_store_pages(small_corpus):
+    url, body = next(small_corpus.game_pages(1))
+    record = parse_game_record(body, url=url)
+
+    assert len(body) > 100_000
+    assert record.game_name.startswith(corpus._title(0))
+    assert record.rating_count is not None
+    assert None not in (record.size_bytes, record.age_rating, record.price_cents, record.genre)
+    assert (record.developer_name, record.developer_url) == (corpus.DEVELOPER_NAME, corpus.DEVELOPER_URL)
+
+def test_synthesized_corpus_is_the_same_on_every_run(tmp_path, small_corpus):
+    again = corpus.synthesize_corpus(str(tmp_path / "again"), games=GAMES)
+
+    assert again.game_urls == small_corpus.game_urls
+    assert again.read(again.game_urls[-1]) == small_corpus.read(small_corpus.game_urls[-1])
+
+def test_ensure_corpus_reuses_a_large_enough_corpus(small_corpus):
+    assert corpus.ensure_corpus(small_corpus.directory, games=GAMES - 1).game_urls == small_corpus.game_urls
+
+def test_replay_server_serves_routed_app_store_urls(small_corpus, replay):
+    session = requests.Session()
+    route(session, replay.base_url)
+    url = small_corpus.game_urls[2]
+
+    response = session.get(url)
+    missing = session.get("https://apps.apple.com/us/app/missing/id1")
+
+    assert response.status_code == 200
+    assert response.content == small_corpus.read(url)
+    assert missing.status_code == 404
+    assert replay.requests_served == 2
+
+def test_replay_server_holds_answers_back_by_the_latency(small_corpus):
+    with ReplayServer(small_corpus, latency=0.2) as server:
+        response = requests.get(server.base_url + "/missing")
+
+    assert response.elapsed.total_seconds() >= 0.2
+
+def test_crawl_scrapes_the_whole_catalog_offline(small_corpus, replay, tmp_path):
+    configure_offline(replay.base_url, str(tmp_path))
+    try:
+        games = crawl(small_corpus, GAMES, parse_workers=0)
+    finally:
+        http_client.configure()
+        http_cache.configure(mode="default")
+        rate_limiter.configure(rate=rate_limiter.DEFAULT_RATE, burst=rate_limiter.DEFAULT_BURST,
+                               max_rate=rate_limiter.DEFAULT_MAX_RATE)
+        profiler.configure(enabled=False)
+        developer_index.configure(names_file=developer_index.DEFAULT_NAMES_FILE)
+        developer_url_store.configure(store_file=developer_url_store.DEFAULT_STORE_FILE)
+
+    assert [game.url for game in games] == small_corpus.game_urls
+
+def test_compare_flags_regressions_in_either_direction(capsys):
+    baseline = {"results": {
+        "crawl.seconds": result(10.0, "s"),
+        "parse.pages_per_s": result(100.0, "pages/s", "higher"),
+        "report.build_ms": result(5.0, "ms"),
+    }}
+    current = {"settings": {}, "results": {
+        "crawl.seconds": result(13.0, "s"),
+        "parse.pages_per_s": result(70.0, "pages/s", "higher"),
+        "report.build_ms": result(5.5, "ms"),
+        "memory.peak_mb": result(20.0, "MB"),
+    }}
+
+    regressions = compare(current, baseline, tolerance=0.25)
+
+    assert regressions == ["crawl.seconds", "parse.pages_per_s"]
+    assert "new" in capsys.readouterr().out
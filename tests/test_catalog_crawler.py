@@ -0,0 +1,61 @@
+# tests/test_catalog_crawler.py
+
+import pytest
+import requests
+
+from src.appstore_data_agent.tools.catalog_crawler import crawl_catalog, parse_catalog_page
+
+DEVELOPER_URL = "https://apps.apple.com/us/developer/voodoo/id714804730"
+SEE_ALL_IPHONE = DEVELOPER_URL + "?see-all=i-phonei-pad-apps"
+SEE_ALL_IPHONE_PAGE_2 = DEVELOPER_URL + "?see-all=i-phonei-pad-apps&page=2"
+SEE_ALL_MAC = DEVELOPER_URL + "?see-all=mac-apps"
+
+def app(i, slug="game"):
+    return f"https://apps.apple.com/us/app/{slug}-{i}/id{i}"
+
+def page(*hrefs):
+    return "".join(f'<a href="{href}">link</a>' for href in hrefs).encode("utf-8")
+
+PAGES = {
+    DEVELOPER_URL: page(app(1), app(2), SEE_ALL_IPHONE, SEE_ALL_MAC, "https://apps.apple.com/us/developer/other/id1?see-all=x"),
+    SEE_ALL_IPHONE: page(app(1), app(2), app(3), "/us/developer/voodoo/id714804730?see-all=i-phonei-pad-apps&page=2"),
+    SEE_ALL_IPHONE_PAGE_2: page(app(4), app(3, slug="renamed"), SEE_ALL_IPHONE),
+    SEE_ALL_MAC: page(app(5) + "?platform=mac"),
+}
+
+
+def fetch(url):
+    if url not in PAGES:
+        raise requests.exceptions.HTTPError(f"404 for {url}")
+    return PAGES[url], "utf-8"
+
+def test_parse_catalog_page_splits_apps_and_listings():
+    app_links, listing_links = parse_catalog_page(PAGES[SEE_ALL_IPHONE], SEE_ALL_IPHONE)
+
+    assert app_links == [app(1), app(2), app(3)]
+    # Relative links are resolved; other developers' pages are ignored
+    assert listing_links == [SEE_ALL_IPHONE_PAGE_2]
+
+def test_crawl_follows_see_all_and_pages_once_per_app():
+    urls = list(crawl_catalog(DEVELOPER_URL, fetch=fetch, max_workers=4))
+
+    assert urls == [app(1), app(2), app(3), app(5), app(4)]
+
+def test_crawl_respects_max_pages():
+    urls = list(crawl_catalog(DEVELOPER_URL, fetch=fetch, max_pages=2))
+
+    assert urls == [app(1), app(2), app(3)]
+
+def test_crawl_skips_failed_listing_pages():
+    def flaky_fetch(url):
+        if url == SEE_ALL_MAC:
+            raise requests.exceptions.ConnectionError("reset")
+        return fetch(url)
+
+    urls = list(crawl_catalog(DEVELOPER_URL, fetch=flaky_fetch))
+
+    assert urls == [app(1), app(2), app(3), app(4)]
+
+def test_crawl_raises_when_developer_page_fails():
+    with pytest.raises(requests.exceptions.HTTPError):
+        list(crawl_catalog("https://apps.apple.com/us/developer/unknown/id1", fetch=fetch))
@@ -0,0 +1,61 @@
+# tests/test_checkpoint.py
+
+from src.appstore_data_agent.tools.checkpoint import (
+    CrawlCheckpoint,
+    checkpoint_path,
+    journal_key,
+)
+
+GAME_0 = "https://apps.apple.com/us/app/test-game-0/id000000000"
+GAME_1 = "https://apps.apple.com/us/app/test-game-1/id111111111"
+GAME_2 = "https://apps.apple.com/us/app/test-game-2/id222222222"
+
+
+def test_journal_key_uses_app_id():
+    assert journal_key(GAME_1) == "id111111111"
+    assert journal_key("https://apps.apple.com/gb/app/renamed/id111111111?uo=4") == "id111111111"
+
+def test_checkpoint_path_sanitizes_developer_name(tmp_path):
+    assert checkpoint_path("Nintendo Co., Ltd.", str(tmp_path)) == str(tmp_path / "Nintendo_Co._Ltd.jsonl")
+
+def test_resume_skips_done_and_retries_failed(tmp_path):
+    path = str(tmp_path / "voodoo.jsonl")
+    journal = CrawlCheckpoint(path)
+    journal.record_done(GAME_0, {"Game Name": "Game 0"}, "https://apps.apple.com/us/developer/x/id1")
+    journal.record_error(GAME_1, IOError("timeout"))
+
+    resumed = CrawlCheckpoint(path, resume=True)
+
+    assert resumed.pending([GAME_0, GAME_1, GAME_2]) == [GAME_1, GAME_2]
+    assert list(resumed.failed) == [journal_key(GAME_1)]
+    assert list(resumed.done_results()) == [
+        (GAME_0, {"Game Name": "Game 0"}, "https://apps.apple.com/us/developer/x/id1"),
+    ]
+
+def test_retry_success_clears_failure(tmp_path):
+    path = str(tmp_path / "voodoo.jsonl")
+    journal = CrawlCheckpoint(path)
+    journal.record_error(GAME_1, IOError("timeout"))
+    journal.record_done(GAME_1, {"Game Name": "Game 1"}, None)
+
+    resumed = CrawlCheckpoint(path, resume=True)
+    assert resumed.failed == {}
+    assert resumed.is_done(GAME_1)
+
+def test_torn_last_line_is_ignored(tmp_path):
+    path = tmp_path / "voodoo.jsonl"
+    journal = CrawlCheckpoint(str(path))
+    journal.record_done(GAME_0, {"Game Name": "Game 0"}, None)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"key": "id111111111", "url": "')
+
+    resumed = CrawlCheckpoint(str(path), resume=True)
+    resumed.record_done(GAME_2, {"Game Name": "Game 2"}, None)
+
+    assert CrawlCheckpoint(str(path), resume=True).pending([GAME_0, GAME_1, GAME_2]) == [GAME_1]
+
+def test_fresh_crawl_truncates_journal(tmp_path):
+    path = str(tmp_path / "voodoo.jsonl")
+    CrawlCheckpoint(path).record_done(GAME_0, {}, None)
+
+    assert CrawlCheckpoint(path).pending([GAME_0]) == [GAME_0]
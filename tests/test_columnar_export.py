@@ -0,0 +1,102 @@
+# tests/test_columnar_export.py
+
+import pytest
+
+from src.appstore_data_agent.tools.columnar_export import ColumnarSink, read_games, typed_row_from_details, write_games
+from src.appstore_data_agent.tools.game_record import (
+    parse_age_rating,
+    parse_price_cents,
+    parse_rating_count,
+    parse_size_bytes,
+    record_from_summary,
+)
+
+pytest.importorskip("pyarrow")
+
+DEVELOPER_URL = "https://apps.apple.com/us/developer/voodoo/id714804730"
+
+GAME = {
+    "url": "https://apps.apple.com/us/app/helix-jump/id1345968745?platform=iphone",
+    "title": "Helix Jump",
+    "developer": "VOODOO",
+    "rating": "4.5",
+    "rating_count": "1.2M Ratings",
+    "info_list": {"Price": "$6.99", "Size": "325.1 MB", "Age Rating": "12+", "Category": "Games"},
+    "game_center": "Game Center, Achievements",
+}
+
+@pytest.mark.parametrize("text, expected", [
+    ("325.1 MB", 325_100_000),
+    ("1.2 GB", 1_200_000_000),
+    ("512 KB", 512_000),
+    ("0 MB", 0),
+    ("N/A", None),
+])
+def test_parse_size_bytes(text, expected):
+    assert parse_size_bytes(text) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("Free", 0),
+    ("$6.99", 699),
+    ("0,99 €", 99),
+    ("$1,299.00", 129_900),
+    ("N/A", None),
+    (None, None),
+])
+def test_parse_price_cents(text, expected):
+    assert parse_price_cents(text) == expected
+
+def test_parse_counts_and_ages():
+    assert parse_rating_count("1.2M Ratings") == 1_200_000
+    assert parse_rating_count("987 Ratings") == 987
+    assert parse_age_rating("Rated 12+") == 12
+    assert parse_age_rating("4+") == 4
+    assert parse_age_rating("N/A") is None
+
+def test_typed_row_from_details():
+    details = {
+        "Developer Name": "Dev1", "Game Name": "Game1", "Ratings": "5.0", "Size": "100 MB", "Age Limit": "9+",
+        "Price": "$2.99", "Genre": "N/A", "Game Center Integ": "Yes", "Achievement": "No", "Leaderboard": "Yes",
+    }
+    row = typed_row_from_details(details, "https://apps.apple.com/us/app/game1/id1?mt=8", DEVELOPER_URL)
+
+    assert row["app_id"] == 1
+    assert row["url"] == "https://apps.apple.com/us/app/game1/id1"
+    assert (row["size_bytes"], row["age_rating"], row["price_cents"], row["is_free"]) == (100_000_000, 9, 299, False)
+    assert (row["game_center"], row["achievements"], row["leaderboards"]) == (True, False, True)
+    assert row["genre"] is None
+
+@pytest.mark.parametrize("filename", ["games.parquet", "games.arrow"])
+def test_write_and_read_games(tmp_path, filename):
+    path = str(tmp_path / filename)
+    free_game = dict(GAME, url="https://apps.apple.com/us/app/paper-io-2/id1446339408", info_list={"Price": "Free"}, game_center="None")
+
+    assert write_games([record_from_summary(GAME, DEVELOPER_URL), record_from_summary(free_game)], path) == 2
+
+    table = read_games(path)
+    assert table.column("app_id").to_pylist() == [1345968745, 1446339408]
+    assert table.column("developer_url").to_pylist() == [DEVELOPER_URL, None]
+    assert table.column("size_bytes").to_pylist() == [325_100_000, None]
+    assert table.column("price_cents").to_pylist() == [699, 0]
+    assert table.column("rating").to_pylist() == [4.5, 4.5]
+    assert table.column("age_rating").to_pylist() == [12, None]
+    assert table.column("achievements").to_pylist() == [True, False]
+    assert table.column("leaderboards").to_pylist() == [False, False]
+    assert str(table.schema.field("is_free").type) == "bool"
+
+def test_sink_writes_row_groups(tmp_path):
+    import pyarrow.parquet as pq
+
+    path = str(tmp_path / "games.parquet")
+    with ColumnarSink(path, row_group_size=2) as sink:
+        for i in range(5):
+            sink.write(typed_row_from_details({"Game Name": f"Game {i}", "Price": "Free"}))
+
+    assert sink.rows_written == 5
+    assert pq.ParquetFile(path).metadata.num_row_groups == 3
+
+def test_sink_without_rows_writes_nothing(tmp_path):
+    path = tmp_path / "games.parquet"
+    ColumnarSink(str(path)).close()
+
+    assert not path.exists()
@@ -0,0 +1,113 @@
+# tests/test_csv_reader_tool.py
+
+import csv
+
+import pytest
+
+from src.appstore_data_agent.archieve.tools.csv_reader_tool import (
+    DISTINCT_SKETCH_SIZE,
+    TRACKED_VALUES,
+    ColumnStats,
+    CSVReaderTool,
+    estimate_tokens,
+    read_page,
+    summarize_csv,
+)
+from src.appstore_data_agent.tools.csv_sink import CSV_FIELDNAMES
+
+def row(i, developer="Dev1", price="Free", game_center="Yes", ratings="4.5"):
+    return {
+        "Developer Name": developer, "Game Name": f"Game{i}", "Ratings": ratings, "Size": "100 MB", "Age Limit": "4+",
+        "Price": price, "Genre": "Action", "Game Center Integ": game_center, "Achievement": "No", "Leaderboard": "No",
+    }
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "game_center_games.csv"
+    rows = [row(i) for i in range(40)]
+    rows += [row(i, developer="Dev2", price="$2.99", game_center="No", ratings="3.5") for i in range(40, 50)]
+    rows.append(row(50, developer="Dev2", ratings="N/A"))
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+def test_summary_is_accumulated_over_chunks(csv_path):
+    summary = summarize_csv(csv_path, chunk_size=7)
+
+    assert summary["rows"] == 51
+    assert summary["ratings"] == {"count": 50, "mean": 4.3, "min": 3.5, "max": 4.5}
+    assert summary["columns"]["Developer Name"]["top"] == {"Dev1": 40, "Dev2": 11}
+    assert summary["columns"]["Ratings"]["filled"] == 50
+    assert summary["columns"]["Game Name"]["distinct"] == 51
+
+def test_summary_with_filters(csv_path):
+    summary = summarize_csv(csv_path, chunk_size=7, developer="dev2", price_type="paid")
+
+    assert summary["rows"] == 10
+    assert summary["columns"]["Game Center Integ"]["top"] == {"No": 10}
+
+def test_pages_stay_within_budget_and_continue(csv_path):
+    first = read_page(csv_path, token_budget=100, chunk_size=7)
+
+    assert estimate_tokens(first) <= 100 + 30
+    lines = first.splitlines()
+    assert lines[0] == ",".join(CSV_FIELDNAMES)
+    shown = len(lines) - 2
+    assert lines[1].startswith("Dev1,Game0,")
+    assert f"offset={shown}" in lines[-1]
+
+    second = read_page(csv_path, offset=shown, token_budget=100, chunk_size=7)
+    assert second.splitlines()[1].startswith(f"Dev1,Game{shown},")
+
+def test_filtered_page(csv_path):
+    page = read_page(csv_path, token_budget=10_000, chunk_size=7, game_center=False)
+
+    lines = page.splitlines()
+    assert len(lines) == 12
+    assert all(line.startswith("Dev2,") for line in lines[1:-1])
+    assert lines[-1].endswith("no more rows)")
+
+def test_page_reports_a_row_over_the_budget(csv_path):
+    header_tokens = estimate_tokens(",".join(CSV_FIELDNAMES) + "\n")
+    page = read_page(csv_path, offset=3, token_budget=header_tokens + 5, chunk_size=7)
+
+    assert "no matching rows" not in page
+    assert "larger max_tokens" in page.splitlines()[-1]
+    assert "offset=4" in page.splitlines()[-1]
+
+def test_tool_caps_the_budget(csv_path):
+    tool = CSVReaderTool(token_budget=60)
+
+    page = tool._run(csv_path, mode="rows", max_tokens=10_000)
+    assert len(page.splitlines()) < 10
+    assert "Rows: 51" in tool._run(csv_path)
+    assert "was not found" in tool._run(csv_path + ".missing")
+
+def test_column_stats_stay_bounded_on_unique_values():
+    import pandas as pd
+
+    stats = ColumnStats()
+    for start in range(0, 20_000, 500):
+        stats.add(pd.Series([f"Game{i}" for i in range(start, start + 500)] + ["Hit"] * 10))
+
+    assert len(stats.counts) <= TRACKED_VALUES
+    assert len(stats.distinct.hashes) <= DISTINCT_SKETCH_SIZE
+    summary = stats.summary()
+    assert summary["top"]["Hit"] == 400
+    assert summary["distinct_exact"] is False
+    assert abs(summary["distinct"] - 20_001) < 20_001 * 0.1
+
+def test_summary_of_a_file_with_many_unique_values(tmp_path):
+    path = tmp_path / "many.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(row(i) for i in range(5000))
+
+    summary = summarize_csv(str(path), chunk_size=250)
+
+    assert summary["columns"]["Developer Name"] == {"filled": 5000, "distinct": 1, "distinct_exact": True, "top": {"Dev1": 5000}}
+    assert abs(summary["columns"]["Game Name"]["distinct"] - 5000) < 500
+    assert "/ ~" in CSVReaderTool()._run(str(path))
@@ -0,0 +1,88 @@
+# tests/test_csv_sink.py
+
+import csv
+
+from src.appstore_data_agent.tools.csv_sink import CSVSink, FanOutSink, OrderedRelease
+
+FREE_GAME = {"Developer Name": "Dev1", "Game Name": "Game1", "Ratings": "5.0", "Size": "100 MB", "Age Limit": "4+", "Price": "Free", "Genre": "Action", "Game Center Integ": "Yes", "Achievement": "Yes", "Leaderboard": "Yes"}
+PAID_GAME = {"Developer Name": "Dev2", "Game Name": "Game2", "Ratings": "4.0", "Size": "200 MB", "Age Limit": "9+", "Price": "$2.99", "Genre": "Puzzle", "Game Center Integ": "No", "Achievement": "No", "Leaderboard": "No"}
+
+
+def read_rows(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+def test_sink_fans_out_and_splits_by_predicate(tmp_path):
+    all_path = tmp_path / "all.csv"
+    free_path = tmp_path / "free.csv"
+    paid_path = tmp_path / "paid.csv"
+
+    with FanOutSink([
+        CSVSink(str(all_path)),
+        CSVSink(str(free_path), predicate=lambda row: "Free" in row["Price"]),
+        CSVSink(str(paid_path), predicate=lambda row: "Free" not in row["Price"]),
+    ]) as sink:
+        sink.write(FREE_GAME)
+        sink.write(PAID_GAME)
+
+    assert read_rows(all_path) == [FREE_GAME, PAID_GAME]
+    assert read_rows(free_path) == [FREE_GAME]
+    assert read_rows(paid_path) == [PAID_GAME]
+
+def test_sink_flushes_periodically(tmp_path):
+    path = tmp_path / "all.csv"
+    sink = CSVSink(str(path), flush_every=2)
+    sink.write(FREE_GAME)
+    sink.write(PAID_GAME)
+
+    # Readable before the sink is closed
+    assert read_rows(path) == [FREE_GAME, PAID_GAME]
+    sink.close()
+
+def test_sink_without_rows_creates_no_file(tmp_path):
+    path = tmp_path / "paid.csv"
+    sink = CSVSink(str(path), predicate=lambda row: False)
+    sink.write(FREE_GAME)
+    sink.close()
+
+    assert not path.exists()
+    assert sink.rows_written == 0
+
+def test_ordered_release_emits_in_index_order():
+    emitted = []
+    release = OrderedRelease(emitted.append)
+
+    release.put(2, "c")
+    release.put(1, "b")
+    assert emitted == []
+    assert release.buffered == 2
+
+    release.put(0, "a")
+    assert emitted == ["a", "b", "c"]
+    assert release.buffered == 0
+
+def test_ordered_release_flush_emits_items_behind_a_gap():
+    emitted = []
+    release = OrderedRelease(emitted.append)
+    release.put(0, "a")
+    release.put(3, "d")
+    release.put(2, "c")
+
+    assert release.flush() == 2
+    assert emitted == ["a", "c", "d"]
+    assert release.buffered == 0
+    release.put(4, "e")
+    assert emitted[-1] == "e"
+
+def test_ordered_release_spills_past_max_buffered():
+    emitted = []
+    release = OrderedRelease(emitted.append, max_buffered=2)
+    for index in range(5, 0, -1):
+        release.put(index, {"row": index})
+
+    assert release.buffered == 5
+    assert len(release._pending) == 2
+    release.put(0, {"row": 0})
+    assert emitted == [{"row": index} for index in range(6)]
+    assert release.buffered == 0
+    assert release._spill_file is None
@@ -13,7 +13,6 @@ from src.appstore_data_agent.tools.custom_tool import (
     OUTPUT_CSV_FILE,
     SCRAPED_FREE_GAMES_FILE,
     SCRAPED_PAID_GAMES_FILE,
-    scrape_game_details,
     is_game_free2play,
     write_to_csv,
 )
@@ -59,44 +58,6 @@ def mock_write_to_csv():
     with patch("src.appstore_data_agent.tools.custom_tool.write_to_csv") as mock_write:
         yield mock_write
 
-# Test cases for scrape_game_details
-def test_scrape_game_details_success(mock_response):
-    mock_response.return_value.text = MOCK_GAME_DETAIL_HTML
-    mock_response.return_value.raise_for_status.return_value = None
-    
-    game_url = "https://apps.apple.com/us/app/test-game/id12345"
-    details, developer_url = scrape_game_details(game_url)
-
-    assert details["Game Name"] == "Test Game Name"
-    assert details["Developer Name"] == "Test Developer"
-    assert details["Ratings"] == "4.5"
-    assert details["Size"] == "400 MB"
-    assert details["Age Limit"] == "4+"
-    assert details["Price"] == "Free"
-    assert details["Genre"] == "Action"
-    assert details["Game Center Integ"] == "Yes"
-    assert details["Achievement"] == "Yes"
-    assert details["Leaderboard"] == "Yes"
-    assert developer_url == "https://apps.apple.com/us/developer/test-developer/id123456789"
-
-def test_scrape_game_details_network_error(mock_response):
-    mock_response.side_effect = requests.exceptions.RequestException("Network error")
-    game_url = "https://apps.apple.com/us/app/test-game/id12345"
-    details, developer_url = scrape_game_details(game_url)
-    assert details == {
-        "Developer Name": "N/A",
-        "Game Name": "N/A",
-        "Ratings": "N/A",
-        "Size": "0 MB",
-        "Age Limit": "N/A",
-        "Price": "Free",
-        "Genre": "N/A",
-        "Achievement": "No",
-        "Leaderboard": "No",
-        "Game Center Integ": "No",
-    }
-    assert developer_url is None
-
 # Test cases for is_game_free2play
 def test_is_game_free2play_free_game():
     game_details = {"Price": "Free"}
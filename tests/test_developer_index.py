@@ -0,0 +1,60 @@
+# tests/test_developer_index.py
+
+import pytest
+
+from src.appstore_data_agent.tools import developer_index
+from src.appstore_data_agent.tools.developer_index import (
+    DeveloperNameIndex,
+    edit_distance,
+    normalize_name,
+)
+
+
+@pytest.fixture
+def names_file(tmp_path):
+    path = tmp_path / "developer_names.txt"
+    developer_index.configure(names_file=str(path))
+    yield path
+    developer_index.configure(names_file=developer_index.DEFAULT_NAMES_FILE)
+
+def test_normalize_name_drops_punctuation_and_legal_suffixes():
+    assert normalize_name("Nintendo Co., Ltd.") == "nintendo"
+    assert normalize_name("Miniclip.com") == "miniclip"
+    assert normalize_name("King") == "king"
+
+def test_edit_distance():
+    assert edit_distance("voodo", "voodoo") == 1
+    assert edit_distance("nintenddo", "nintendo") == 1
+    assert edit_distance("", "abc") == 3
+
+@pytest.mark.parametrize("query, expected", [
+    ("Voodo", "Voodoo"),
+    ("Nintenddo", "Nintendo Co., Ltd."),
+    ("nintendo", "Nintendo Co., Ltd."),
+    ("Sybo", "SYBO Games"),
+    ("Supercel", "Supercell"),
+])
+def test_best_match_resolves_misspellings(query, expected):
+    index = DeveloperNameIndex(developer_index.SEED_DEVELOPER_NAMES)
+    assert index.best_match(query) == expected
+
+def test_best_match_below_threshold_returns_none():
+    index = DeveloperNameIndex(developer_index.SEED_DEVELOPER_NAMES)
+    assert index.best_match("xyzcorp") is None
+    assert index.best_match("Voodo", threshold=0.99) is None
+
+def test_add_ignores_equivalent_spellings():
+    index = DeveloperNameIndex(["Nintendo Co., Ltd."])
+    assert index.add("NINTENDO CO LTD") is False
+    assert len(index) == 1
+
+def test_remember_developer_name_persists_new_names(names_file):
+    developer_index.remember_developer_name("Kwalee Ltd")
+    developer_index.remember_developer_name("Kwalee Ltd")
+    developer_index.remember_developer_name("N/A")
+
+    assert names_file.read_text(encoding="utf-8") == "Kwalee Ltd\n"
+
+    # A fresh index picks the scraped name up from disk
+    developer_index.configure(names_file=str(names_file))
+    assert developer_index.get_index().best_match("Kwale") == "Kwalee Ltd"
@@ -0,0 +1,62 @@
+# tests/test_developer_url_store.py
+
+import pytest
+from unittest.mock import patch
+
+from src.appstore_data_agent.tools import developer_url_store
+from src.appstore_data_agent.tools.developer_url_finder import DeveloperURLFinderTool
+from src.appstore_data_agent.tools.developer_url_store import (
+    DeveloperURLStore,
+    parse_developer_url,
+)
+
+VOODOO_URL = "https://apps.apple.com/us/developer/voodoo/id714804730"
+
+
+@pytest.fixture
+def store_file(tmp_path):
+    path = tmp_path / "developer_urls.json"
+    developer_url_store.configure(store_file=str(path))
+    yield path
+    developer_url_store.configure(store_file=developer_url_store.DEFAULT_STORE_FILE)
+
+def test_parse_developer_url():
+    assert parse_developer_url(VOODOO_URL + "?see-all=i-phonei-pad-apps") == {
+        "slug": "voodoo",
+        "id": "714804730",
+        "url": VOODOO_URL,
+    }
+    assert parse_developer_url("https://apps.apple.com/us/app/helix-jump/id1345968745") is None
+    assert parse_developer_url("https://example.com/developer/voodoo/id1") is None
+
+def test_record_and_resolve_by_name_slug_and_misspelling(store_file):
+    store = DeveloperURLStore(str(store_file))
+    assert store.record("Nintendo Co., Ltd.", "https://apps.apple.com/us/developer/nintendo-co-ltd/id416186449") is True
+    assert store.record("Nintendo Co., Ltd.", "https://apps.apple.com/us/developer/nintendo-co-ltd/id416186449") is False
+
+    assert store.resolve("Nintendo") == "https://apps.apple.com/us/developer/nintendo-co-ltd/id416186449"
+    assert store.resolve("nintendo co ltd") == "https://apps.apple.com/us/developer/nintendo-co-ltd/id416186449"
+    assert store.resolve("Nintenddo") == "https://apps.apple.com/us/developer/nintendo-co-ltd/id416186449"
+    assert store.resolve("Supercell") is None
+
+def test_store_persists_between_instances(store_file):
+    DeveloperURLStore(str(store_file)).record("Voodoo", VOODOO_URL)
+    assert DeveloperURLStore(str(store_file)).resolve("voodoo") == VOODOO_URL
+
+def test_finder_uses_store_before_search(store_file):
+    developer_url_store.record_developer_url("Voodoo", VOODOO_URL)
+
+    with patch("src.appstore_data_agent.tools.developer_url_finder.search") as mock_search:
+        result = DeveloperURLFinderTool()._run(developer_name="Voodoo")
+
+    assert result == VOODOO_URL
+    mock_search.assert_not_called()
+
+def test_finder_records_search_results(store_file):
+    with patch("src.appstore_data_agent.tools.developer_url_finder.search") as mock_search:
+        mock_search.return_value = ["https://example.com", "https://apps.apple.com/us/developer/supercell/id488106216"]
+        DeveloperURLFinderTool()._run(developer_name="Supercell")
+        result = DeveloperURLFinderTool()._run(developer_name="Supercell")
+
+    assert result == "https://apps.apple.com/us/developer/supercell/id488106216"
+    mock_search.assert_called_once()
@@ -0,0 +1,33 @@
+# tests/test_disk_lru.py
+
+import os
+
+from src.appstore_data_agent.tools.disk_lru import DiskLRU
+
+
+def test_write_keeps_companion_files_and_counts_their_size(tmp_path):
+    files = DiskLRU(str(tmp_path), max_bytes=1024, companions=(".body",))
+    files.write("a", {".body": b"x" * 100, ".json": b"{}"})
+
+    assert list(files.entries())[0][0] == "a"
+    assert files.size == 102
+    # None keeps the stored companion
+    files.write("a", {".body": None, ".json": b'{"k": 1}'})
+    assert open(files.path("a", ".body"), "rb").read() == b"x" * 100
+    assert files.size == 108
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+def test_eviction_drops_least_recently_used_entries(tmp_path):
+    files = DiskLRU(str(tmp_path), max_bytes=250, companions=(".body",))
+    for key in ("a", "b"):
+        files.write(key, {".body": b"x" * 100, ".json": b"{}"})
+    os.utime(files.path("a"), (1, 1))
+    files.touch("a")
+    os.utime(files.path("b"), (2, 2))
+
+    files.write("c", {".body": b"x" * 100, ".json": b"{}"})
+
+    assert sorted(key for key, _, _ in files.entries()) == ["a", "c"]
+    assert not os.path.exists(files.path("b", ".body"))
+    assert files.size == 204
+    assert DiskLRU(str(tmp_path), max_bytes=250, companions=(".body",)).size == 204
@@ -0,0 +1,123 @@
+# tests/test_fetch_engine.py
+
+import random
+import threading
+import time
+
+import pytest
+
+from src.appstore_data_agent.tools.fetch_engine import HostLimiter, run_pipeline
+
+
+def test_run_pipeline_respects_per_host_limit():
+    lock = threading.Lock()
+    in_flight = {"apps.apple.com": 0, "example.com": 0}
+    peak = {"apps.apple.com": 0, "example.com": 0}
+
+    def worker(url):
+        host = url.split("/")[2]
+        with lock:
+            in_flight[host] += 1
+            peak[host] = max(peak[host], in_flight[host])
+        time.sleep(0.01)
+        with lock:
+            in_flight[host] -= 1
+        return host
+
+    urls = [f"https://apps.apple.com/us/app/id{i}" for i in range(10)]
+    urls += [f"https://example.com/{i}" for i in range(10)]
+    run_pipeline(urls, worker, str, fetch_workers=10, per_host_limit=2, parse_workers=0)
+
+    assert peak["apps.apple.com"] <= 2
+    assert peak["example.com"] <= 2
+
+def test_run_pipeline_shares_a_given_limiter():
+    limiter = HostLimiter(per_host_limit=1)
+
+    def fetch(url):
+        # The only slot is taken by the pipeline's own fetch
+        assert not limiter._semaphore("apps.apple.com").acquire(blocking=False)
+        return url
+
+    results, _, _ = run_pipeline(["https://apps.apple.com/us/app/id1"], fetch, str, parse_workers=0, limiter=limiter)
+
+    assert results == ["https://apps.apple.com/us/app/id1"]
+
+def test_host_limiter_is_case_insensitive():
+    limiter = HostLimiter(per_host_limit=1)
+    assert limiter._semaphore("apps.apple.com") is limiter._semaphore("apps.apple.com")
+    with limiter.slot("https://APPS.apple.com/x"):
+        assert not limiter._semaphore("apps.apple.com").acquire(blocking=False)
+
+def test_run_pipeline_parses_inline_in_input_order():
+    urls = [f"https://apps.apple.com/us/app/id{i}" for i in range(10)]
+
+    def fetch(url):
+        time.sleep(random.uniform(0, 0.01))
+        return url.encode("utf-8")
+
+    results, fetch_stats, parse_stats = run_pipeline(urls, fetch, bytes.decode, parse_workers=0, queue_size=2)
+
+    assert results == urls
+    assert fetch_stats.items == parse_stats.items == 10
+    assert fetch_stats.bytes == sum(len(url) for url in urls)
+
+def test_run_pipeline_parses_on_process_pool():
+    urls = [f"https://apps.apple.com/us/app/id{i}" for i in range(6)]
+
+    results, _, parse_stats = run_pipeline(urls, lambda url: url.encode("utf-8"), len, parse_workers=2)
+
+    assert results == [len(url) for url in urls]
+    assert parse_stats.items == 6
+
+def test_run_pipeline_uses_on_error_for_failed_fetches():
+    def fetch(url):
+        if url.endswith("2"):
+            raise IOError("boom")
+        return url
+
+    results, fetch_stats, _ = run_pipeline(
+        ["u1", "u2", "u3"], fetch, str.upper, on_error=lambda url, e: f"error {e}", parse_workers=0
+    )
+
+    assert results == ["U1", "error boom", "U3"]
+    assert fetch_stats.errors == 1
+
+def test_run_pipeline_reraises_without_on_error():
+    def fetch(url):
+        raise IOError("boom")
+
+    with pytest.raises(IOError):
+        run_pipeline(["u1", "u2"], fetch, str.upper, parse_workers=0)
+
+def test_run_pipeline_fetches_a_stream_while_it_is_produced():
+    fetched = []
+
+    def produce():
+        for i in range(5):
+            yield f"u{i}"
+            # The previous url is fetched before the next one is produced
+            deadline = time.time() + 1
+            while f"u{i}" not in fetched and time.time() < deadline:
+                time.sleep(0.005)
+            assert f"u{i}" in fetched
+
+    def fetch(url):
+        fetched.append(url)
+        return url
+
+    seen = []
+    results, fetch_stats, _ = run_pipeline(
+        produce(), fetch, str.upper, on_result=lambda index, url, result: seen.append((index, url)), parse_workers=0
+    )
+
+    assert results == ["U0", "U1", "U2", "U3", "U4"]
+    assert sorted(seen) == [(i, f"u{i}") for i in range(5)]
+
+def test_run_pipeline_reraises_stream_errors():
+    def produce():
+        yield "u1"
+        raise IOError("listing failed")
+
+    with pytest.raises(IOError, match="listing failed"):
+        run_pipeline(produce(), lambda url: url, str.upper, parse_workers=0)
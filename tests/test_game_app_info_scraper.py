@@ -0,0 +1,86 @@
+# tests/test_game_app_info_scraper.py
+
+import csv
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.appstore_data_agent.archieve.tools import custom_tool
+from src.appstore_data_agent.archieve.tools.custom_tool import (
+    OUTPUT_CSV_FILE,
+    SCRAPED_FREE_GAMES_FILE,
+    SCRAPED_PAID_GAMES_FILE,
+    GameAppInfoScraperTool,
+)
+from src.appstore_data_agent.tools import checkpoint, developer_index, developer_url_store, result_store
+from src.appstore_data_agent.tools.checkpoint import CrawlCheckpoint, checkpoint_path
+
+DEVELOPER_URL = "https://apps.apple.com/us/developer/test-developer/id123456789"
+
+
+PRICES = {"1": "Free", "2": "$1.99"}
+
+
+def game_page(title, price="Free"):
+    price_item = f'<div class="information-list__item"><dt>Price</dt><dd>{price}</dd></div>' if price else ""
+    return f"""
+    <h1 class="product-header__title">{title}</h1>
+    <h2 class="product-header__identity"><a href="{DEVELOPER_URL}">Test Developer</a></h2>
+    <dl class="information-list">
+        {price_item}
+    </dl>
+    """.encode("utf-8")
+
+
+def response(url):
+    app_id = url.rsplit('/id', 1)[1]
+    page = MagicMock()
+    page.content = game_page(f"Game {app_id}", PRICES.get(app_id))
+    page.encoding = "utf-8"
+    return page
+
+
+def csv_games(path):
+    with open(path, newline="", encoding="utf-8") as rows:
+        return [row["Game Name"] for row in csv.DictReader(rows)]
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    checkpoint.configure(directory=str(tmp_path / "checkpoints"))
+    developer_index.configure(names_file=str(tmp_path / "developer_names.txt"))
+    developer_url_store.configure(store_file=str(tmp_path / "developer_urls.json"))
+    result_store.configure(db_path=str(tmp_path / "results.sqlite3"))
+    yield tmp_path
+    checkpoint.configure(directory=checkpoint.DEFAULT_CHECKPOINT_DIR, resume=False)
+    developer_index.configure(names_file=developer_index.DEFAULT_NAMES_FILE)
+    developer_url_store.configure(store_file=developer_url_store.DEFAULT_STORE_FILE)
+    result_store.configure(db_path=result_store.DEFAULT_DB_PATH)
+
+
+def test_resume_keeps_a_finished_app_found_under_another_url(workspace, monkeypatch):
+    # Finished last run from the UK storefront, listed from the US one this run
+    journal = CrawlCheckpoint(checkpoint_path("Test Developer"))
+    journal.record_done("https://apps.apple.com/gb/app/game-1/id1",
+                        {"Game Name": "Game 1", "Developer Name": "Test Developer", "Price": "Free"}, DEVELOPER_URL)
+    urls = [f"https://apps.apple.com/us/app/game-{i}/id{i}" for i in (1, 2, 3)]
+    monkeypatch.setattr(custom_tool, "crawl_catalog", lambda *args, **kwargs: iter(urls))
+    get = MagicMock(side_effect=response)
+    monkeypatch.setattr(custom_tool.http_client, "get", get)
+
+    GameAppInfoScraperTool(parse_workers=0, resume=True)._run("Test Developer", DEVELOPER_URL)
+
+    assert sorted(call.args[0] for call in get.call_args_list) == urls[1:]
+    assert csv_games(workspace / OUTPUT_CSV_FILE) == ["Game 1", "Game 2", "Game 3"]
+
+def test_games_without_a_price_are_neither_free_nor_paid(workspace, monkeypatch):
+    urls = [f"https://apps.apple.com/us/app/game-{i}/id{i}" for i in (1, 2, 3)]
+    monkeypatch.setattr(custom_tool, "crawl_catalog", lambda *args, **kwargs: iter(urls))
+    monkeypatch.setattr(custom_tool.http_client, "get", MagicMock(side_effect=response))
+
+    GameAppInfoScraperTool(parse_workers=0)._run("Test Developer", DEVELOPER_URL)
+
+    assert csv_games(workspace / OUTPUT_CSV_FILE) == ["Game 1", "Game 2", "Game 3"]
+    assert csv_games(workspace / SCRAPED_FREE_GAMES_FILE) == ["Game 1"]
+    assert csv_games(workspace / SCRAPED_PAID_GAMES_FILE) == ["Game 2"]
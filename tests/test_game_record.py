@@ -0,0 +1,120 @@
+# tests/test_game_record.py
+
+import json
+import tracemalloc
+
+import pytest
+
+from src.appstore_data_agent.tools.game_record import (
+    RECORD_FIELDS,
+    GameRecord,
+    format_price,
+    format_size,
+    record_from_details,
+    record_from_summary,
+    split_age_rating,
+)
+
+DEVELOPER_URL = "https://apps.apple.com/us/developer/voodoo/id714804730"
+
+GAME = {
+    "url": "https://apps.apple.com/us/app/helix-jump/id1345968745?platform=iphone",
+    "title": "Helix Jump",
+    "developer": "VOODOO",
+    "rating": "4.5",
+    "rating_count": "1.2M Ratings",
+    "info_list": {
+        "Price": "$6.99", "Size": "325.1 MB", "Category": "Games", "In-App Purchases": "Remove Ads$2.99",
+        "Age Rating": "12+Infrequent/Mild Cartoon or Fantasy ViolenceFrequent/Intense Horror",
+    },
+    "game_center": "Game Center, Achievements",
+}
+
+
+def details_row(index):
+    # A scraped games CSV row as read back from disk: every value a string of its own
+    fresh = lambda text: (text + " ")[:-1]
+    return {
+        "Developer Name": fresh("VOODOO"), "Game Name": f"Game {index}", "Ratings": fresh("4.5"),
+        "Size": f"{100 + index % 10}.1 MB", "Age Limit": fresh("12+"), "Price": fresh("Free"), "Genre": fresh("Games"),
+        "Game Center Integ": fresh("Yes"), "Achievement": fresh("No"), "Leaderboard": fresh("Yes"),
+    }
+
+
+def test_record_from_summary():
+    record = record_from_summary(GAME, DEVELOPER_URL)
+
+    assert (record.app_id, record.url) == (1345968745, "https://apps.apple.com/us/app/helix-jump/id1345968745")
+    assert (record.rating, record.rating_count, record.size_bytes) == (4.5, 1_200_000, 325_100_000)
+    assert (record.age_rating, record.price_cents, record.is_free) == (12, 699, False)
+    assert (record.game_center, record.achievements, record.leaderboards) == (True, True, False)
+    assert record.in_app_purchases is True
+    assert record.content_warnings == "Infrequent/Mild Cartoon or Fantasy Violence; Frequent/Intense Horror"
+
+def test_records_are_slotted():
+    record = GameRecord(game_name="Helix Jump")
+
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.nickname = "Helix"
+
+def test_row_and_json_round_trip():
+    record = record_from_summary(GAME, DEVELOPER_URL)
+
+    assert list(record.as_row()) == list(RECORD_FIELDS)
+    assert GameRecord.from_row(record.as_row()) == record
+    assert GameRecord.from_row(json.loads(record.to_json())) == record
+
+def test_csv_row_reads_back_as_the_same_record():
+    record = record_from_details(details_row(3), "https://apps.apple.com/us/app/game-3/id3", DEVELOPER_URL)
+
+    assert record.to_csv_row() == details_row(3)
+    assert record_from_details(record.to_csv_row(), record.url, DEVELOPER_URL) == record
+
+def test_csv_row_of_an_empty_record():
+    assert GameRecord().to_csv_row() == {
+        "Developer Name": "N/A", "Game Name": "N/A", "Ratings": "N/A", "Size": "N/A", "Age Limit": "N/A",
+        "Price": "N/A", "Genre": "N/A", "Game Center Integ": "No", "Achievement": "No", "Leaderboard": "No",
+    }
+
+@pytest.mark.parametrize("size_bytes, expected", [
+    (325_100_000, "325.1 MB"),
+    (1_200_000_000, "1.2 GB"),
+    (512_000, "512 KB"),
+    (85_000_000, "85 MB"),
+    (1_000_000_000, "1 GB"),
+    (12, "12 bytes"),
+])
+def test_format_size(size_bytes, expected):
+    assert format_size(size_bytes) == expected
+
+def test_format_price():
+    assert (format_price(0), format_price(699), format_price(None)) == ("Free", "$6.99", "N/A")
+
+def test_split_age_rating():
+    assert split_age_rating("4+") == ("4+", [])
+    assert split_age_rating("17+Unrestricted Web AccessFrequent/Intense Horror") == (
+        "17+", ["Unrestricted Web Access", "Frequent/Intense Horror"],
+    )
+    assert split_age_rating(None) == (None, [])
+
+def test_repeated_strings_are_shared_between_records():
+    first = record_from_details(details_row(1))
+    second = record_from_details(details_row(2))
+
+    assert first.developer_name is second.developer_name
+    assert first.genre is second.genre
+
+def test_records_take_less_memory_than_the_rows_they_replace():
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        rows = [details_row(index) for index in range(2000)]
+        after_rows, _ = tracemalloc.get_traced_memory()
+        records = [record_from_details(row) for row in rows]
+        after_records, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(records) == len(rows)
+    assert after_records - after_rows < (after_rows - before) / 2
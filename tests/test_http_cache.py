@@ -0,0 +1,81 @@
+# tests/test_http_cache.py
+
+import os
+import time
+
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+from src.appstore_data_agent.tools.http_cache import (
+    CacheMissError,
+    ResponseCache,
+    normalize_url,
+)
+
+GAME_URL = "https://apps.apple.com/us/app/test-game/id12345"
+
+
+def make_response(status_code=200, body=b"<html>game</html>", headers=None):
+    response = requests.models.Response()
+    response.status_code = status_code
+    response._content = body
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    return response
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(directory=str(tmp_path), ttl=60, max_bytes=1024 * 1024)
+
+def test_normalize_url_drops_tracking_params_and_fragment():
+    assert normalize_url("HTTPS://Apps.Apple.com/us/app/x/id1/?uo=4#top") == "https://apps.apple.com/us/app/x/id1"
+    assert normalize_url("https://apps.apple.com/x?b=2&a=1") == normalize_url("https://apps.apple.com/x?a=1&b=2")
+
+def test_fresh_entry_is_served_without_network(cache):
+    send = MagicMock(return_value=make_response(headers={"ETag": '"v1"'}))
+    first = cache.get(GAME_URL, send)
+    second = cache.get(GAME_URL + "?uo=4", send)
+
+    assert send.call_count == 1
+    assert first.text == second.text == "<html>game</html>"
+    assert second.from_cache is True
+    assert cache.hits == 1 and cache.misses == 1
+
+def test_stale_entry_is_revalidated_with_conditional_get(cache):
+    cache.get(GAME_URL, MagicMock(return_value=make_response(headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})))
+    cache.ttl = 0
+
+    send = MagicMock(return_value=make_response(status_code=304, body=b""))
+    response = cache.get(GAME_URL, send)
+
+    send.assert_called_once_with({"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    assert response.status_code == 200
+    assert response.text == "<html>game</html>"
+    assert cache.revalidated == 1
+
+def test_error_responses_are_not_cached(cache):
+    cache.get(GAME_URL, MagicMock(return_value=make_response(status_code=503)))
+    assert cache.load(GAME_URL) is None
+
+def test_offline_mode_serves_stale_entries_and_raises_on_miss(tmp_path):
+    online = ResponseCache(directory=str(tmp_path), ttl=0)
+    online.get(GAME_URL, MagicMock(return_value=make_response()))
+
+    offline = ResponseCache(directory=str(tmp_path), ttl=0, mode="offline")
+    send = MagicMock()
+    assert offline.get(GAME_URL, send).text == "<html>game</html>"
+    send.assert_not_called()
+    with pytest.raises(CacheMissError):
+        offline.get("https://apps.apple.com/us/app/other/id999", send)
+
+def test_lru_eviction_keeps_cache_under_budget(tmp_path):
+    cache = ResponseCache(directory=str(tmp_path), ttl=60, max_bytes=1500)
+    for i in range(5):
+        cache.get(f"https://apps.apple.com/us/app/id{i}", MagicMock(return_value=make_response(body=b"x" * 400)))
+        time.sleep(0.01)
+
+    stored = sum(os.path.getsize(os.path.join(tmp_path, name)) for name in os.listdir(tmp_path))
+    assert stored <= 1500
+    assert cache.load("https://apps.apple.com/us/app/id4") is not None
+    assert cache.load("https://apps.apple.com/us/app/id0") is None
@@ -0,0 +1,55 @@
+# tests/test_http_client.py
+
+import pytest
+from unittest.mock import patch
+
+from src.appstore_data_agent.tools import http_cache, http_client, rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def reset_http_client():
+    http_cache.configure(mode="off")
+    http_client.configure(
+        pool_size=http_client.DEFAULT_POOL_SIZE,
+        timeout=http_client.DEFAULT_TIMEOUT,
+        retries=http_client.DEFAULT_RETRIES,
+        backoff_factor=http_client.DEFAULT_BACKOFF_FACTOR,
+    )
+    yield
+    http_client.configure()
+    http_cache.configure(mode="default")
+
+def test_get_session_is_shared():
+    assert http_client.get_session() is http_client.get_session()
+
+def test_build_session_mounts_pooled_retrying_adapter():
+    session = http_client.build_session(pool_size=4, retries=2, backoff_factor=0.1)
+    adapter = session.get_adapter("https://apps.apple.com/")
+
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 2
+    assert adapter.max_retries.backoff_factor == 0.1
+    assert 502 in adapter.max_retries.status_forcelist
+    # Throttling is the rate limiter's job, not the transport's
+    assert not set(rate_limiter.THROTTLE_STATUS_CODES) & set(adapter.max_retries.status_forcelist)
+    assert "Mozilla" in session.headers["User-Agent"]
+
+def test_configure_rebuilds_session():
+    first = http_client.get_session()
+    http_client.configure(pool_size=2)
+    second = http_client.get_session()
+
+    assert first is not second
+    assert second.get_adapter("https://apps.apple.com/")._pool_maxsize == 2
+
+def test_get_applies_default_timeout():
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.status_code = 200
+        http_client.get("https://apps.apple.com/us/app/id1")
+    mock_get.assert_called_once_with("https://apps.apple.com/us/app/id1", timeout=http_client.DEFAULT_TIMEOUT)
+
+def test_get_allows_timeout_override():
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.status_code = 200
+        http_client.get("https://apps.apple.com/us/app/id1", timeout=1)
+    mock_get.assert_called_once_with("https://apps.apple.com/us/app/id1", timeout=1)
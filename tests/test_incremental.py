@@ -0,0 +1,134 @@
+# tests/test_incremental.py
+
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from src.appstore_data_agent import incremental
+from src.appstore_data_agent.tools import developer_index, developer_url_store, result_store
+from src.appstore_data_agent.tools.game_record import GameRecord
+
+DEVELOPER_URL = "https://apps.apple.com/us/developer/voodoo/id714804730"
+HELIX_URL = "https://apps.apple.com/us/app/helix-jump/id1345968745"
+PAPER_URL = "https://apps.apple.com/us/app/paper-io-2/id1446339408"
+ROLL_URL = "https://apps.apple.com/us/app/roll-the-ball/id1194283137"
+
+
+def developer_page(*game_urls):
+    links = "".join(f'<a href="{url}">Game</a>' for url in game_urls)
+    return f'<section class="l-content-width section section--bordered">{links}</section>'
+
+def game_page(title, price="Free", nonce=""):
+    return f"""
+    <!-- {nonce} -->
+    <h1 class="product-header__title">{title}</h1>
+    <h2 class="product-header__identity app-header__identity"><a href="{DEVELOPER_URL}">VOODOO</a></h2>
+    <dl class="information-list">
+        <div class="information-list__item"><dt>Price</dt><dd>{price}</dd></div>
+    </dl>
+    """
+
+
+@pytest.fixture
+def pages():
+    return {
+        DEVELOPER_URL: developer_page(HELIX_URL, PAPER_URL),
+        HELIX_URL: game_page("Helix Jump"),
+        PAPER_URL: game_page("Paper.io 2"),
+    }
+
+@pytest.fixture(autouse=True)
+def local_stores(tmp_path, pages):
+    developer_index.configure(names_file=str(tmp_path / "developer_names.txt"))
+    developer_url_store.configure(store_file=str(tmp_path / "developer_urls.json"))
+    result_store.configure(db_path=str(tmp_path / "results.sqlite3"))
+    developer_url_store.record_developer_url("Voodoo", DEVELOPER_URL)
+
+    def mock_get(url, **kwargs):
+        if url not in pages:
+            raise requests.exceptions.HTTPError(f"404 for {url}")
+        response = MagicMock()
+        response.content = pages[url].encode("utf-8")
+        response.encoding = "utf-8"
+        return response
+
+    with patch("src.appstore_data_agent.tools.http_client.get", side_effect=mock_get):
+        yield
+    developer_index.configure(names_file=developer_index.DEFAULT_NAMES_FILE)
+    developer_url_store.configure(store_file=developer_url_store.DEFAULT_STORE_FILE)
+    result_store.configure(db_path=result_store.DEFAULT_DB_PATH)
+
+def recrawl(tmp_path):
+    return incremental.recrawl_developer("Voodoo", parse_workers=0)
+
+def test_first_crawl_reports_every_app_as_new(tmp_path):
+    research, delta = recrawl(tmp_path)
+
+    assert [game.game_name for game in research["games"]] == ["Helix Jump", "Paper.io 2"]
+    assert [app["title"] for app in delta["new"]] == ["Helix Jump", "Paper.io 2"]
+    assert delta["unchanged"] == 0
+
+@patch("src.appstore_data_agent.incremental.parse_game_record")
+def test_identical_pages_are_not_parsed_again(mock_parse, tmp_path):
+    mock_parse.side_effect = lambda content, from_encoding, url: GameRecord(
+        url=url, game_name="Parsed", developer_name="VOODOO", developer_url=DEVELOPER_URL,
+    )
+    recrawl(tmp_path)
+    mock_parse.reset_mock()
+
+    research, delta = recrawl(tmp_path)
+
+    mock_parse.assert_not_called()
+    assert delta["unchanged"] == 2
+    assert [game.game_name for game in research["games"]] == ["Parsed", "Parsed"]
+
+def test_recrawl_reports_changed_new_and_removed_apps(tmp_path, pages):
+    recrawl(tmp_path)
+    pages[DEVELOPER_URL] = developer_page(HELIX_URL, ROLL_URL)
+    pages[HELIX_URL] = game_page("Helix Jump", price="$0.99")
+    pages[ROLL_URL] = game_page("Roll the Ball")
+
+    research, delta = recrawl(tmp_path)
+
+    assert [game.game_name for game in research["games"]] == ["Helix Jump", "Roll the Ball"]
+    assert delta["changed"] == [{
+        "url": HELIX_URL,
+        "title": "Helix Jump",
+        "fields": {"is_free": {"old": True, "new": False}, "price_cents": {"old": 0, "new": 99}},
+    }]
+    assert [app["url"] for app in delta["new"]] == [ROLL_URL]
+    assert delta["removed"] == [{"url": PAPER_URL, "title": "Paper.io 2"}]
+
+def test_markup_only_changes_count_as_unchanged(tmp_path, pages):
+    recrawl(tmp_path)
+    pages[HELIX_URL] = game_page("Helix Jump", nonce="build 2")
+
+    _, delta = recrawl(tmp_path)
+
+    assert delta["changed"] == []
+    assert delta["unchanged"] == 2
+
+def test_failed_pages_keep_their_last_known_data(tmp_path, pages):
+    recrawl(tmp_path)
+    del pages[PAPER_URL]
+
+    research, delta = recrawl(tmp_path)
+
+    assert [game.game_name for game in research["games"]] == ["Helix Jump", "Paper.io 2"]
+    assert [app["url"] for app in delta["failed"]] == [PAPER_URL]
+    assert delta["removed"] == []
+
+def test_pages_without_game_data_do_not_overwrite_the_snapshot(tmp_path, pages):
+    recrawl(tmp_path)
+    real_page = pages[PAPER_URL]
+    pages[PAPER_URL] = "<html><body>Too many requests</body></html>"
+
+    research, delta = recrawl(tmp_path)
+
+    assert [game.game_name for game in research["games"]] == ["Helix Jump", "Paper.io 2"]
+    assert delta["failed"] == [{"url": PAPER_URL, "error": "no game data on the page"}]
+    assert delta["changed"] == []
+
+    pages[PAPER_URL] = real_page
+    _, delta = recrawl(tmp_path)
+    assert delta["unchanged"] == 2
@@ -0,0 +1,88 @@
+# tests/test_llm_cache.py
+
+import pytest
+from unittest.mock import MagicMock
+
+from crewai.llms.base_llm import BaseLLM
+
+from src.appstore_data_agent.tools import llm_cache
+from src.appstore_data_agent.tools.cached_llm import CachedLLM
+from src.appstore_data_agent.tools.llm_cache import LLMCacheMissError, LLMResponseCache, cache_key
+
+PROMPT = [{"role": "user", "content": "Which developer published Helix Jump?"}]
+
+
+class FakeLLM(BaseLLM):
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        self.calls = getattr(self, "calls", 0) + 1
+        return f"answer {self.calls}"
+
+
+@pytest.fixture
+def shared_cache(tmp_path):
+    llm_cache.configure(mode="default", directory=str(tmp_path / "llm"))
+    yield
+    llm_cache.configure(mode="default", directory=llm_cache.DEFAULT_CACHE_DIR)
+
+def test_cache_key_ignores_insignificant_whitespace():
+    messy = [{"role": "user", "content": "  Which developer published Helix Jump?  \n"}]
+
+    assert cache_key("gemini", messy, {"temperature": 0.5}) == cache_key("gemini", PROMPT, {"temperature": 0.5})
+    assert cache_key("gemini", "Which developer published Helix Jump?") == cache_key("gemini", PROMPT)
+    assert cache_key("gemini", PROMPT, {"temperature": 0.5}) != cache_key("gemini", PROMPT, {"temperature": 0.0})
+    assert cache_key("gemini", PROMPT) != cache_key("llama2", PROMPT)
+
+def test_default_mode_calls_the_model_once(tmp_path):
+    cache = LLMResponseCache(directory=str(tmp_path))
+    call = MagicMock(return_value="VOODOO")
+
+    assert cache.get("llama2", PROMPT, call) == "VOODOO"
+    assert cache.get("llama2", PROMPT, call) == "VOODOO"
+    assert call.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Persisted across instances
+    assert LLMResponseCache(directory=str(tmp_path)).get("llama2", PROMPT, call) == "VOODOO"
+    assert call.call_count == 1
+
+def test_record_then_replay(tmp_path):
+    recorder = LLMResponseCache(directory=str(tmp_path), mode="record")
+    recorder.get("llama2", PROMPT, lambda: "old")
+    assert recorder.get("llama2", PROMPT, lambda: "new") == "new"
+
+    replay = LLMResponseCache(directory=str(tmp_path), mode="replay")
+    call = MagicMock()
+    assert replay.get("llama2", PROMPT, call) == "new"
+    with pytest.raises(LLMCacheMissError):
+        replay.get("llama2", "Unrecorded prompt", call)
+    call.assert_not_called()
+
+def test_non_string_answers_are_not_stored(tmp_path):
+    cache = LLMResponseCache(directory=str(tmp_path))
+    call = MagicMock(return_value=[{"tool": "search"}])
+
+    cache.get("gemini", PROMPT, call)
+    cache.get("gemini", PROMPT, call)
+    assert call.call_count == 2
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = LLMResponseCache(directory=str(tmp_path), max_bytes=700)
+    for i in range(5):
+        cache.get("llama2", f"prompt {i}", lambda: "x" * 100)
+
+    assert sum(size for _, _, size in cache.files.entries()) <= 700
+    assert cache.load(cache_key("llama2", "prompt 4")) == "x" * 100
+    assert cache.load(cache_key("llama2", "prompt 0")) is None
+
+def test_cached_llm_memoizes_crew_calls(shared_cache):
+    inner = FakeLLM(model="gemini-1.5-flash", temperature=0.5)
+    llm = CachedLLM(inner)
+
+    assert llm.call(PROMPT) == "answer 1"
+    assert llm.call(PROMPT) == "answer 1"
+    assert llm.call("Another prompt") == "answer 2"
+
+    # Stop words set by the agent executor are part of the key and reach the model
+    llm.stop = ["\nObservation:"]
+    assert llm.call(PROMPT) == "answer 3"
+    assert inner.stop == ["\nObservation:"]
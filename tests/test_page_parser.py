@@ -0,0 +1,150 @@
+# tests/test_page_parser.py
+
+import pytest
+from bs4 import BeautifulSoup
+
+from src.appstore_data_agent.tools.page_parser import (
+    GAME_RECORD_SELECTORS,
+    Selector,
+    compile_selectors,
+    extract,
+    parse_game_record,
+)
+
+PARSERS = ["html.parser"]
+try:
+    import lxml  # noqa: F401
+    PARSERS.append("lxml")
+except ImportError:
+    pass
+
+MOCK_GAME_DETAIL_HTML = """
+<h1 class="product-header__title">Test Game Name</h1>
+<h2 class="product-header__identity app-header__identity"><a href="https://apps.apple.com/us/developer/test-developer/id123456789">Test Developer</a></h2>
+<span class="we-customer-ratings__averages__display">4.5</span>
+<section class="l-content-width section section--bordered section--information">
+    <dl class="information-list information-list--app medium-columns l-row">
+        <div class="information-list__item l-column small-12 medium-6 large-4 small-valign-top">Size400 MB</div>
+        <div class="information-list__item l-column small-12 medium-6 large-4 small-valign-top">Age Rating4+</div>
+        <div class="information-list__item l-column small-12 medium-6 large-4 small-valign-top">PriceFree</div>
+        <div class="information-list__item l-column small-12 medium-6 large-4 small-valign-top">
+            <span class="information-list__item__definition">Action</span>
+        </div>
+    </dl>
+</section>
+<div class="information-list__item l-column small-12 medium-6 large-4 small-valign-top">Size999 GB</div>
+<div class="supports-list__item__copy">Supports Game Center, Achievements, Leaderboards</div>
+"""
+
+MOCK_GAME_RECORD_HTML = """
+<h1 class="product-header__title app-header__title">Helix Jump <span class="badge badge--product-title">12+</span></h1>
+<h2 class="product-header__identity app-header__identity"><a href="https://apps.apple.com/us/developer/voodoo/id714804730">Voodoo</a></h2>
+<span class="we-customer-ratings__averages__display">4.5</span>
+<p class="we-customer-ratings__count">1.2M Ratings</p>
+<dl class="information-list">
+    <div class="information-list__item"><dt>Size</dt><dd>325.1 MB</dd></div>
+    <div class="information-list__item"><dt>Category</dt><dd>Games</dd></div>
+    <div class="information-list__item"><dt>Age Rating</dt><dd>12+Infrequent/Mild Cartoon or Fantasy ViolenceFrequent/Intense Horror</dd></div>
+    <div class="information-list__item"><dt>Price</dt><dd>$6.99</dd></div>
+    <div class="information-list__item"><dt>In-App Purchases</dt><dd>Remove Ads$2.99</dd></div>
+</dl>
+<div class="supports-list__item__copy">Game Center</div>
+<div class="supports-list__item__copy">Achievements</div>
+"""
+
+MOCK_DEVELOPER_PAGE_HTML = """
+<a href="https://apps.apple.com/us/app/outside/id999999999">Outside</a>
+<section class="l-content-width section section--bordered section--information">
+    <a href="https://apps.apple.com/us/app/wrong-section/id888888888">Wrong</a>
+</section>
+<section class="l-content-width section section--bordered">
+    <a href="https://apps.apple.com/us/app/test-game-0/id000000000">Game 0</a>
+    <a href="https://apps.apple.com/us/app/test-game-1/id111111111">Game 1</a>
+</section>
+"""
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_extract_matches_beautifulsoup_find_semantics(parser):
+    soup = BeautifulSoup(MOCK_GAME_DETAIL_HTML, parser)
+    fields = extract(soup, GAME_RECORD_SELECTORS)
+
+    assert fields["title"] is soup.find("h1", class_="product-header__title")
+    assert fields["developer"] is soup.find("h2", class_="product-header__identity")
+    assert fields["genre"] is soup.find("span", class_="information-list__item__definition")
+    # Only the items inside the information list are collected
+    assert len(fields["info_items"]) == 4
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_extract_many_fields_within_the_first_matching_container(parser):
+    selectors = compile_selectors([
+        Selector("apps_section", "section", "l-content-width section section--bordered"),
+        Selector("app_links", "a", many=True, within="apps_section"),
+    ])
+    fields = extract(MOCK_DEVELOPER_PAGE_HTML, selectors, parser=parser)
+    hrefs = [link.get("href") for link in fields["app_links"]]
+
+    assert hrefs == [
+        "https://apps.apple.com/us/app/test-game-0/id000000000",
+        "https://apps.apple.com/us/app/test-game-1/id111111111",
+    ]
+
+def test_extract_missing_fields():
+    fields = extract("<html><body>No content</body></html>", GAME_RECORD_SELECTORS)
+    assert fields["title"] is None
+    assert fields["info_items"] == []
+
+def test_extract_stops_once_single_fields_are_found():
+    selectors = compile_selectors([Selector("title", "h1")])
+    fields = extract("<h1>First</h1><h1>Second</h1>", selectors)
+    assert fields["title"].get_text() == "First"
+
+def test_parse_game_record_reads_terms_and_values_of_the_information_list():
+    item = '<div class="information-list__item l-column small-12 medium-6 large-4 small-valign-top"><dt>{}</dt><dd>{}</dd></div>'
+    html = f"""
+    <h1 class="product-header__title">Helix Jump <span class="badge badge--product-title">12+</span></h1>
+    <section class="l-content-width section section--bordered section--information">
+        <dl class="information-list information-list--app medium-columns l-row">
+            {item.format("Compatibility", "Requires iOS 13.0. Size of download may vary")}
+            {item.format("Age Rating", "12+Infrequent/Mild Horror")}
+            {item.format("Price", "$6.99")}
+        </dl>
+    </section>
+    """
+    record = parse_game_record(html)
+
+    assert record.game_name == "Helix Jump"
+    assert (record.size_bytes, record.age_rating, record.price_cents) == (None, 12, 699)
+
+def test_parse_game_record():
+    record = parse_game_record(MOCK_GAME_RECORD_HTML, url="https://apps.apple.com/us/app/helix-jump/id1345968745?l=fr")
+
+    assert (record.app_id, record.url) == (1345968745, "https://apps.apple.com/us/app/helix-jump/id1345968745")
+    assert (record.game_name, record.developer_name) == ("Helix Jump", "Voodoo")
+    assert record.developer_url == "https://apps.apple.com/us/developer/voodoo/id714804730"
+    assert (record.rating, record.rating_count, record.size_bytes) == (4.5, 1_200_000, 325_100_000)
+    assert (record.age_rating, record.price_cents, record.is_free, record.in_app_purchases) == (12, 699, False, True)
+    assert (record.game_center, record.achievements, record.leaderboards) == (True, True, False)
+    assert record.content_warnings == "Infrequent/Mild Cartoon or Fantasy Violence; Frequent/Intense Horror"
+
+def test_parse_game_record_only_reads_the_information_list():
+    record = parse_game_record(MOCK_GAME_DETAIL_HTML)
+
+    assert (record.game_name, record.developer_name) == ("Test Game Name", "Test Developer")
+    assert (record.size_bytes, record.genre) == (400_000_000, "Action")
+    assert (record.age_rating, record.price_cents, record.is_free) == (4, 0, True)
+    assert (record.game_center, record.achievements, record.leaderboards) == (True, True, True)
+
+def test_parse_game_record_keeps_the_first_item_of_a_term():
+    html = MOCK_GAME_RECORD_HTML.replace(
+        "</dl>", '<div class="information-list__item"><dt>Size</dt><dd>1 GB</dd></div></dl>'
+    )
+
+    assert parse_game_record(html).size_bytes == 325_100_000
+
+def test_parse_game_record_of_an_empty_page():
+    record = parse_game_record("<html><body>No content</body></html>")
+
+    assert record.game_name is None
+    assert record.price_cents is None
+    assert record.game_center is False
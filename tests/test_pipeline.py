@@ -0,0 +1,142 @@
+# tests/test_pipeline.py
+
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from src.appstore_data_agent import pipeline
+from src.appstore_data_agent.tools import checkpoint, developer_index, developer_url_store, result_store
+
+DEVELOPER_URL = "https://apps.apple.com/us/developer/voodoo/id714804730"
+GAME_URLS = [
+    "https://apps.apple.com/us/app/helix-jump/id1345968745",
+    "https://apps.apple.com/us/app/paper-io-2/id1446339408",
+]
+
+MOCK_DEVELOPER_PAGE_HTML = f"""
+<section class="l-content-width section section--bordered">
+    <a href="{GAME_URLS[0]}?platform=iphone">Helix Jump</a>
+    <a href="{GAME_URLS[1]}">Paper.io 2</a>
+    <a href="{GAME_URLS[0]}">Helix Jump</a>
+    <a href="https://apps.apple.com/us/story/id1302444839">Story</a>
+</section>
+"""
+
+def game_page(title):
+    return f"""
+    <h1 class="product-header__title">{title}</h1>
+    <h2 class="product-header__identity app-header__identity"><a href="{DEVELOPER_URL}">VOODOO</a></h2>
+    <span class="we-customer-ratings__averages__display">4.5</span>
+    <p class="we-customer-ratings__count">1.2M Ratings</p>
+    <dl class="information-list">
+        <div class="information-list__item"><dt>Price</dt><dd>Free</dd></div>
+        <div class="information-list__item"><dt>Age Rating</dt><dd>4+</dd></div>
+    </dl>
+    <div class="supports-list__item__copy">Game Center</div>
+    """
+
+PAGES = {
+    DEVELOPER_URL: MOCK_DEVELOPER_PAGE_HTML,
+    GAME_URLS[0]: game_page("Helix Jump"),
+    GAME_URLS[1]: game_page("Paper.io 2"),
+}
+
+
+def mock_get(url, **kwargs):
+    if url not in PAGES:
+        raise requests.exceptions.HTTPError(f"404 for {url}")
+    response = MagicMock()
+    response.content = PAGES[url].encode("utf-8")
+    response.encoding = "utf-8"
+    return response
+
+@pytest.fixture(autouse=True)
+def local_stores(tmp_path):
+    checkpoint.configure(directory=str(tmp_path / "checkpoints"))
+    developer_index.configure(names_file=str(tmp_path / "developer_names.txt"))
+    developer_url_store.configure(store_file=str(tmp_path / "developer_urls.json"))
+    result_store.configure(db_path=str(tmp_path / "results.sqlite3"))
+    yield
+    checkpoint.configure(directory=checkpoint.DEFAULT_CHECKPOINT_DIR, resume=False)
+    developer_index.configure(names_file=developer_index.DEFAULT_NAMES_FILE)
+    developer_url_store.configure(store_file=developer_url_store.DEFAULT_STORE_FILE)
+    result_store.configure(db_path=result_store.DEFAULT_DB_PATH)
+
+@patch("src.appstore_data_agent.tools.developer_url_finder.search")
+@patch("src.appstore_data_agent.tools.http_client.get", side_effect=mock_get)
+def test_research_developer_without_llm(mock_http_get, mock_search):
+    mock_search.return_value = iter([DEVELOPER_URL])
+
+    # Misspelled input is resolved from the local developer index
+    research = pipeline.research_developer("Vodoo", parse_workers=0)
+
+    mock_search.assert_called_once_with("Voodoo app store developer page", num_results=5)
+    assert research["developer_name"] == "VOODOO"
+    assert research["developer_url"] == DEVELOPER_URL
+    assert [game.url for game in research["games"]] == GAME_URLS
+    assert [game.game_name for game in research["games"]] == ["Helix Jump", "Paper.io 2"]
+    assert (research["games"][0].price_cents, research["games"][0].rating_count) == (0, 1_200_000)
+
+@patch("src.appstore_data_agent.tools.developer_url_finder.search")
+@patch("src.appstore_data_agent.tools.http_client.get", side_effect=mock_get)
+def test_research_developer_limits_games_and_skips_failed_pages(mock_http_get, mock_search):
+    mock_search.return_value = iter([DEVELOPER_URL])
+    PAGES.pop(GAME_URLS[1])
+    try:
+        research = pipeline.research_developer("Voodoo", parse_workers=0)
+        assert [game.url for game in research["games"]] == GAME_URLS[:1]
+
+        # The developer page is now known: no second search
+        research = pipeline.research_developer("Voodoo", max_games=1, parse_workers=0)
+        assert mock_search.call_count == 1
+        assert len(research["games"]) == 1
+    finally:
+        PAGES[GAME_URLS[1]] = game_page("Paper.io 2")
+
+@patch("src.appstore_data_agent.tools.developer_url_finder.search")
+@patch("src.appstore_data_agent.tools.http_client.get", side_effect=mock_get)
+def test_research_developer_skips_pages_without_game_data(mock_http_get, mock_search):
+    mock_search.return_value = iter([DEVELOPER_URL])
+    PAGES[GAME_URLS[1]] = "<html><body>Too many requests</body></html>"
+    try:
+        research = pipeline.research_developer("Voodoo", parse_workers=0)
+    finally:
+        PAGES[GAME_URLS[1]] = game_page("Paper.io 2")
+
+    assert [game.url for game in research["games"]] == GAME_URLS[:1]
+
+@patch("src.appstore_data_agent.tools.developer_url_finder.search")
+@patch("src.appstore_data_agent.tools.http_client.get", side_effect=mock_get)
+def test_resume_fetches_only_pages_not_done(mock_http_get, mock_search):
+    mock_search.return_value = iter([DEVELOPER_URL])
+    PAGES.pop(GAME_URLS[1])
+    try:
+        pipeline.research_developer("Voodoo", parse_workers=0)
+    finally:
+        PAGES[GAME_URLS[1]] = game_page("Paper.io 2")
+    mock_http_get.reset_mock()
+
+    checkpoint.configure(resume=True)
+    research = pipeline.research_developer("Voodoo", parse_workers=0)
+
+    assert GAME_URLS[0] not in [call.args[0] for call in mock_http_get.call_args_list]
+    assert [game.game_name for game in research["games"]] == ["Helix Jump", "Paper.io 2"]
+
+@patch("src.appstore_data_agent.tools.developer_url_finder.search", return_value=iter([]))
+def test_research_developer_without_developer_page(mock_search):
+    with pytest.raises(pipeline.ResearchError):
+        pipeline.research_developer("Unknown Studio")
+
+@patch("src.appstore_data_agent.tools.developer_url_finder.search")
+@patch("src.appstore_data_agent.tools.http_client.get", side_effect=mock_get)
+def test_stored_research_matches_last_crawl(mock_http_get, mock_search):
+    mock_search.return_value = iter([DEVELOPER_URL])
+    research = pipeline.research_developer("Voodoo", parse_workers=0)
+    mock_http_get.reset_mock()
+
+    assert pipeline.stored_research("Voodoo") == research
+    mock_http_get.assert_not_called()
+
+def test_stored_research_without_known_developer():
+    with pytest.raises(pipeline.ResearchError):
+        pipeline.stored_research("Unknown Studio")
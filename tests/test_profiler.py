@@ -0,0 +1,108 @@
+# tests/test_profiler.py
+
+import json
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.appstore_data_agent.tools import http_cache, http_client, profiler
+from src.appstore_data_agent.tools.fetch_engine import run_pipeline
+from src.appstore_data_agent.tools.profiler import RunProfile
+
+@pytest.fixture
+def profile(tmp_path):
+    profile = profiler.configure(path=str(tmp_path / "profile.jsonl"))
+    yield profile
+    profiler.configure(enabled=False)
+
+def read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def test_events_are_streamed_and_summed(profile):
+    profile.record("http.get", 0.010, bytes=100, host="apps.apple.com")
+    profile.record("http.get", 0.030, bytes=300, host="apps.apple.com")
+    with pytest.raises(ValueError):
+        with profile.span("llm.call", model="gemini") as span:
+            span["prompt_tokens"] = 12
+            raise ValueError("boom")
+    profile.count("http_cache.hits", 3)
+    profile.close()
+
+    lines = read_lines(profile.path)
+    assert [line["name"] for line in lines] == ["http.get", "http.get", "llm.call", "run.summary"]
+    assert lines[0]["duration_ms"] == 10.0
+    assert lines[0]["host"] == "apps.apple.com"
+    assert (lines[2]["error"], lines[2]["prompt_tokens"]) == (True, 12)
+
+    stats = lines[-1]["stats"]
+    assert stats["http.get"]["count"] == 2
+    assert stats["http.get"]["bytes"] == 400
+    assert stats["http.get"]["max_ms"] == 30.0
+    assert stats["llm.call"]["errors"] == 1
+    assert lines[-1]["counters"] == {"http_cache.hits": 3}
+
+def test_summary_table():
+    profile = RunProfile()
+    profile.record("pipeline.parse", 0.002)
+    profile.record("llm.call", 1.5, prompt_tokens=100, completion_tokens=20)
+
+    table = profile.summary_table().splitlines()
+    assert table[0].split()[:3] == ["event", "count", "errors"]
+    llm_row = next(line for line in table if line.startswith("llm.call"))
+    assert llm_row.split()[-1] == "120"
+
+def test_disabled_profiler_is_a_no_op():
+    profiler.configure(enabled=False)
+    profiler.record("http.get", 1.0)
+    with profiler.span("llm.call") as span:
+        span["cached"] = True
+    assert profiler.get_profile() is None
+
+def test_http_and_pipeline_are_instrumented(profile):
+    http_cache.configure(mode="off")
+    try:
+        page = MagicMock(status_code=200, content=b"x" * 50, encoding="utf-8")
+        with patch("requests.Session.get", return_value=page):
+            run_pipeline(
+                ["https://apps.apple.com/us/app/a/id1", "https://apps.apple.com/us/app/b/id2"],
+                lambda url: http_client.get(url).content,
+                len,
+                parse_workers=0,
+            )
+    finally:
+        http_cache.configure(mode="default")
+
+    stats = profile.stats()
+    assert stats["http.get"]["count"] == 2
+    assert stats["http.get"]["bytes"] == 100
+    assert stats["pipeline.fetch"]["count"] == 2
+    assert stats["pipeline.parse"]["count"] == 2
+
+def test_llm_calls_are_profiled_with_tokens(profile, tmp_path):
+    from crewai.llms.base_llm import BaseLLM
+
+    from src.appstore_data_agent.tools import llm_cache
+    from src.appstore_data_agent.tools.cached_llm import CachedLLM
+
+    class CountingLLM(BaseLLM):
+        def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+            self._track_token_usage_internal({"prompt_tokens": 40, "completion_tokens": 8, "total_tokens": 48})
+            return "answer"
+
+    llm_cache.configure(mode="default", directory=str(tmp_path / "llm"))
+    try:
+        llm = CachedLLM(CountingLLM(model="gemini-1.5-flash"))
+        task = MagicMock()
+        task.name = "reporting_task"
+        llm.call("prompt", from_task=task)
+        llm.call("prompt")
+    finally:
+        llm_cache.configure(mode="default", directory=llm_cache.DEFAULT_CACHE_DIR)
+    profile.close()
+
+    calls = [line for line in read_lines(profile.path) if line["name"] == "llm.call"]
+    assert [call["cached"] for call in calls] == [False, True]
+    assert calls[0]["task"] == "reporting_task"
+    assert (calls[0]["prompt_tokens"], calls[0]["completion_tokens"]) == (40, 8)
+    assert "prompt_tokens" not in calls[1]
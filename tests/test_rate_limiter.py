@@ -0,0 +1,135 @@
+# tests/test_rate_limiter.py
+
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from src.appstore_data_agent.tools import http_cache, http_client, rate_limiter
+from src.appstore_data_agent.tools.rate_limiter import RateLimiter, TokenBucket, retry_after_seconds
+
+URL = "https://apps.apple.com/us/app/helix-jump/id1345968745"
+
+class FakeClock:
+    """Time that only moves when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def limiter(clock, **kwargs):
+    return RateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+def response(status_code, headers=None):
+    return MagicMock(status_code=status_code, headers=headers or {})
+
+def test_retry_after_seconds():
+    assert retry_after_seconds("120") == 120.0
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412470.0) == 10.0
+    assert retry_after_seconds("soon") is None
+    assert retry_after_seconds(None) is None
+
+def test_token_bucket_paces_after_burst(clock):
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+def test_acquire_paces_each_host_separately(clock):
+    rates = limiter(clock, rate=1.0, burst=1)
+
+    rates.acquire(URL)
+    rates.acquire("https://www.google.com/search")
+    assert clock.sleeps == []
+    rates.acquire(URL)
+    assert clock.sleeps == [1.0]
+
+def test_throttling_halves_rate_and_honours_retry_after(clock):
+    rates = limiter(clock, rate=4.0, burst=1, rate_increase=0.5)
+
+    assert rates.record_response(URL, response(429, {"Retry-After": "30"}))
+    assert rates.stats()["apps.apple.com"] == {"rate": 2.0, "throttled": 1, "circuit_opened": 0}
+    assert rates.acquire(URL) == 30.0
+
+    assert not rates.record_response(URL, response(200))
+    assert rates.stats()["apps.apple.com"]["rate"] == 2.5
+
+def test_only_successful_answers_raise_the_rate(clock):
+    rates = limiter(clock, rate=4.0, rate_increase=0.5, failure_threshold=2)
+    rates.acquire(URL)
+
+    assert not rates.record_response(URL, response(404))
+    assert rates.stats()["apps.apple.com"]["rate"] == 4.0
+    assert not rates.record_response(URL, response(304))
+    assert rates.stats()["apps.apple.com"]["rate"] == 4.5
+
+    # Server errors are not throttling, but they do open the circuit
+    for _ in range(2):
+        assert not rates.record_response(URL, response(500))
+    assert rates.stats()["apps.apple.com"] == {"rate": 4.5, "throttled": 0, "circuit_opened": 1}
+
+def test_circuit_opens_after_consecutive_failures(clock):
+    rates = limiter(clock, failure_threshold=3, cooldown=10.0)
+
+    for _ in range(3):
+        rates.record_failure(URL)
+    assert rates.stats()["apps.apple.com"]["circuit_opened"] == 1
+    assert rates.acquire(URL) == 10.0
+
+    # Failures right after the pause open it again for twice as long
+    for _ in range(3):
+        rates.record_failure(URL)
+    assert rates.acquire(URL) == 20.0
+
+    # A success closes it and resets the cooldown
+    rates.record_success(URL)
+    for _ in range(3):
+        rates.record_failure(URL)
+    assert rates.acquire(URL) == 10.0
+
+def test_call_retries_throttled_errors(clock):
+    rates = limiter(clock)
+    throttled = requests.exceptions.HTTPError("429", response=response(429, {"Retry-After": "5"}))
+    function = MagicMock(side_effect=[throttled, ["result"]])
+
+    assert rates.call("https://www.google.com/search", function) == ["result"]
+    assert function.call_count == 2
+    assert 5.0 in clock.sleeps
+
+def test_call_raises_other_errors(clock):
+    rates = limiter(clock)
+    function = MagicMock(side_effect=requests.exceptions.HTTPError("404", response=response(404)))
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        rates.call("https://www.google.com/search", function)
+    assert function.call_count == 1
+
+def test_http_client_waits_out_429(clock, monkeypatch):
+    http_cache.configure(mode="off")
+    monkeypatch.setattr(rate_limiter, "_limiter", limiter(clock))
+    try:
+        with patch("requests.Session.get", side_effect=[response(429, {"Retry-After": "3"}), response(200)]) as mock_get:
+            assert http_client.get(URL).status_code == 200
+        assert mock_get.call_count == 2
+        assert 3.0 in clock.sleeps
+    finally:
+        http_cache.configure(mode="default")
+
+def test_http_client_gives_up_on_persistent_throttling(clock, monkeypatch):
+    http_cache.configure(mode="off")
+    monkeypatch.setattr(rate_limiter, "_limiter", limiter(clock))
+    try:
+        with patch("requests.Session.get", return_value=response(503)) as mock_get:
+            assert http_client.get(URL).status_code == 503
+        assert mock_get.call_count == rate_limiter.DEFAULT_ATTEMPTS
+    finally:
+        http_cache.configure(mode="default")
@@ -0,0 +1,92 @@
+# tests/test_report.py
+
+import glob
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from src.appstore_data_agent.report import build_report, render_report, validate_report, write_report
+from src.appstore_data_agent.tools.game_record import record_from_summary
+
+DEVELOPER_URL = "https://apps.apple.com/us/developer/voodoo/id714804730"
+
+RESEARCH = {
+    "developer_name": "VOODOO",
+    "developer_url": DEVELOPER_URL,
+    "games": [record_from_summary(game, DEVELOPER_URL) for game in [
+        {
+            "url": "https://apps.apple.com/us/app/helix-jump/id1345968745",
+            "title": "Helix Jump",
+            "developer": "VOODOO",
+            "rating": "4.5",
+            "rating_count": "1.2M Ratings",
+            "info_list": {
+                "Price": "Free",
+                "In-App Purchases": "Remove Ads$3.99",
+                "Age Rating": "12+Infrequent/Mild Cartoon or Fantasy ViolenceInfrequent/Mild Simulated Gambling",
+            },
+            "game_center": "Game CenterChallenge friends and check leaderboards and achievements.",
+        },
+        {
+            "url": "https://apps.apple.com/us/app/paid-game/id1",
+            "title": "Paid Game",
+            "developer": "VOODOO",
+            "rating": "N/A",
+            "rating_count": "N/A",
+            "info_list": {"Price": "$2.99", "Age Rating": "4+"},
+            "game_center": "None",
+        },
+    ]],
+}
+
+
+def test_build_report_maps_scraped_fields():
+    report = build_report(RESEARCH).model_dump(exclude_none=True)
+
+    assert report["developer_name"] == "VOODOO"
+    assert "note" not in report
+    helix, paid = report["games"]
+    assert helix == {
+        "game_name": "Helix Jump",
+        "app_store_url": "https://apps.apple.com/us/app/helix-jump/id1345968745",
+        "rating_score": "4.5",
+        "number_of_ratings": "1200000",
+        "pricing": {"is_free_to_play": True, "price_usd": "Free (Offers In-App Purchases)"},
+        "gamekit_integration": {"leaderboards": "Yes", "achievements": "Yes"},
+        "content_description": {
+            "apple_age_rating": "12+",
+            "violence": "Infrequent/Mild Cartoon or Fantasy Violence",
+            "nudity_sexual_content": "None",
+            "other_content_warnings": "Infrequent/Mild Simulated Gambling",
+        },
+    }
+    assert paid["pricing"] == {"is_free_to_play": False, "price_usd": "$2.99"}
+    assert paid["gamekit_integration"] == {"leaderboards": "No", "achievements": "No"}
+    assert paid["content_description"]["apple_age_rating"] == "4+"
+
+def test_report_is_reproducible(tmp_path):
+    first = write_report(build_report(RESEARCH), str(tmp_path / "first.json"))
+    second = write_report(build_report(RESEARCH), str(tmp_path / "second.json"))
+
+    with open(first, "rb") as a, open(second, "rb") as b:
+        assert a.read() == b.read()
+
+def test_rendered_report_validates_with_note():
+    report = build_report(RESEARCH, note="Mostly free-to-play arcade games.")
+    data = json.loads(render_report(report))
+
+    assert data["note"] == "Mostly free-to-play arcade games."
+    assert validate_report(data) == report
+
+def test_existing_reports_follow_the_template():
+    for path in glob.glob("reports/*.json"):
+        with open(path, encoding="utf-8") as f:
+            validate_report(json.load(f))
+
+def test_validate_report_rejects_unknown_fields():
+    data = json.loads(render_report(build_report(RESEARCH)))
+    data["games"][0]["pricing"]["estimate"] = "Likely"
+
+    with pytest.raises(ValidationError):
+        validate_report(data)
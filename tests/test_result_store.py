@@ -0,0 +1,165 @@
+# tests/test_result_store.py
+
+import json
+import sqlite3
+
+import pytest
+
+from src.appstore_data_agent.tools.game_record import record_from_details, record_from_summary
+from src.appstore_data_agent.tools.result_store import (
+    ResultBatch,
+    ResultStore,
+    snapshot_from_record,
+)
+
+DEVELOPER_URL = "https://apps.apple.com/us/developer/voodoo/id714804730"
+OTHER_DEVELOPER_URL = "https://apps.apple.com/us/developer/supercell/id488106216"
+
+def summary(i, rating="4.5", game_center="Game Center"):
+    # A game page's fields as the direct pipeline stored them before records
+    return {
+        "url": f"https://apps.apple.com/us/app/game-{i}/id{i}",
+        "title": f"Game {i}",
+        "developer": "VOODOO",
+        "rating": rating,
+        "rating_count": "1.2K Ratings",
+        "info_list": {"Price": "Free", "Size": "120 MB", "Category": "Games"},
+        "game_center": game_center,
+    }
+
+def game(i, **fields):
+    return record_from_summary(summary(i, **fields), DEVELOPER_URL)
+
+def research(*games, developer_url=DEVELOPER_URL):
+    return {"developer_name": "VOODOO", "developer_url": developer_url, "games": list(games)}
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultStore(str(tmp_path / "results.sqlite3"))
+    yield store
+    store.close()
+
+def test_research_round_trip(store):
+    # Games come back in catalog order, not app ID order
+    stored = research(game(2), game(1, game_center="None"))
+
+    assert store.record_research(stored) == 2
+    assert store.research(DEVELOPER_URL) == stored
+    assert store.research(OTHER_DEVELOPER_URL) is None
+
+def test_snapshot_only_when_data_changes(store):
+    store.record_research(research(game(1)))
+    assert store.record_research(research(game(1))) == 0
+    assert store.record_research(research(game(1, rating="4.7"))) == 1
+
+    history = store.query("SELECT rating FROM snapshots WHERE app_id = ? ORDER BY scraped_at, id", [1])
+    assert [row["rating"] for row in history] == [4.5, 4.7]
+    assert [row["rating"] for row in store.latest_snapshots(DEVELOPER_URL)] == [4.7]
+
+def test_latest_snapshots_by_developer_and_feature(store):
+    store.record_research(research(game(1), game(2, game_center="None")))
+    store.record_research(research(game(3), developer_url=OTHER_DEVELOPER_URL + "?see-all=i-phonei-pad-apps"))
+
+    assert sorted(row["app_id"] for row in store.latest_snapshots()) == [1, 2, 3]
+    assert [row["app_id"] for row in store.latest_snapshots(OTHER_DEVELOPER_URL)] == [3]
+    assert sorted(row["app_id"] for row in store.latest_snapshots(features=["game_center"])) == [1, 3]
+    row = store.latest_snapshots(DEVELOPER_URL)[0]
+    assert (row["price_cents"], row["is_free"], row["size_bytes"], row["genre"]) == (0, 1, 120_000_000, "Games")
+
+def test_batch_of_scraper_rows(store):
+    details = {
+        "Game Name": "Game 1", "Developer Name": "VOODOO", "Price": "$0.99",
+        "Game Center Integ": "Yes", "Achievement": "No", "Leaderboard": "Yes",
+    }
+    with ResultBatch(store, batch_size=2) as batch:
+        record = record_from_details(details, "https://apps.apple.com/us/app/game-1/id1?platform=iphone", DEVELOPER_URL)
+        batch.add(snapshot_from_record(record))
+        assert store.latest_snapshots() == []
+
+    row, = store.latest_snapshots(DEVELOPER_URL)
+    assert (row["url"], row["kind"], row["is_free"]) == ("https://apps.apple.com/us/app/game-1/id1", "details", 0)
+    features = store.query("SELECT feature FROM game_center_features WHERE snapshot_id = ? ORDER BY feature", [row["id"]])
+    assert [feature["feature"] for feature in features] == ["game_center", "leaderboards"]
+    assert store.research(DEVELOPER_URL)["games"] == [record]
+
+def test_record_rows(store):
+    record = game(1, game_center="Game Center, Achievements")
+
+    assert store.record([snapshot_from_record(record)]) == 1
+    assert store.record([snapshot_from_record(record)]) == 0
+
+    row, = store.latest_snapshots(DEVELOPER_URL)
+    assert (row["rating"], row["rating_count"], row["price_cents"], row["size_bytes"]) == (4.5, 1200, 0, 120_000_000)
+    # Typed columns: analytics filter and aggregate without parsing text
+    cheap, = store.query("SELECT COUNT(*) AS games FROM snapshots WHERE price_cents < 100 AND size_bytes < 2e8")
+    assert cheap["games"] == 1
+    features = store.query("SELECT feature FROM game_center_features WHERE snapshot_id = ? ORDER BY feature", [row["id"]])
+    assert [feature["feature"] for feature in features] == ["achievements", "game_center"]
+
+def test_listing_position_follows_the_catalog_across_batches(store):
+    # Rows arrive in completion order and are flushed two at a time
+    with ResultBatch(store, batch_size=2) as batch:
+        for position in (3, 1, 0, 2):
+            batch.add(snapshot_from_record(game(position + 1), position))
+
+    assert [row["app_id"] for row in store.latest_snapshots(DEVELOPER_URL)] == [1, 2, 3, 4]
+
+def test_research_takes_the_latest_snapshot_of_each_app(store):
+    store.record_research(research(game(2), game(1)))
+    store.record([snapshot_from_record(game(1, rating="4.9"), 1)])
+
+    assert [row["kind"] for row in store.latest_snapshots(DEVELOPER_URL)] == ["research", "details"]
+    assert store.research(DEVELOPER_URL) == research(game(2), game(1, rating="4.9"))
+
+def test_page_hash_and_unlisted_apps(store):
+    store.record_research(research(game(1), game(2)), {game(1).url: "hash-1"})
+
+    assert store.latest_snapshot(game(1).url)["page_hash"] == "hash-1"
+    assert store.latest_snapshot(game(2).url)["page_hash"] is None
+    store.unlist(game(2).url)
+    assert store.latest_snapshot(game(2).url) is None
+    assert store.research(DEVELOPER_URL) == research(game(1))
+    # Listed again once it is recorded again; the page hash is kept when none is given
+    store.record_research(research(game(1), game(2)))
+    assert [row["app_id"] for row in store.latest_snapshots(DEVELOPER_URL)] == [1, 2]
+    assert store.latest_snapshot(game(1).url)["page_hash"] == "hash-1"
+
+def test_version_1_databases_are_migrated(tmp_path):
+    # Version 1 kept the page text of each snapshot, e.g. the direct pipeline's summary
+    path = str(tmp_path / "results.sqlite3")
+    db = sqlite3.connect(path)
+    db.executescript("""
+    CREATE TABLE developers (id INTEGER PRIMARY KEY, name TEXT, url TEXT NOT NULL, updated_at REAL NOT NULL);
+    CREATE TABLE apps (id INTEGER PRIMARY KEY, developer_id INTEGER, name TEXT, url TEXT NOT NULL,
+                       listing_position INTEGER NOT NULL, first_seen REAL NOT NULL, last_seen REAL NOT NULL);
+    CREATE TABLE snapshots (id INTEGER PRIMARY KEY AUTOINCREMENT, app_id INTEGER NOT NULL, scraped_at REAL NOT NULL,
+                            kind TEXT NOT NULL, name TEXT, rating TEXT, rating_count TEXT, price TEXT, is_free INTEGER,
+                            size TEXT, age_rating TEXT, genre TEXT, record TEXT NOT NULL, record_hash TEXT NOT NULL);
+    CREATE INDEX snapshots_app ON snapshots (app_id, scraped_at);
+    CREATE TABLE game_center_features (snapshot_id INTEGER NOT NULL, feature TEXT NOT NULL,
+                                       PRIMARY KEY (snapshot_id, feature));
+    """)
+    page_fields = {key: value for key, value in summary(1).items() if key != "url"}
+    with db:
+        db.execute("INSERT INTO developers VALUES (714804730, 'VOODOO', ?, 0)", (DEVELOPER_URL,))
+        db.execute("INSERT INTO apps VALUES (1, 714804730, 'Game 1', ?, 0, 0, 0)", (game(1).url,))
+        db.execute("INSERT INTO snapshots (id, app_id, scraped_at, kind, name, rating, price, size, record, record_hash) "
+                   "VALUES (7, 1, 0, 'summary', 'Game 1', '4.5', 'Free', '120 MB', ?, 'old')", (json.dumps(page_fields),))
+        db.execute("INSERT INTO game_center_features VALUES (7, 'game_center')")
+    db.close()
+
+    store = ResultStore(path)
+    try:
+        row, = store.latest_snapshots(DEVELOPER_URL)
+        assert (row["id"], row["rating"], row["price_cents"], row["size_bytes"]) == (7, 4.5, 0, 120_000_000)
+        assert store.research(DEVELOPER_URL)["games"] == [game(1)]
+        # Same data as the migrated snapshot: no new one
+        assert store.record_research(research(game(1))) == 0
+    finally:
+        store.close()
+
+def test_rows_skip_non_app_urls(store):
+    row = snapshot_from_record(record_from_summary(dict(summary(1), url="https://apps.apple.com/us/story/id1")))
+
+    assert store.record([row]) == 0
+    assert store.latest_snapshots() == []
@@ -0,0 +1,81 @@
+# tests/test_startup.py
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds allowed for importing the CLI and parsing its arguments; crewAI alone takes several
+IMPORT_TIME_BUDGET = 1.0
+HEAVY_MODULES = ["crewai", "langchain_google_genai", "ollama", "pandas", "pyarrow", "googlesearch", "bs4"]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+{imports}
+print(json.dumps({{"seconds": time.perf_counter() - started, "modules": sorted(sys.modules)}}))
+"""
+
+
+def probe(imports):
+    """Runs imports in a fresh interpreter, as the console script would. Returns (seconds, loaded modules)."""
+    env = dict(os.environ, PYTHONPATH=os.path.join(ROOT, "src"))
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(imports=imports)],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    result = json.loads(output.splitlines()[-1])
+    return result["seconds"], set(result["modules"])
+
+def test_cli_starts_within_the_import_budget():
+    seconds, modules = probe("from appstore_data_agent import main\nmain.parse_args(['Voodoo', '--no-llm'])")
+
+    assert not modules & set(HEAVY_MODULES)
+    assert seconds < IMPORT_TIME_BUDGET
+
+def test_crew_run_does_not_load_the_scraping_pipeline():
+    # The crew itself is replaced: only what run() imports around it is measured
+    _, modules = probe("""
+import types
+crew = types.ModuleType("appstore_data_agent.crew")
+class AppstoreDataAgentCrew:
+    def crew(self):
+        return self
+    def kickoff(self, inputs):
+        return "report"
+crew.AppstoreDataAgentCrew = AppstoreDataAgentCrew
+sys.modules["appstore_data_agent.crew"] = crew
+sys.argv = ["appstore_data_agent", "Voodoo", "--results-db", ":memory:"]
+from appstore_data_agent import main
+main.run()
+""")
+
+    assert "appstore_data_agent.pipeline" not in modules
+    assert not modules & set(HEAVY_MODULES)
+
+@pytest.mark.parametrize("module", ["pipeline", "batch", "incremental", "report"])
+def test_direct_pipeline_does_not_load_the_agent_framework(module):
+    _, modules = probe(f"import appstore_data_agent.{module}")
+
+    assert "crewai" not in modules
+    assert "langchain_google_genai" not in modules
+
+def test_help_exits_without_loading_heavy_modules():
+    env = dict(os.environ, PYTHONPATH=os.path.join(ROOT, "src"))
+    command = "import sys, runpy\ntry:\n    runpy.run_module('appstore_data_agent.main', run_name='__main__')\nexcept SystemExit:\n    pass\n" \
+              "print(sorted(set(sys.modules) & set(%r)))" % HEAVY_MODULES
+    result = subprocess.run([sys.executable, "-c", command, "--help"], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+
+    assert "usage: appstore_data_agent" in result.stdout
+    assert result.stdout.splitlines()[-1] == "[]"
+
+def test_tool_classes_are_still_importable_from_the_finder_module():
+    from src.appstore_data_agent.tools import developer_url_finder, developer_url_finder_tool
+
+    assert developer_url_finder.DeveloperURLFinderTool is developer_url_finder_tool.DeveloperURLFinderTool
+    with pytest.raises(AttributeError):
+        developer_url_finder.NoSuchTool